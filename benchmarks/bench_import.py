@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""Measure the import time of :mod:`namedzip` and check it against a baseline.
+
+Runs ``python -X importtime -c "import namedzip"`` in fresh interpreters
+and reports the median cumulative import time of the package, from the
+source tree this script belongs to and, if given, from a baseline source
+tree such as a checkout of the previous release. Modules which are only
+needed by optional features (asyncio, concurrent.futures, csv, NumPy,
+threading) must not be imported.
+
+Usage::
+
+    $ git worktree add ../namedzip-base v1.0.6
+    $ python benchmarks/bench_import.py --runs 20 --baseline ../namedzip-base
+
+Exits with status 1 if the median exceeds `max-ratio` times the median
+of the baseline or an optional module was imported.
+
+copyright: © 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+LAZY_MODULES = ("asyncio", "concurrent.futures", "csv", "numpy", "queue", "threading")
+
+SOURCE_TREE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_times(path=SOURCE_TREE, module="namedzip"):
+    """Import `module` from `path` in a fresh interpreter.
+
+    Returns
+    -------
+    dict
+        Cumulative import time in microseconds, keyed by module name,
+        parsed from the output of ``-X importtime``.
+
+    """
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import " + module],
+        cwd=path,  # First on sys.path, ahead of any installed copy.
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def median_time(runs, path=SOURCE_TREE):
+    """Import ``namedzip`` from `path` `runs` times.
+
+    Returns
+    -------
+    tuple
+        Median import time in milliseconds, and the import times of the
+        first run as returned by `import_times`.
+
+    """
+
+    import_times(path)  # Warm up, writing bytecode caches if allowed.
+    times = [import_times(path) for _ in range(runs)]
+    return statistics.median(run["namedzip"] for run in times) / 1000, times[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument(
+        "--baseline", help="source tree of the version to compare against"
+    )
+    parser.add_argument(
+        "--max-ratio",
+        type=float,
+        default=2.5,
+        help="maximum median relative to the baseline median",
+    )
+    args = parser.parse_args()
+
+    median, times = median_time(args.runs)
+    print("import namedzip: {:.2f} ms median of {} runs".format(median, args.runs))
+    failed = False
+    if args.baseline is not None:
+        base, _ = median_time(args.runs, args.baseline)
+        print("baseline: {:.2f} ms, ratio {:.2f}".format(base, median / base))
+        if median > args.max_ratio * base:
+            print("Over budget of {:.2f} times the baseline.".format(args.max_ratio))
+            failed = True
+    imported = [name for name in LAZY_MODULES if name in times]
+    if imported:
+        print("Optional modules imported: {}.".format(", ".join(imported)))
+        failed = True
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
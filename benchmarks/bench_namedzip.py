@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+"""pyperf benchmarks for :func:`namedzip` and :func:`namedzip_longest`.
+
+Compares the named zip functions, in both direct and factory form and
+with reused rows or instrumentation, against plain :func:`zip` and
+:func:`itertools.zip_longest` baselines across row counts, field counts
+and input types.
+
+Usage::
+
+    $ python benchmarks/bench_namedzip.py -o base.json
+    $ python benchmarks/bench_namedzip.py --rows 10000 --fields 8 -o new.json
+    $ python benchmarks/compare.py base.json new.json
+
+All standard pyperf options (``--fast``, ``--rigorous``, ``-o``,
+``--append`` etc.) are supported.
+
+copyright: © 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+from collections import deque
+from itertools import zip_longest
+
+import pyperf
+
+from namedzip import ZipStats, namedzip, namedzip_longest
+
+ROWS = (1000, 100000)
+FIELDS = (2, 8, 24)
+INPUTS = ("list", "range", "generator")
+
+
+def make_inputs(kind, rows, fields, ragged=False):
+    """Return a function creating fresh input iterables.
+
+    Parameters
+    ----------
+    kind : string
+        One of "list", "range" or "generator".
+    rows : int
+        Number of values in the longest iterable.
+    fields : int
+        Number of iterables.
+    ragged : bool, optional
+        Make every other iterable 10% shorter, so `namedzip_longest`
+        has to fill values (default is False).
+
+    Returns
+    -------
+    function object
+        Called once per benchmark loop, since generators are one-shot.
+
+    """
+
+    lengths = [rows - rows // 10 if ragged and i % 2 else rows for i in range(fields)]
+    if kind == "list":
+        columns = [list(range(n)) for n in lengths]
+        return lambda: columns
+    if kind == "range":
+        columns = [range(n) for n in lengths]
+        return lambda: columns
+    if kind == "generator":
+        return lambda: [(x for x in range(n)) for n in lengths]
+    raise ValueError("Unknown input type: {!r}".format(kind))
+
+
+def time_consume(loops, create, inputs):
+    """Time `loops` runs of exhausting the iterator built by `create`."""
+
+    consume = deque
+    total = 0.0
+    for _ in range(loops):
+        columns = inputs()
+        t0 = pyperf.perf_counter()
+        consume(create(*columns), 0)
+        total += pyperf.perf_counter() - t0
+    return total
+
+
+def benchmarks(fields):
+    """Return ``(name, create, ragged)`` triples for `fields` columns."""
+
+    names = ["f{}".format(i) for i in range(fields)]
+    defaults = tuple(range(fields))
+    stats = ZipStats()
+
+    zip_factory = namedzip(typename="Row", field_names=names)
+    longest_factory = namedzip_longest(typename="Row", field_names=names)
+    defaults_factory = namedzip_longest(
+        typename="Row", field_names=names, defaults=defaults
+    )
+
+    return [
+        ("zip", zip, False),
+        ("namedzip", lambda *c: namedzip(*c, typename="Row", field_names=names), False),
+        ("namedzip_factory", zip_factory, False),
+        (
+            "namedzip_reuse",
+            lambda *c: namedzip(*c, typename="Row", field_names=names, reuse=True),
+            False,
+        ),
+        (
+            "namedzip_stats",
+            lambda *c: namedzip(*c, typename="Row", field_names=names, stats=stats),
+            False,
+        ),
+        ("zip_longest", zip_longest, True),
+        (
+            "namedzip_longest",
+            lambda *c: namedzip_longest(*c, typename="Row", field_names=names),
+            True,
+        ),
+        ("namedzip_longest_factory", longest_factory, True),
+        (
+            "zip_longest_fillvalue",
+            lambda *c: zip_longest(*c, fillvalue=-1),
+            True,
+        ),
+        (
+            "namedzip_longest_fillvalue",
+            lambda *c: namedzip_longest(
+                *c, typename="Row", field_names=names, fillvalue=-1
+            ),
+            True,
+        ),
+        (
+            "namedzip_longest_defaults",
+            lambda *c: namedzip_longest(
+                *c, typename="Row", field_names=names, defaults=defaults
+            ),
+            True,
+        ),
+        ("namedzip_longest_defaults_factory", defaults_factory, True),
+    ]
+
+
+def add_cmdline_args(cmd, args):
+    """Forward custom options to pyperf worker processes."""
+
+    for option in ("rows", "fields", "inputs", "select"):
+        values = getattr(args, option)
+        if values:
+            cmd.extend(["--" + option] + [str(v) for v in values])
+
+
+def main():
+    runner = pyperf.Runner(add_cmdline_args=add_cmdline_args)
+    runner.metadata["description"] = __doc__.splitlines()[0]
+    parser = runner.argparser
+    parser.add_argument("--rows", type=int, nargs="+", default=ROWS)
+    parser.add_argument("--fields", type=int, nargs="+", default=FIELDS)
+    parser.add_argument("--inputs", nargs="+", choices=INPUTS, default=INPUTS)
+    parser.add_argument(
+        "--select", nargs="+", default=None, help="only run these benchmark names"
+    )
+    args = runner.parse_args()
+
+    for fields in args.fields:
+        for name, create, ragged in benchmarks(fields):
+            if args.select and name not in args.select:
+                continue
+            for rows in args.rows:
+                for kind in args.inputs:
+                    inputs = make_inputs(kind, rows, fields, ragged)
+                    runner.bench_time_func(
+                        "{}[rows={},fields={},input={}]".format(
+                            name, rows, fields, kind
+                        ),
+                        time_consume,
+                        create,
+                        inputs,
+                        inner_loops=rows,
+                    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""pyperf benchmarks for :func:`read_csv` against :class:`csv.DictReader`.
+
+Both readers stream a generated CSV file and convert two of its columns
+to numbers.
+
+Usage::
+
+    $ python benchmarks/bench_read_csv.py --rows 100000 -o csv.json
+
+copyright: © 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+import csv
+import os
+import tempfile
+from collections import deque
+
+import pyperf
+
+from namedzip import read_csv
+
+FIELDS = ("id", "name", "price", "quantity", "category", "updated")
+
+
+def write_csv(path, rows):
+    """Write a CSV file with a header and `rows` data rows."""
+
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(FIELDS)
+        for i in range(rows):
+            writer.writerow([i, "item", i * 0.25, i % 7, "fruit", "2019-01-01"])
+
+
+def dict_reader(path):
+    """Read `path` with `csv.DictReader`, converting values per row."""
+
+    with open(path, newline="") as f:
+        for row in csv.DictReader(f):
+            row["id"] = int(row["id"])
+            row["price"] = float(row["price"])
+            yield row
+
+
+def namedzip_reader(path):
+    """Read `path` with `read_csv`, converting values per column."""
+
+    return read_csv(path, typename="Item", converters={"id": int, "price": float})
+
+
+def time_read(loops, reader, path):
+    """Time `loops` runs of exhausting `reader(path)`."""
+
+    total = 0.0
+    for _ in range(loops):
+        t0 = pyperf.perf_counter()
+        deque(reader(path), 0)
+        total += pyperf.perf_counter() - t0
+    return total
+
+
+def add_cmdline_args(cmd, args):
+    """Forward custom options to pyperf worker processes."""
+
+    cmd.extend(["--rows", str(args.rows)])
+
+
+def main():
+    runner = pyperf.Runner(add_cmdline_args=add_cmdline_args)
+    runner.metadata["description"] = __doc__.splitlines()[0]
+    runner.argparser.add_argument("--rows", type=int, default=100000)
+    args = runner.parse_args()
+
+    fd, path = tempfile.mkstemp(suffix=".csv")
+    os.close(fd)
+    try:
+        write_csv(path, args.rows)
+        for name, reader in (
+            ("csv_dictreader", dict_reader),
+            ("namedzip_read_csv", namedzip_reader),
+        ):
+            runner.bench_time_func(
+                "{}[rows={}]".format(name, args.rows),
+                time_read,
+                reader,
+                path,
+                inner_loops=args.rows,
+            )
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
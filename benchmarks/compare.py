@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""Compare two pyperf JSON result files and flag regressions.
+
+Usage::
+
+    $ python benchmarks/compare.py base.json new.json --threshold 0.05
+
+Prints the relative change of every benchmark present in both files and
+exits with status 1 if any benchmark got slower by more than
+`threshold` (default 5%). For a full statistical report use
+``python -m pyperf compare_to base.json new.json``.
+
+copyright: © 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+import argparse
+import sys
+
+import pyperf
+
+
+def compare(base_path, new_path, threshold):
+    """Compare benchmark means of two pyperf result files.
+
+    Parameters
+    ----------
+    base_path : string
+        Path to the baseline JSON results.
+    new_path : string
+        Path to the JSON results to check.
+    threshold : float
+        Maximum allowed relative slowdown, e.g. 0.05 for 5%.
+
+    Returns
+    -------
+    list
+        Names of benchmarks slower than allowed by `threshold`.
+
+    """
+
+    base = {b.get_name(): b for b in pyperf.BenchmarkSuite.load(base_path)}
+    new = {b.get_name(): b for b in pyperf.BenchmarkSuite.load(new_path)}
+    regressions = []
+    for name in sorted(base.keys() & new.keys()):
+        before = base[name].mean()
+        after = new[name].mean()
+        change = after / before - 1.0
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(
+            "{:<70} {:>10} -> {:>10} {:+7.1%}{}".format(
+                name,
+                base[name].format_value(before),
+                new[name].format_value(after),
+                change,
+                flag,
+            )
+        )
+    for name in sorted(base.keys() ^ new.keys()):
+        print("{:<70} only in one file, skipped".format(name))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("base")
+    parser.add_argument("new")
+    parser.add_argument("--threshold", type=float, default=0.05)
+    args = parser.parse_args()
+
+    regressions = compare(args.base, args.new, args.threshold)
+    if regressions:
+        print("{} benchmark(s) regressed.".format(len(regressions)))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
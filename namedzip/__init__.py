@@ -1,4 +1,87 @@
-from .namedzip import namedzip, namedzip_longest
+import sys
+from importlib import import_module
 
-__all__ = ["namedzip", "namedzip_longest"]
+from .namedzip import (
+    NamedZipper,
+    namedtuple_cache_clear,
+    namedtuple_cache_info,
+    namedzip,
+    namedzip_batches,
+    namedzip_longest,
+)
+
+__all__ = [
+    "NamedZipIndex",
+    "NamedZipStream",
+    "NamedZipView",
+    "NamedZipper",
+    "ZipStats",
+    "anamedzip",
+    "anamedzip_longest",
+    "from_files",
+    "get_default_stats",
+    "namedtuple_cache_clear",
+    "namedtuple_cache_info",
+    "namedunzip",
+    "namedzip",
+    "namedzip_batches",
+    "namedzip_index",
+    "namedzip_join",
+    "namedzip_longest",
+    "namedzip_parallel",
+    "read_csv",
+    "set_default_stats",
+    "write_csv",
+    "write_jsonl",
+    "write_struct",
+]
 __version__ = "1.0.6"
+
+# Modules pulling in heavy standard library packages (asyncio,
+# concurrent.futures, csv, threading etc.) or only needed by opt-in
+# options are only imported on first access.
+_LAZY_MODULES = {
+    "NamedZipIndex": "._index",
+    "NamedZipStream": "._stream",
+    "NamedZipView": "._view",
+    "ZipStats": "._stats",
+    "anamedzip": "._async",
+    "anamedzip_longest": "._async",
+    "from_files": "._io",
+    "get_default_stats": "._stats",
+    "namedunzip": "._unzip",
+    "namedzip_index": "._index",
+    "namedzip_join": "._join",
+    "namedzip_parallel": "._parallel",
+    "read_csv": "._io",
+    "set_default_stats": "._stats",
+    "write_csv": "._io",
+    "write_jsonl": "._io",
+    "write_struct": "._io",
+}
+
+
+def __getattr__(name):
+    try:
+        module = _LAZY_MODULES[name]
+    except KeyError:
+        raise AttributeError(
+            "module {!r} has no attribute {!r}".format(__name__, name)
+        ) from None
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()).union(__all__))
+
+
+if sys.version_info < (3, 6):  # Async generators require Python 3.6.
+    for _name in ("anamedzip", "anamedzip_longest"):
+        del _LAZY_MODULES[_name]
+        __all__.remove(_name)
+
+if sys.version_info < (3, 7):  # Module __getattr__ requires Python 3.7.
+    for _name in _LAZY_MODULES:
+        globals()[_name] = __getattr__(_name)
@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+"""This module implements :func:`anamedzip` and :func:`anamedzip_longest`,
+async counterparts of :func:`namedzip` and :func:`namedzip_longest` which
+aggregate asynchronous iterables.
+
+copyright: © 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+import asyncio
+
+from .namedzip import (
+    _check_defaults,
+    _compare_iterables_to_fields,
+    _namedtuple_cache,
+    sentinel,
+)
+
+
+def anamedzip(*iterables, typename, field_names, **kwargs):
+    """Aggregates async iterables into named tuples, like `zip`.
+
+    All sources are advanced concurrently with :func:`asyncio.gather`
+    on every step, so a row takes as long as its slowest value rather
+    than the sum of all of them.
+
+    Returns an async generator if `*iterables` are supplied, otherwise
+    returns a function for creating async generators.
+
+    Parameters
+    ----------
+    *iterables : async iterable or iterable, optional
+        Iterable objects passed as positional arguments. Synchronous
+        iterables are accepted as well.
+    typename : string
+        Type name for generated named tuple objects. Passed on to
+        `collections.namedtuple` factory function.
+    field_names : iterable
+        Field names for generated named tuple objects. Passed on to
+        `collections.namedtuple` factory function.
+    buffer : int, optional
+        Read ahead up to `buffer` values from every source in a
+        background task, so one slow source doesn't stall the others.
+        (default is 0, no read-ahead).
+    **kwargs
+        Any additional keyword arguments will be passed on to the
+        `collections.namedtuple` factory function.
+
+    Returns
+    -------
+    async generator object
+        If `*iterables` are supplied.
+    function object
+        If `*iterables` are not supplied.
+
+    """
+
+    buffer = kwargs.pop("buffer", 0)
+    named_tuple = _namedtuple_cache.get(typename, field_names, **kwargs)
+
+    def _anamedzip_factory(*iterables):
+        _compare_iterables_to_fields(len(iterables), len(named_tuple._fields))
+        return _anamedzip_generator(iterables, named_tuple, buffer)
+
+    if iterables:
+        return _anamedzip_factory(*iterables)
+    else:
+        return _anamedzip_factory
+
+
+def anamedzip_longest(*iterables, typename, field_names, **kwargs):
+    """Aggregates async iterables into named tuples, like `zip_longest`.
+
+    All sources are advanced concurrently with :func:`asyncio.gather`
+    on every step. Exhausted sources are no longer awaited.
+
+    Returns an async generator if `*iterables` are supplied, otherwise
+    returns a function for creating async generators.
+
+    Parameters
+    ----------
+    *iterables : async iterable or iterable, optional
+        Iterable objects passed as positional arguments. Synchronous
+        iterables are accepted as well.
+    typename : string
+        Type name for generated named tuple objects. Passed on to
+        `collections.namedtuple` factory function.
+    field_names : iterable
+        Field names for generated named tuple objects. Passed on to
+        `collections.namedtuple` factory function.
+    fillvalue : type, optional
+        Use for setting all missing values to the same default value
+        (default is None).
+    defaults : iterable, optional
+        Individual default values for each iterable to zip. Overrides
+        custom `fillvalue` if specified, and length must match the
+        number of `*iterables` supplied.
+    buffer : int, optional
+        Read ahead up to `buffer` values from every source in a
+        background task, so one slow source doesn't stall the others.
+        (default is 0, no read-ahead).
+    **kwargs
+        Any additional keyword arguments will be passed on to the
+        `collections.namedtuple` factory function.
+
+    Returns
+    -------
+    async generator object
+        If `*iterables` are supplied.
+    function object
+        If `*iterables` are not supplied.
+
+    Raises
+    ------
+    ValueError
+        If `defaults` are specified but do not match the number of
+        `field_names`.
+
+    """
+
+    fillvalue = kwargs.pop("fillvalue", None)
+    defaults = kwargs.pop("defaults", None)
+    buffer = kwargs.pop("buffer", 0)
+    named_tuple = _namedtuple_cache.get(typename, field_names, **kwargs)
+    defaults = _check_defaults(defaults, len(named_tuple._fields))
+    fills = defaults or (fillvalue,) * len(named_tuple._fields)
+
+    def _anamedzip_longest_factory(*iterables):
+        _compare_iterables_to_fields(len(iterables), len(named_tuple._fields))
+        return _anamedzip_generator(iterables, named_tuple, buffer, fills)
+
+    if iterables:
+        return _anamedzip_longest_factory(*iterables)
+    else:
+        return _anamedzip_longest_factory
+
+
+async def _anamedzip_generator(iterables, named_tuple, buffer=0, fills=None):
+    """Generates named tuples from concurrently advanced async sources.
+
+    Parameters
+    ----------
+    iterables : tuple
+        Async or synchronous iterable objects, one per field.
+    named_tuple : type
+        Named tuple class produced by `namedtuple` factory function.
+    buffer : int, optional
+        Read-ahead queue size per source, 0 disables read-ahead.
+    fills : tuple or None, optional
+        Fill value for each source. Generates rows until the longest
+        source is exhausted if specified, otherwise stops at the
+        shortest (default is None).
+
+    Yields
+    ------
+    named tuple object
+
+    """
+
+    iterators = [_aiter(it) for it in iterables]
+    tasks = []
+    if buffer:
+        queues = [asyncio.Queue(maxsize=buffer) for _ in iterators]
+        tasks = [
+            asyncio.ensure_future(_read_ahead(it, queue))
+            for it, queue in zip(iterators, queues)
+        ]
+        iterators = [_drain(queue) for queue in queues]
+    active = list(range(len(iterators)))
+    values = [None] * len(iterators)
+    try:
+        while active:
+            results = await asyncio.gather(
+                *(iterators[i].__anext__() for i in active), return_exceptions=True
+            )
+            exhausted = []
+            for i, result in zip(active, results):
+                if isinstance(result, StopAsyncIteration):
+                    exhausted.append(i)
+                elif isinstance(result, BaseException):
+                    raise result
+                else:
+                    values[i] = result
+            if exhausted:
+                if fills is None:
+                    return
+                for i in exhausted:
+                    active.remove(i)
+                    values[i] = fills[i]
+                if not active:
+                    return
+            yield tuple.__new__(named_tuple, values)
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+def _aiter(iterable):
+    """Return an async iterator for an async or synchronous iterable."""
+
+    if hasattr(iterable, "__aiter__"):
+        return iterable.__aiter__()
+    return _from_iterable(iter(iterable))
+
+
+async def _from_iterable(iterator):
+    """Wrap a synchronous iterator as an async generator."""
+
+    for value in iterator:
+        yield value
+
+
+async def _read_ahead(iterator, queue):
+    """Copy values from `iterator` into `queue`, followed by `sentinel`.
+
+    Exceptions raised by `iterator` are passed on through the queue, so
+    they are raised in the consuming task.
+
+    """
+
+    try:
+        async for value in iterator:
+            await queue.put((value, None))
+    except Exception as exc:
+        await queue.put((sentinel, exc))
+    else:
+        await queue.put((sentinel, None))
+
+
+async def _drain(queue):
+    """Generate values from a queue filled by `_read_ahead`."""
+
+    while True:
+        value, exc = await queue.get()
+        if exc is not None:
+            raise exc
+        if value is sentinel:
+            return
+        yield value
@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+"""Per-column type conversion for :func:`namedzip` and
+:func:`namedzip_longest`.
+
+Values of typed fields are converted a batch at a time, before rows are
+built: with `map` for callables, and with vectorized NumPy casts for
+data types and for NumPy array inputs. Failed conversions are located
+only after a batch fails, so the row index costs nothing per value.
+
+copyright: © 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+import sys
+from functools import partial
+from itertools import chain, count, islice
+
+from . import _numpy_backend
+
+CONVERT_BATCH_SIZE = 1024
+
+# Callables which NumPy can apply to a whole array with `astype`.
+_NUMPY_CASTS = (bool, int, float, complex, str)
+
+
+def check_types(types, fields):
+    """Validate the `types` option against field names.
+
+    Parameters
+    ----------
+    types : dict or None
+        Callable or NumPy data type for each of any number of fields.
+    fields : tuple
+        Field names of the named tuple class.
+
+    Returns
+    -------
+    tuple or None
+        Callable, `numpy.dtype` or None for each field, or None if no
+        field is typed.
+
+    Raises
+    ------
+    ValueError
+        If `types` name unknown fields or contain invalid data types.
+    ImportError
+        If a data type is specified and NumPy is not installed.
+
+    """
+
+    if not types:
+        return None
+    unknown = sorted(set(types).difference(fields))
+    if unknown:
+        raise ValueError("Unknown field names in types: {}.".format(", ".join(unknown)))
+    specs = []
+    for name in fields:
+        spec = types.get(name)
+        if spec is not None and not callable(spec):
+            np = _numpy_backend._import_numpy()
+            try:
+                spec = np.dtype(spec)
+            except TypeError as error:
+                raise ValueError(
+                    "Invalid type {!r} for field {!r}.".format(spec, name)
+                ) from error
+        specs.append(spec)
+    return tuple(specs)
+
+
+def convert_fills(fills, specs, fields):
+    """Convert fill values of typed fields once, up front.
+
+    Fill values which are None mark missing values and are kept as is.
+
+    Returns
+    -------
+    tuple
+        Converted fill value for each field.
+
+    Raises
+    ------
+    ValueError
+        If a fill value can't be converted.
+
+    """
+
+    converted = []
+    for fill, spec, name in zip(fills, specs, fields):
+        if spec is not None and fill is not None:
+            try:
+                fill = _convert_value(spec, fill)
+            except Exception as error:
+                raise ValueError(
+                    "Can't convert fill value {!r} of field {!r}.".format(fill, name)
+                ) from error
+        converted.append(fill)
+    return tuple(converted)
+
+
+def convert_columns(iterables, specs, fields, batch_size=CONVERT_BATCH_SIZE):
+    """Wrap the iterables of typed fields to convert their values.
+
+    Parameters
+    ----------
+    iterables : tuple
+        Iterable objects, one per field.
+    specs : tuple
+        Callable, `numpy.dtype` or None for each field, as returned by
+        `check_types`.
+    fields : tuple
+        Field names, used in error messages.
+    batch_size : int, optional
+        Number of values read and converted at a time (default is 1024).
+
+    Returns
+    -------
+    list
+
+    """
+
+    return [
+        it if spec is None else _converted(it, spec, name, batch_size)
+        for it, spec, name in zip(iterables, specs, fields)
+    ]
+
+
+def _converted(iterable, spec, name, batch_size):
+    """Return an iterator of converted values of `iterable`."""
+
+    numpy = sys.modules.get("numpy")
+    if (
+        numpy is not None
+        and isinstance(iterable, numpy.ndarray)
+        and iterable.ndim == 1
+        and (spec in _NUMPY_CASTS or isinstance(spec, numpy.dtype))
+    ):
+        batches = (
+            iterable[slice(start, start + batch_size)]
+            for start in range(0, len(iterable), batch_size)
+        )
+        convert = partial(_cast_batch, spec, name)
+    else:
+        iterator = iter(iterable)
+        batches = iter(lambda: list(islice(iterator, batch_size)), [])
+        if callable(spec):
+            convert = partial(_map_batch, spec, name)
+        else:
+            convert = partial(_cast_batch, spec, name)
+    return chain.from_iterable(map(convert, count(0, batch_size), batches))
+
+
+def _map_batch(convert, name, start, batch):
+    """Convert a batch of values with a callable."""
+
+    try:
+        return list(map(convert, batch))
+    except Exception as error:
+        _raise_at_value(convert, name, start, batch, error)
+
+
+def _cast_batch(dtype, name, start, batch):
+    """Convert a batch of values with a vectorized NumPy cast."""
+
+    np = _numpy_backend._import_numpy()
+    try:
+        return _cast(np, np.asarray(batch), dtype).tolist()
+    except (TypeError, ValueError, OverflowError) as error:
+        _raise_at_value(dtype, name, start, batch, error)
+
+
+def _cast(np, array, spec):
+    """Cast `array` to `spec`, rejecting values which don't fit.
+
+    NumPy casts wrap around, truncate and turn NaN into arbitrary
+    integers silently, so results are checked instead: integer and
+    boolean results must equal the original values, or their truncation
+    for `int` as Python's `int` does, and floating point results may
+    only be infinite where the original values are.
+
+    Parameters
+    ----------
+    np : module
+        NumPy.
+    array : numpy.ndarray
+        Values to cast.
+    spec : numpy.dtype or type
+        Data type, or one of the callables in `_NUMPY_CASTS`.
+
+    Returns
+    -------
+    numpy.ndarray
+
+    Raises
+    ------
+    ValueError
+        If a value can't be represented exactly.
+
+    """
+
+    with np.errstate(invalid="ignore", over="ignore"):
+        result = array.astype(spec)
+        if spec is bool or spec is str:
+            return result  # Never fail when called on a value either.
+        source, target = array.dtype.kind, result.dtype.kind
+        if target in "biu" and source in "biufO":
+            expected = array
+            if spec is int and source == "f":
+                expected = np.trunc(array)
+            elif spec is int and source == "O":
+                return result  # Python's `int` truncates objects too.
+            if not np.all(result == expected):
+                raise ValueError(
+                    "Values out of range or not exact for {}.".format(result.dtype)
+                )
+        elif target in "fc" and source in "biufc":
+            if np.any(np.isinf(result) & np.isfinite(array)):
+                raise ValueError("Values out of range for {}.".format(result.dtype))
+    return result
+
+
+def _convert_value(spec, value):
+    """Convert a single value with a callable or NumPy data type."""
+
+    if callable(spec):
+        return spec(value)
+    np = _numpy_backend._import_numpy()
+    return _cast(np, np.asarray(value), spec).tolist()
+
+
+def _raise_at_value(spec, name, start, batch, error):
+    """Raise ValueError for the first value of `batch` failing to convert.
+
+    Raises
+    ------
+    ValueError
+        Naming the value, its field and its row index.
+
+    """
+
+    for index, value in zip(count(start), batch):
+        try:
+            _convert_value(spec, value)
+        except Exception:
+            raise ValueError(
+                "Can't convert value {!r} of field {!r} in row {}.".format(
+                    value, name, index
+                )
+            ) from error
+    raise error
@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+"""Lookup tables over zipped iterables.
+
+Implements :func:`namedzip_index`, which indexes zipped rows by one of
+their fields and returns a :class:`NamedZipIndex`.
+
+copyright: © 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+from bisect import bisect_left
+from collections.abc import Mapping
+from itertools import islice
+
+from .namedzip import (
+    VIEW_BATCH_SIZE,
+    _check_defaults,
+    _compare_iterables_to_fields,
+    _create_zip,
+    _namedtuple_cache,
+)
+
+
+def namedzip_index(*iterables, typename, field_names, key, **kwargs):
+    """Indexes zipped iterables by the values of the `key` field.
+
+    Values are stored column by column and the hash index maps every
+    key to row numbers, so named tuples are only built for the rows
+    that are looked up.
+
+    Returns a `NamedZipIndex` if `*iterables` are supplied, otherwise
+    returns a function for creating indexes.
+
+    Parameters
+    ----------
+    *iterables : iterable, optional
+        Iterable objects passed as positional arguments.
+    typename : string
+        Type name for generated named tuple objects. Passed on to
+        `collections.namedtuple` factory function.
+    field_names : iterable
+        Field names for generated named tuple objects. Passed on to
+        `collections.namedtuple` factory function.
+    key : string
+        Name of the field to index by. Its values must be hashable.
+    unique : bool, optional
+        Map every key to a single named tuple, otherwise to a list of
+        all named tuples sharing the key, in input order (default is
+        True).
+    longest : bool, optional
+        Continue until the longest iterable is exhausted, filling in
+        missing values like `namedzip_longest` (default is False).
+    fillvalue : type, optional
+        Missing value used if `longest` is True (default is None).
+    defaults : iterable, optional
+        Individual default values for each iterable if `longest` is
+        True. Overrides `fillvalue` if specified.
+    **kwargs
+        Any additional keyword arguments will be passed on to the
+        `collections.namedtuple` factory function.
+
+    Returns
+    -------
+    NamedZipIndex
+        If `*iterables` are supplied.
+    function object
+        If `*iterables` are not supplied.
+
+    Raises
+    ------
+    ValueError
+        If `key` is not one of the fields, if `defaults` do not match
+        the number of `field_names`, or if `unique` is True and a key
+        occurs more than once.
+
+    """
+
+    unique = kwargs.pop("unique", True)
+    longest = kwargs.pop("longest", False)
+    fillvalue = kwargs.pop("fillvalue", None)
+    defaults = kwargs.pop("defaults", None)
+    named_tuple = _namedtuple_cache.get(typename, field_names, **kwargs)
+    defaults = _check_defaults(defaults, len(named_tuple._fields))
+    if key not in named_tuple._fields:
+        raise ValueError(
+            "key {!r} is not one of the fields {}.".format(key, named_tuple._fields)
+        )
+    position = named_tuple._fields.index(key)
+
+    def _namedzip_index_factory(*iterables):
+        _compare_iterables_to_fields(len(iterables), len(named_tuple._fields))
+        zipped = _create_zip(
+            *iterables, fillvalue=fillvalue, type_longest=longest, defaults=defaults
+        )
+        return NamedZipIndex(
+            _transpose(zipped, len(iterables)), named_tuple, position, unique
+        )
+
+    if iterables:
+        return _namedzip_index_factory(*iterables)
+    else:
+        return _namedzip_index_factory
+
+
+class NamedZipIndex(Mapping):
+    """Read-only mapping of key values to lazily built named tuples.
+
+    Created by `namedzip_index`. Besides the `Mapping` interface, which
+    iterates keys in input order, `irange` generates the rows of a range
+    of keys in sorted order.
+
+    Parameters
+    ----------
+    columns : list
+        List of values for each field of `named_tuple`, of equal length.
+    named_tuple : type
+        Named tuple class produced by `namedtuple` factory function.
+    position : int
+        Index of the key field in `columns`.
+    unique : bool, optional
+        Whether keys map to a single row or a list of rows (default is
+        True).
+
+    Raises
+    ------
+    ValueError
+        If `unique` is True and a key occurs more than once.
+
+    """
+
+    __slots__ = ("_columns", "_named_tuple", "_unique", "_index", "_sorted_keys")
+
+    def __init__(self, columns, named_tuple, position, unique=True):
+        self._columns = columns
+        self._named_tuple = named_tuple
+        self._unique = unique
+        keys = columns[position]
+        if unique:
+            # Built in C, duplicates only show up as a shorter dict.
+            self._index = dict(zip(keys, range(len(keys))))
+            if len(self._index) != len(keys):
+                raise ValueError(
+                    "Duplicate values in key field {!r}, use unique=False.".format(
+                        named_tuple._fields[position]
+                    )
+                )
+        else:
+            self._index = {}
+            for row, value in enumerate(keys):
+                rows = self._index.get(value)
+                if rows is None:
+                    self._index[value] = [row]
+                else:
+                    rows.append(row)
+        # Sorted lazily by the first range query.
+        self._sorted_keys = None
+
+    def __getitem__(self, key):
+        rows = self._index[key]
+        if self._unique:
+            return self._build(rows)
+        return [self._build(row) for row in rows]
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+    def __repr__(self):
+        return "<{} of {} {} keys>".format(
+            type(self).__name__, len(self), self._named_tuple.__name__
+        )
+
+    @property
+    def row_count(self):
+        """Number of indexed rows."""
+
+        return len(self._columns[0]) if self._columns else 0
+
+    def irange(self, start=None, stop=None):
+        """Generates the rows with keys from `start` up to `stop`.
+
+        Keys are sorted on the first call, so they must be orderable.
+
+        Parameters
+        ----------
+        start : object, optional
+            Smallest key included, or no lower bound if None (default is
+            None).
+        stop : object, optional
+            Key at which to stop, excluded, or no upper bound if None
+            (default is None).
+
+        Yields
+        ------
+        named tuple object
+            Rows in key order; rows sharing a key in input order.
+
+        """
+
+        if self._sorted_keys is None:
+            self._sorted_keys = sorted(self._index)
+        keys = self._sorted_keys
+        first = 0 if start is None else bisect_left(keys, start)
+        last = len(keys) if stop is None else bisect_left(keys, stop)
+        for value in islice(keys, first, last):
+            rows = self._index[value]
+            if self._unique:
+                yield self._build(rows)
+            else:
+                yield from map(self._build, rows)
+
+    def _build(self, row):
+        """Build the named tuple for row number `row`."""
+
+        return tuple.__new__(
+            self._named_tuple, [column[row] for column in self._columns]
+        )
+
+
+def _transpose(zipped, column_count, batch_size=VIEW_BATCH_SIZE):
+    """Collect the values of `zipped` tuples into one list per column.
+
+    Rows are transposed a batch at a time, so only `batch_size` tuples
+    exist at once.
+
+    Returns
+    -------
+    list
+
+    """
+
+    columns = [[] for _ in range(column_count)]
+    for batch in iter(lambda: list(islice(zipped, batch_size)), []):
+        for column, values in zip(columns, zip(*batch)):
+            column.extend(values)
+    return columns
@@ -0,0 +1,666 @@
+# -*- coding: utf-8 -*-
+"""File based sources and sinks for :func:`namedzip` and
+:func:`namedzip_longest`.
+
+Implements :func:`from_files`, which lazily decodes memory-mapped
+fixed-width binary column files, :func:`read_csv`, which streams
+delimited text files as named tuples, and :func:`write_csv`,
+:func:`write_jsonl` and :func:`write_struct`, which write rows out in
+large batches.
+
+copyright: © 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+import csv
+import io
+import json
+import mmap
+import os
+import struct
+import sys
+from contextlib import ExitStack
+from functools import partial
+from itertools import chain, islice, repeat, starmap, zip_longest
+from json.encoder import encode_basestring_ascii
+from math import isfinite
+from operator import itemgetter
+
+from .namedzip import (
+    _check_defaults,
+    _namedtuple_cache,
+    namedzip,
+    namedzip_longest,
+    sentinel,
+)
+
+CSV_BUFFER_SIZE = 1 << 20
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Format parameters passed on to `csv.reader` and `csv.writer`.
+_CSV_FMTPARAMS = (
+    "dialect",
+    "delimiter",
+    "doublequote",
+    "escapechar",
+    "lineterminator",
+    "quotechar",
+    "quoting",
+    "skipinitialspace",
+    "strict",
+)
+
+# Encoders of columns holding values of a single type, giving the same
+# results as `json.dumps` with one C call per value.
+_JSON_ENCODERS = {
+    str: encode_basestring_ascii,
+    int: int.__repr__,
+    bool: {True: "true", False: "false"}.__getitem__,
+}
+
+_STRUCT_BYTE_ORDERS = "@=<>!"
+
+try:
+    _IOV_MAX = os.sysconf("SC_IOV_MAX")
+except (AttributeError, OSError, ValueError):
+    _IOV_MAX = -1
+if _IOV_MAX < 1:  # Not available or unlimited.
+    _IOV_MAX = 1024
+
+# Single character formats supported by `memoryview.cast`, which decodes
+# values in C without creating intermediate tuples.
+_CAST_FORMATS = frozenset("bBhHiIlLqQnNfd?c")
+
+
+def from_files(paths, typename, field_names, formats, **kwargs):
+    """Aggregates memory-mapped binary column files into named tuples.
+
+    Every file holds one column of fixed-width values. Files are memory
+    mapped and decoded lazily while iterating, so resident memory stays
+    flat regardless of file size, and each file is unmapped and closed
+    once it is exhausted or the returned iterator is garbage collected.
+
+    Parameters
+    ----------
+    paths : iterable
+        Path of the column file for each field.
+    typename : string
+        Type name for generated named tuple objects. Passed on to
+        `collections.namedtuple` factory function.
+    field_names : iterable
+        Field names for generated named tuple objects. Passed on to
+        `collections.namedtuple` factory function.
+    formats : string or iterable
+        `struct` format of one value for each file, or a single format
+        for all files. Formats describing more than one item, e.g.
+        ``"<3d"``, generate tuples.
+    longest : bool, optional
+        Use `namedzip_longest` for files of unequal length, otherwise
+        stop at the shortest file (default is False).
+    **kwargs
+        Any additional keyword arguments will be passed on to
+        `namedzip` or `namedzip_longest`.
+
+    Returns
+    -------
+    iterator object
+
+    Raises
+    ------
+    ValueError
+        If the number of `formats` does not match the number of `paths`,
+        or a file size is not a multiple of the size of its format.
+
+    """
+
+    longest = kwargs.pop("longest", False)
+    paths = tuple(paths)
+    if isinstance(formats, str):
+        formats = (formats,) * len(paths)
+    formats = tuple(formats)
+    if len(formats) != len(paths):
+        raise ValueError(
+            "Unequal number of paths ({}) and formats ({}).".format(
+                len(paths), len(formats)
+            )
+        )
+    columns = [_check_column_file(p, f) for p, f in zip(paths, formats)]
+    zip_function = namedzip_longest if longest else namedzip
+    return zip_function(
+        *(_file_column(p, f) for p, f in columns),
+        typename=typename,
+        field_names=field_names,
+        **kwargs
+    )
+
+
+def read_csv(path, typename, field_names=None, **kwargs):
+    """Streams rows of a delimited text file as named tuples.
+
+    The file is read through a large buffer and parsed in chunks of
+    rows, which are transposed into columns so that `converters` are
+    mapped over a whole column at a time, and then zipped back into
+    named tuples. Short rows are filled like `namedzip_longest`.
+
+    Parameters
+    ----------
+    path : path-like or file object
+        File to read. File objects must be opened in text mode with
+        ``newline=""`` and are not closed.
+    typename : string
+        Type name for generated named tuple objects. Passed on to
+        `collections.namedtuple` factory function.
+    field_names : iterable, optional
+        Field names for generated named tuple objects. If not specified,
+        the first row of the file is used (default is None).
+    converters : dict, optional
+        Function converting the string values of a field, keyed by field
+        name, e.g. ``{"price": float}``. Fill values are not converted.
+    fillvalue : type, optional
+        Use for setting all missing values of short rows to the same
+        default value (default is None).
+    defaults : iterable, optional
+        Individual default values for each field. Overrides `fillvalue`
+        if specified.
+    chunk_size : int, optional
+        Number of rows parsed and converted at a time (default is 4096).
+    encoding : string, optional
+        Encoding used to open `path` (default is "utf-8").
+    delimiter : string, optional
+        Field delimiter, e.g. ``"\t"`` for TSV files. This and any other
+        `csv` format parameters (`dialect`, `quotechar` etc.) are passed
+        on to `csv.reader` (default is ",").
+    **kwargs
+        Any additional keyword arguments, e.g. `rename` for header names
+        which are not valid identifiers, will be passed on to the
+        `collections.namedtuple` factory function.
+
+    Yields
+    ------
+    named tuple object
+
+    Raises
+    ------
+    ValueError
+        If a row has more values than there are fields, or `defaults` do
+        not match the number of fields.
+
+    Notes
+    -----
+    Blank lines are skipped, like `csv.DictReader` does.
+
+    """
+
+    converters = kwargs.pop("converters", None) or {}
+    fillvalue = kwargs.pop("fillvalue", None)
+    defaults = kwargs.pop("defaults", None)
+    chunk_size = kwargs.pop("chunk_size", 4096)
+    encoding = kwargs.pop("encoding", "utf-8")
+    fmtparams = _pop_fmtparams(kwargs)
+    with ExitStack() as stack:
+        if hasattr(path, "read"):
+            f = path
+        else:
+            f = stack.enter_context(
+                open(
+                    _fspath(path),
+                    newline="",
+                    encoding=encoding,
+                    buffering=CSV_BUFFER_SIZE,
+                )
+            )
+        reader = filter(None, csv.reader(f, **fmtparams))
+        if field_names is None:
+            field_names = next(reader, [])
+        named_tuple = _namedtuple_cache.get(typename, field_names, **kwargs)
+        fields = named_tuple._fields
+        field_count = len(fields)
+        defaults = _check_defaults(defaults, field_count)
+        fills = defaults or (fillvalue,) * field_count
+        unknown = set(converters).difference(fields)
+        if unknown:
+            raise ValueError(
+                "Converters for unknown fields: {}.".format(", ".join(sorted(unknown)))
+            )
+        plan = [(converters.get(name), fill) for name, fill in zip(fields, fills)]
+        make = partial(tuple.__new__, named_tuple)
+        for rows in iter(lambda: list(islice(reader, chunk_size)), []):
+            columns = list(zip_longest(*rows, fillvalue=sentinel))
+            if len(columns) > field_count:
+                raise ValueError(
+                    "Row with {} values for {} fields.".format(
+                        len(columns), field_count
+                    )
+                )
+            # Fields missing from every row in the chunk.
+            columns.extend([(sentinel,) * len(rows)] * (field_count - len(columns)))
+            columns = [
+                _convert_column(column, convert, fill)
+                for column, (convert, fill) in zip(columns, plan)
+            ]
+            yield from map(make, zip(*columns))
+
+
+def write_csv(rows, path, **kwargs):
+    """Writes rows to a delimited text file.
+
+    Rows are written a chunk at a time with `csv.writer.writerows` into
+    a reusable in-memory buffer, and the encoded chunks are written to
+    the file in large batches.
+
+    Parameters
+    ----------
+    rows : iterable
+        Named tuples, e.g. generated by `namedzip`, or other tuples if
+        `field_names` is specified or `header` is False.
+    path : path-like or file object
+        File to write. Existing files are overwritten. File objects are
+        written to with `writelines` and are not closed; text files
+        must be opened with ``newline=""``.
+    header : bool, optional
+        Write the field names as the first row (default is True).
+    field_names : iterable, optional
+        Field names for the header. Taken from `_fields` of the first
+        row if not specified (default is None).
+    chunk_size : int, optional
+        Number of rows encoded at a time (default is 4096).
+    buffer_size : int, optional
+        Number of bytes collected before writing them with a single
+        system call (default is 1 MiB).
+    encoding : string, optional
+        Encoding used for `path` and binary file objects (default is
+        "utf-8").
+    delimiter : string, optional
+        Field delimiter. This and any other `csv` format parameters
+        (`dialect`, `quotechar` etc.) are passed on to `csv.writer`
+        (default is ",").
+
+    Raises
+    ------
+    ValueError
+        If `header` is True and field names can't be taken from the
+        first row.
+
+    """
+
+    header = kwargs.pop("header", True)
+    field_names = kwargs.pop("field_names", None)
+    chunk_size = kwargs.pop("chunk_size", 4096)
+    buffer_size = kwargs.pop("buffer_size", WRITE_BUFFER_SIZE)
+    encoding = kwargs.pop("encoding", "utf-8")
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, **_pop_fmtparams(kwargs))
+    rows, fields = _peek_fields(rows, field_names, required=header)
+    header = header and bool(fields)
+    if header:
+        writer.writerow(fields)
+
+    def _encode(chunk):
+        writer.writerows(chunk)
+        text = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return text
+
+    chunks = map(_encode, _chunked(rows, chunk_size))
+    if header:
+        chunks = chain((_encode(()),), chunks)
+    _write_chunks(path, chunks, encoding, buffer_size)
+
+
+def write_jsonl(rows, path, **kwargs):
+    """Writes rows as JSON objects, one per line.
+
+    A template of the JSON object is compiled once from the field
+    names, and values are encoded column by column, a chunk of rows at
+    a time, without building a dict per row. Output is the same as
+    ``json.dumps(row._asdict())`` for every row.
+
+    Parameters
+    ----------
+    rows : iterable
+        Named tuples, e.g. generated by `namedzip`, or other tuples if
+        `field_names` is specified.
+    path : path-like or file object
+        File to write. Existing files are overwritten. File objects are
+        written to with `writelines` and are not closed.
+    field_names : iterable, optional
+        Keys of the JSON objects. Taken from `_fields` of the first row
+        if not specified (default is None).
+    default : callable, optional
+        Function returning a serializable version of other objects,
+        passed on to `json.JSONEncoder` (default is None).
+    chunk_size : int, optional
+        Number of rows encoded at a time (default is 4096).
+    buffer_size : int, optional
+        Number of bytes collected before writing them with a single
+        system call (default is 1 MiB).
+    encoding : string, optional
+        Encoding used for `path` and binary file objects (default is
+        "utf-8").
+
+    Raises
+    ------
+    ValueError
+        If field names can't be taken from the first row.
+    TypeError
+        If a value is not JSON serializable.
+
+    """
+
+    field_names = kwargs.pop("field_names", None)
+    default = kwargs.pop("default", None)
+    chunk_size = kwargs.pop("chunk_size", 4096)
+    buffer_size = kwargs.pop("buffer_size", WRITE_BUFFER_SIZE)
+    encoding = kwargs.pop("encoding", "utf-8")
+    rows, fields = _peek_fields(rows, field_names)
+    template = (
+        "{"
+        + ", ".join(
+            json.dumps(str(name)).replace("%", "%%") + ": %s" for name in fields
+        )
+        + "}\n"
+    )
+    dumps = json.JSONEncoder(default=default).encode
+    encode = partial(_encode_jsonl, template, dumps)
+    _write_chunks(path, map(encode, _chunked(rows, chunk_size)), encoding, buffer_size)
+
+
+def write_struct(rows, path, formats, **kwargs):
+    """Writes rows as packed binary records.
+
+    A `struct.Struct` is compiled once for the record format, and every
+    chunk of rows is packed into a single bytes object.
+
+    Parameters
+    ----------
+    rows : iterable
+        Named tuples, e.g. generated by `namedzip`, or other tuples.
+    path : path-like or file object
+        File to write. Existing files are overwritten. File objects must
+        be binary, are written to with `writelines` and are not closed.
+    formats : string or iterable
+        `struct` format of a whole record, e.g. ``"<iqd"``, or of each
+        field, e.g. ``["<i", "<q", "<d"]``.
+    chunk_size : int, optional
+        Number of rows packed at a time (default is 4096).
+    buffer_size : int, optional
+        Number of bytes collected before writing them with a single
+        system call (default is 1 MiB).
+
+    Raises
+    ------
+    ValueError
+        If the formats of fields have different byte orders.
+    struct.error
+        If a row doesn't match the record format.
+
+    """
+
+    chunk_size = kwargs.pop("chunk_size", 4096)
+    buffer_size = kwargs.pop("buffer_size", WRITE_BUFFER_SIZE)
+    pack = struct.Struct(_record_format(formats)).pack
+
+    def _encode(chunk):
+        return b"".join(starmap(pack, chunk))
+
+    _write_chunks(path, map(_encode, _chunked(rows, chunk_size)), None, buffer_size)
+
+
+def _pop_fmtparams(kwargs):
+    """Remove and return the `csv` format parameters of `kwargs`."""
+
+    return {name: kwargs.pop(name) for name in _CSV_FMTPARAMS if name in kwargs}
+
+
+def _peek_fields(rows, field_names=None, required=True):
+    """Return an iterator of `rows` and their field names.
+
+    Field names are taken from `_fields` of the first row unless
+    `field_names` are specified.
+
+    Raises
+    ------
+    ValueError
+        If `required` is True and field names can't be taken from the
+        first row.
+
+    """
+
+    rows = iter(rows)
+    if field_names is not None:
+        return rows, tuple(field_names)
+    first = next(rows, sentinel)
+    if first is sentinel:
+        return rows, ()
+    fields = getattr(first, "_fields", None)
+    if fields is None and required:
+        raise ValueError(
+            "Can't take field names from {}, specify field_names.".format(
+                type(first).__name__
+            )
+        )
+    return chain((first,), rows), fields
+
+
+def _chunked(rows, chunk_size):
+    """Return an iterator of lists of up to `chunk_size` rows."""
+
+    rows = iter(rows)
+    return iter(lambda: list(islice(rows, chunk_size)), [])
+
+
+def _encode_jsonl(template, dumps, chunk):
+    """Encode a chunk of rows as JSON lines."""
+
+    columns = [_encode_json_column(column, dumps) for column in zip(*chunk)]
+    return "".join(map(template.__mod__, zip(*columns)))
+
+
+def _encode_json_column(column, dumps):
+    """Return an iterator of the JSON encoded values of `column`."""
+
+    kinds = set(map(type, column))
+    if len(kinds) == 1:
+        (kind,) = kinds
+        if kind in _JSON_ENCODERS:
+            return map(_JSON_ENCODERS[kind], column)
+        if kind is float and all(map(isfinite, column)):
+            return map(float.__repr__, column)
+        if kind is type(None):
+            return repeat("null", len(column))
+    return map(dumps, column)
+
+
+def _record_format(formats):
+    """Return the `struct` format of a record of fields with `formats`.
+
+    Raises
+    ------
+    ValueError
+        If `formats` have different byte orders.
+
+    """
+
+    if isinstance(formats, str):
+        return formats
+    formats = tuple(formats)
+    orders = {f[:1] if f[:1] in _STRUCT_BYTE_ORDERS else "@" for f in formats}
+    if len(orders) > 1:
+        raise ValueError(
+            "Formats with different byte orders: {}.".format(", ".join(formats))
+        )
+    return "".join(orders) + "".join(f.lstrip(_STRUCT_BYTE_ORDERS) for f in formats)
+
+
+def _write_chunks(path, chunks, encoding, buffer_size):
+    """Write encoded chunks to `path` in batches of about `buffer_size`.
+
+    Parameters
+    ----------
+    path : path-like or file object
+        Destination. Paths are opened unbuffered and every batch is
+        written with `os.writev` where available, without joining it.
+    chunks : iterable
+        Strings, encoded with `encoding` unless written to a text file
+        object, or bytes.
+    encoding : string or None
+        Encoding of string chunks.
+    buffer_size : int
+        Minimum number of bytes or characters per batch, except for the
+        last one.
+
+    """
+
+    text = hasattr(path, "write") and isinstance(path, io.TextIOBase)
+    if not text and encoding is not None:
+        chunks = map(partial(str.encode, encoding=encoding), chunks)
+    batches = _batched(chunks, buffer_size)
+    if hasattr(path, "write"):
+        for batch in batches:
+            path.writelines(batch)
+        return
+    with open(_fspath(path), "wb", buffering=0) as f:
+        for batch in batches:
+            _write_batch(f, batch)
+
+
+def _batched(chunks, buffer_size):
+    """Generates lists of chunks with at least `buffer_size` items."""
+
+    batch = []
+    size = 0
+    for chunk in chunks:
+        batch.append(chunk)
+        size += len(chunk)
+        if size >= buffer_size or len(batch) >= _IOV_MAX:
+            yield batch
+            batch = []
+            size = 0
+    if batch:
+        yield batch
+
+
+def _write_batch(f, batch):
+    """Write all bytes of `batch` to the unbuffered file `f`."""
+
+    written = os.writev(f.fileno(), batch) if hasattr(os, "writev") else 0
+    if written == sum(map(len, batch)):
+        return
+    data = memoryview(b"".join(batch))[written:]
+    while data:
+        written = f.write(data)
+        data = data[written:]
+
+
+def _convert_column(column, convert, fill):
+    """Convert a column of strings and replace missing values.
+
+    Parameters
+    ----------
+    column : tuple
+        Values of one field, `sentinel` marks values missing from short
+        rows.
+    convert : callable or None
+        Function applied to each value that is not missing.
+    fill : object
+        Replacement for missing values.
+
+    Returns
+    -------
+    sequence
+
+    """
+
+    if sentinel not in column:
+        return column if convert is None else list(map(convert, column))
+    if convert is None:
+        return [fill if value is sentinel else value for value in column]
+    return [fill if value is sentinel else convert(value) for value in column]
+
+
+def _fspath(path):
+    """Return `path` as accepted by `open` and `os.stat`.
+
+    Python 3.4 and 3.5 only accept strings and bytes, so `pathlib` paths
+    are converted to strings. Without `pathlib` imported, `path` can't
+    be one, so the module isn't imported just to check.
+
+    """
+
+    pathlib = sys.modules.get("pathlib")
+    if pathlib is not None and isinstance(path, pathlib.PurePath):
+        return str(path)
+    return path
+
+
+def _check_column_file(path, fmt):
+    """Check that the size of file `path` is a multiple of `fmt`.
+
+    Returns
+    -------
+    tuple
+        `path`, converted by `_fspath`, and `fmt`.
+
+    Raises
+    ------
+    ValueError
+        If the file size is not a multiple of the size of `fmt`.
+
+    """
+
+    path = _fspath(path)
+    size = os.stat(path).st_size
+    itemsize = struct.calcsize(fmt)
+    if size % itemsize:
+        raise ValueError(
+            "Size of {!r} ({} bytes) is not a multiple of format {!r} "
+            "({} bytes).".format(path, size, fmt, itemsize)
+        )
+    return path, fmt
+
+
+def _file_column(path, fmt):
+    """Generates decoded values from a memory-mapped column file.
+
+    Parameters
+    ----------
+    path : path-like
+        Column file.
+    fmt : string
+        `struct` format of one value.
+
+    Yields
+    ------
+    object
+        Decoded value, or a tuple if `fmt` describes several items.
+
+    """
+
+    with open(_fspath(path), "rb") as f:
+        if not os.fstat(f.fileno()).st_size:
+            return  # Empty files can't be memory mapped.
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if hasattr(mmap, "MADV_SEQUENTIAL"):
+        mapped.madvise(mmap.MADV_SEQUENTIAL)
+    view = memoryview(mapped)
+    values = _decode(view, fmt)
+    try:
+        yield from values
+    finally:
+        # Buffer exports must be released before the map can be closed.
+        del values
+        view.release()
+        mapped.close()
+
+
+def _decode(view, fmt):
+    """Return an iterator decoding `view` with `struct` format `fmt`."""
+
+    if fmt in _CAST_FORMATS or (fmt[:1] == "@" and fmt[1:] in _CAST_FORMATS):
+        return iter(view.cast(fmt.lstrip("@")))
+    unpacked = struct.iter_unpack(fmt, view)
+    if len(struct.unpack(fmt, bytes(struct.calcsize(fmt)))) == 1:
+        return map(itemgetter(0), unpacked)
+    return unpacked
@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+"""Merge joins of sorted iterables.
+
+Implements :func:`namedzip_join`, which pairs the values of several
+iterables sorted by a key instead of by position.
+
+copyright: © 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+from functools import partial
+from heapq import merge
+from itertools import groupby
+from operator import itemgetter
+
+from .namedzip import (
+    _check_defaults,
+    _compare_iterables_to_fields,
+    _namedtuple_cache,
+    sentinel,
+)
+
+HOW = ("inner", "outer")
+
+
+def namedzip_join(*iterables, typename, field_names, **kwargs):
+    """Joins iterables sorted by a key to generate named tuples.
+
+    Every iterable is a stream of values in strictly ascending key order,
+    and a named tuple is generated for every key, holding the value of
+    each iterable with that key. The iterables are merged in a single
+    pass, holding one value per iterable in memory.
+
+    Returns an iterator if `*iterables` are supplied, otherwise returns
+    a function for creating iterators.
+
+    Parameters
+    ----------
+    *iterables : iterable, optional
+        Iterable objects passed as positional arguments, each sorted by
+        key.
+    typename : string
+        Type name for generated named tuple objects. Passed on to
+        `collections.namedtuple` factory function.
+    field_names : iterable
+        Field names for generated named tuple objects, one per iterable.
+        Passed on to `collections.namedtuple` factory function.
+    key : callable or list or tuple, optional
+        Function returning the key of a value, or one function for each
+        iterable. Keys of all iterables must be comparable with each
+        other (default is None, the values are the keys).
+    how : {"inner", "outer"}, optional
+        "inner" generates only keys present in all iterables and stops
+        when any iterable is exhausted. "outer" generates every key and
+        fills in missing values (default is "inner").
+    fillvalue : type, optional
+        Missing value used if `how` is "outer", as in `namedzip_longest`
+        (default is None).
+    defaults : iterable, optional
+        Individual missing values for each iterable if `how` is "outer".
+        Overrides `fillvalue` if specified.
+    **kwargs
+        Any additional keyword arguments will be passed on to the
+        `collections.namedtuple` factory function.
+
+    Returns
+    -------
+    generator object
+        If `*iterables` are supplied.
+    function object
+        If `*iterables` are not supplied.
+
+    Raises
+    ------
+    ValueError
+        If `how` is not supported, if the number of `key` functions or
+        `defaults` does not match the number of `field_names`, or, while
+        iterating, if the keys of an iterable are not strictly ascending.
+
+    """
+
+    key = kwargs.pop("key", None)
+    how = kwargs.pop("how", "inner")
+    fillvalue = kwargs.pop("fillvalue", None)
+    defaults = kwargs.pop("defaults", None)
+    if how not in HOW:
+        raise ValueError(
+            "Unsupported how {!r}, expected one of {}.".format(
+                how, ", ".join(map(repr, HOW))
+            )
+        )
+    named_tuple = _namedtuple_cache.get(typename, field_names, **kwargs)
+    field_count = len(named_tuple._fields)
+    keys = _check_keys(key, field_count)
+    defaults = _check_defaults(defaults, field_count)
+    fills = defaults or (fillvalue,) * field_count
+
+    def _namedzip_join_factory(*iterables):
+        _compare_iterables_to_fields(len(iterables), field_count)
+        return _join_rows(iterables, keys, named_tuple, fills, how == "inner")
+
+    if iterables:
+        return _namedzip_join_factory(*iterables)
+    else:
+        return _namedzip_join_factory
+
+
+def _check_keys(key, field_count):
+    """Return a key function, or None, for each iterable.
+
+    Raises
+    ------
+    ValueError
+        If the number of key functions does not match `field_count`.
+
+    """
+
+    if not isinstance(key, (list, tuple)):
+        return (key,) * field_count
+    if len(key) != field_count:
+        raise ValueError(
+            "Unequal number of field names ({}) and keys ({}).".format(
+                field_count, len(key)
+            )
+        )
+    return tuple(key)
+
+
+def _join_rows(iterables, keys, named_tuple, fills, inner):
+    """Generates the joined rows of `iterables`.
+
+    Values of all iterables are merged in key order as ``(key,
+    position, value)`` tuples, so keys are compared but values are not,
+    and grouped by key into rows.
+
+    """
+
+    fields = named_tuple._fields
+    exhausted = []
+    streams = [
+        _keyed(it, key, position, fields[position], exhausted)
+        for position, (it, key) in enumerate(zip(iterables, keys))
+    ]
+    new_row = partial(tuple.__new__, named_tuple)
+    field_count = len(fields)
+    for _, group in groupby(merge(*streams), itemgetter(0)):
+        values = list(fills)
+        matched = 0
+        for _, position, value in group:
+            values[position] = value
+            matched += 1
+        if not inner:
+            yield new_row(values)
+            continue
+        if matched == field_count:
+            yield new_row(values)
+        if exhausted:
+            return  # No later key can be present in all iterables.
+
+
+def _keyed(iterable, key, position, field, exhausted):
+    """Generates ``(key, position, value)`` for the values of `iterable`.
+
+    Appends `position` to `exhausted` when `iterable` is exhausted.
+
+    Raises
+    ------
+    ValueError
+        If a key is not greater than the previous one.
+
+    """
+
+    previous = sentinel
+    for value in iterable:
+        current = value if key is None else key(value)
+        if previous is not sentinel and not previous < current:
+            raise ValueError(
+                "Keys of field {!r} are not strictly ascending: {!r} after "
+                "{!r}.".format(field, current, previous)
+            )
+        previous = current
+        yield current, position, value
+    exhausted.append(position)
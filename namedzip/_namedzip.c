@@ -0,0 +1,275 @@
+/*
+ * Optional C accelerator for namedzip and namedzip_longest.
+ *
+ * Implements the zip_rows iterator, which advances a number of iterators
+ * in lockstep and stores their values directly in a new named tuple,
+ * without an intermediate tuple or a Python-level call per row. The
+ * pure Python implementation in namedzip.py is used if this extension is
+ * not built, and remains the reference for its behaviour.
+ *
+ * copyright: (c) 2019 by Erik R Berlin.
+ * license: MIT, see LICENSE for more details.
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+typedef struct {
+    PyObject_HEAD
+    PyTypeObject *row_type; /* tuple subclass of the generated rows */
+    PyObject **iterators;   /* NULL once exhausted in longest mode */
+    PyObject *fills;        /* tuple of fill values, NULL for shortest */
+    Py_ssize_t size;
+    Py_ssize_t active;      /* iterators not yet exhausted */
+} ZipRowsObject;
+
+static PyTypeObject ZipRows_Type;
+
+static PyObject *
+zip_rows_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
+{
+    static char *kwlist[] = {"row_type", "iterables", "fills", NULL};
+    PyObject *row_type, *iterables, *fills = Py_None;
+    PyObject *sequence;
+    ZipRowsObject *zr;
+    Py_ssize_t i, size;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "OO|O:zip_rows", kwlist,
+                                     &row_type, &iterables, &fills)) {
+        return NULL;
+    }
+    if (!PyType_Check(row_type) ||
+        !PyType_IsSubtype((PyTypeObject *)row_type, &PyTuple_Type)) {
+        PyErr_SetString(PyExc_TypeError,
+                        "zip_rows() row_type must be a tuple subclass");
+        return NULL;
+    }
+    sequence = PySequence_Fast(iterables,
+                               "zip_rows() iterables must be iterable");
+    if (sequence == NULL) {
+        return NULL;
+    }
+    size = PySequence_Fast_GET_SIZE(sequence);
+    if (fills != Py_None) {
+        fills = PySequence_Tuple(fills);
+        if (fills == NULL) {
+            Py_DECREF(sequence);
+            return NULL;
+        }
+        if (PyTuple_GET_SIZE(fills) != size) {
+            PyErr_Format(PyExc_ValueError,
+                         "zip_rows() got %zd fills for %zd iterables",
+                         PyTuple_GET_SIZE(fills), size);
+            Py_DECREF(fills);
+            Py_DECREF(sequence);
+            return NULL;
+        }
+    }
+    else {
+        fills = NULL;
+    }
+
+    zr = (ZipRowsObject *)type->tp_alloc(type, 0);
+    if (zr == NULL) {
+        Py_XDECREF(fills);
+        Py_DECREF(sequence);
+        return NULL;
+    }
+    Py_INCREF(row_type);
+    zr->row_type = (PyTypeObject *)row_type;
+    zr->fills = fills;
+    zr->size = size;
+    zr->active = size;
+    zr->iterators = PyMem_New(PyObject *, size ? size : 1);
+    if (zr->iterators == NULL) {
+        zr->size = 0;
+        Py_DECREF(sequence);
+        Py_DECREF(zr);
+        return PyErr_NoMemory();
+    }
+    for (i = 0; i < size; i++) {
+        zr->iterators[i] = NULL;
+    }
+    for (i = 0; i < size; i++) {
+        PyObject *iterator =
+            PyObject_GetIter(PySequence_Fast_GET_ITEM(sequence, i));
+        if (iterator == NULL) {
+            Py_DECREF(sequence);
+            Py_DECREF(zr);
+            return NULL;
+        }
+        zr->iterators[i] = iterator;
+    }
+    Py_DECREF(sequence);
+    return (PyObject *)zr;
+}
+
+static void
+zip_rows_dealloc(ZipRowsObject *zr)
+{
+    Py_ssize_t i;
+
+    PyObject_GC_UnTrack(zr);
+    if (zr->iterators != NULL) {
+        for (i = 0; i < zr->size; i++) {
+            Py_XDECREF(zr->iterators[i]);
+        }
+        PyMem_Free(zr->iterators);
+    }
+    Py_XDECREF(zr->row_type);
+    Py_XDECREF(zr->fills);
+    Py_TYPE(zr)->tp_free(zr);
+}
+
+static int
+zip_rows_traverse(ZipRowsObject *zr, visitproc visit, void *arg)
+{
+    Py_ssize_t i;
+
+    Py_VISIT(zr->row_type);
+    Py_VISIT(zr->fills);
+    if (zr->iterators != NULL) {
+        for (i = 0; i < zr->size; i++) {
+            Py_VISIT(zr->iterators[i]);
+        }
+    }
+    return 0;
+}
+
+static void
+zip_rows_stop(ZipRowsObject *zr)
+{
+    Py_ssize_t i;
+
+    zr->active = 0;
+    for (i = 0; i < zr->size; i++) {
+        Py_CLEAR(zr->iterators[i]);
+    }
+}
+
+static PyObject *
+zip_rows_next(ZipRowsObject *zr)
+{
+    Py_ssize_t i;
+    PyObject *row, *item, *iterator;
+
+    if (zr->active == 0) {
+        return NULL;
+    }
+    /* Rows are allocated like tuple.__new__ does for tuple subclasses. */
+    row = zr->row_type->tp_alloc(zr->row_type, zr->size);
+    if (row == NULL) {
+        return NULL;
+    }
+    for (i = 0; i < zr->size; i++) {
+        iterator = zr->iterators[i];
+        if (iterator == NULL) {
+            item = PyTuple_GET_ITEM(zr->fills, i);
+            Py_INCREF(item);
+        }
+        else {
+            item = (*Py_TYPE(iterator)->tp_iternext)(iterator);
+            if (item == NULL) {
+                if (PyErr_Occurred()) {
+                    if (!PyErr_ExceptionMatches(PyExc_StopIteration)) {
+                        Py_DECREF(row);
+                        return NULL;
+                    }
+                    PyErr_Clear();
+                }
+                if (zr->fills == NULL || zr->active == 1) {
+                    zip_rows_stop(zr);
+                    Py_DECREF(row);
+                    return NULL;
+                }
+                zr->active--;
+                Py_CLEAR(zr->iterators[i]);
+                item = PyTuple_GET_ITEM(zr->fills, i);
+                Py_INCREF(item);
+            }
+        }
+        PyTuple_SET_ITEM(row, i, item);
+    }
+    return row;
+}
+
+PyDoc_STRVAR(zip_rows_doc,
+"zip_rows(row_type, iterables, fills=None)\n\
+--\n\
+\n\
+Iterator of `row_type` instances holding one value of each iterable.\n\
+\n\
+Stops at the shortest iterable like zip(), or, if `fills` are given,\n\
+at the longest one, using the fill value of each exhausted iterable\n\
+like itertools.zip_longest().");
+
+static PyTypeObject ZipRows_Type = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    "namedzip._namedzip.zip_rows",              /* tp_name */
+    sizeof(ZipRowsObject),                      /* tp_basicsize */
+    0,                                          /* tp_itemsize */
+    (destructor)zip_rows_dealloc,               /* tp_dealloc */
+    0,                                          /* tp_print */
+    0,                                          /* tp_getattr */
+    0,                                          /* tp_setattr */
+    0,                                          /* tp_reserved */
+    0,                                          /* tp_repr */
+    0,                                          /* tp_as_number */
+    0,                                          /* tp_as_sequence */
+    0,                                          /* tp_as_mapping */
+    0,                                          /* tp_hash */
+    0,                                          /* tp_call */
+    0,                                          /* tp_str */
+    PyObject_GenericGetAttr,                    /* tp_getattro */
+    0,                                          /* tp_setattro */
+    0,                                          /* tp_as_buffer */
+    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC,    /* tp_flags */
+    zip_rows_doc,                               /* tp_doc */
+    (traverseproc)zip_rows_traverse,            /* tp_traverse */
+    0,                                          /* tp_clear */
+    0,                                          /* tp_richcompare */
+    0,                                          /* tp_weaklistoffset */
+    PyObject_SelfIter,                          /* tp_iter */
+    (iternextfunc)zip_rows_next,                /* tp_iternext */
+    0,                                          /* tp_methods */
+    0,                                          /* tp_members */
+    0,                                          /* tp_getset */
+    0,                                          /* tp_base */
+    0,                                          /* tp_dict */
+    0,                                          /* tp_descr_get */
+    0,                                          /* tp_descr_set */
+    0,                                          /* tp_dictoffset */
+    0,                                          /* tp_init */
+    PyType_GenericAlloc,                        /* tp_alloc */
+    zip_rows_new,                               /* tp_new */
+    PyObject_GC_Del,                            /* tp_free */
+};
+
+static struct PyModuleDef namedzip_module = {
+    PyModuleDef_HEAD_INIT,
+    "namedzip._namedzip",
+    "C accelerator for namedzip and namedzip_longest.",
+    -1,
+    NULL,
+};
+
+PyMODINIT_FUNC
+PyInit__namedzip(void)
+{
+    PyObject *module;
+
+    if (PyType_Ready(&ZipRows_Type) < 0) {
+        return NULL;
+    }
+    module = PyModule_Create(&namedzip_module);
+    if (module == NULL) {
+        return NULL;
+    }
+    Py_INCREF(&ZipRows_Type);
+    if (PyModule_AddObject(module, "zip_rows", (PyObject *)&ZipRows_Type) < 0) {
+        Py_DECREF(&ZipRows_Type);
+        Py_DECREF(module);
+        return NULL;
+    }
+    return module;
+}
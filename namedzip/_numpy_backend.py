@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+"""NumPy backend for :func:`namedzip` and :func:`namedzip_longest`.
+
+Aggregates iterables into a :class:`numpy.recarray` with one field per
+iterable, instead of generating named tuples row by row. NumPy is only
+imported when the backend is actually used.
+
+copyright: © 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+import sys
+
+
+def is_ndarray(obj):
+    """Check whether `obj` is a NumPy array, without importing NumPy.
+
+    Parameters
+    ----------
+    obj : object
+        Object to check.
+
+    Returns
+    -------
+    bool
+
+    """
+
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(obj, numpy.ndarray)
+
+
+def records(iterables, field_names, longest=False, fills=None):
+    """Aggregates iterables into a record array.
+
+    Array and buffer inputs are viewed rather than copied, and columns
+    are truncated or padded with vectorized operations, so the only
+    full copy is the one interleaving the columns into records.
+
+    Parameters
+    ----------
+    iterables : tuple
+        Iterable objects, one per field. NumPy arrays and objects
+        supporting the buffer protocol are used without copying.
+    field_names : tuple
+        Field names for the record array.
+    longest : bool, optional
+        Pad short columns with `fills` instead of truncating to the
+        shortest column (default is False).
+    fills : tuple or None, optional
+        Fill value for each column, required if `longest` is True.
+        Columns keep their data type if their fill value fits it, and
+        None fills numeric columns with NaN.
+
+    Returns
+    -------
+    numpy.recarray
+
+    Raises
+    ------
+    ImportError
+        If NumPy is not installed.
+    ValueError
+        If any iterable is not one-dimensional.
+
+    """
+
+    np = _import_numpy()
+    columns = [_as_column(np, it, name) for it, name in zip(iterables, field_names)]
+    lengths = [len(column) for column in columns]
+    rows = max(lengths, default=0) if longest else min(lengths, default=0)
+    if longest:
+        columns = [
+            column if len(column) == rows else _pad(np, column, rows, fill)
+            for column, fill in zip(columns, fills)
+        ]
+    else:
+        columns = [column[:rows] for column in columns]
+    return np.rec.fromarrays(columns, names=list(field_names))
+
+
+def arrays(columns, dtypes):
+    """Convert columns of values to arrays.
+
+    Parameters
+    ----------
+    columns : iterable
+        Sequence of values for each field.
+    dtypes : tuple
+        NumPy data type for each column, or None to infer it.
+
+    Returns
+    -------
+    list
+
+    Raises
+    ------
+    ImportError
+        If NumPy is not installed.
+
+    """
+
+    np = _import_numpy()
+    return [np.asarray(column, dtype) for column, dtype in zip(columns, dtypes)]
+
+
+def concatenate(chunks, dtype=None):
+    """Join a list of one-dimensional arrays into one array.
+
+    Parameters
+    ----------
+    chunks : list
+        Arrays to join, in order.
+    dtype : optional
+        Data type of the empty array returned if `chunks` is empty
+        (default is None, i.e. float).
+
+    Returns
+    -------
+    numpy.ndarray
+
+    """
+
+    np = _import_numpy()
+    if not chunks:
+        return np.empty(0, dtype)
+    if len(chunks) == 1:
+        return chunks[0]
+    return np.concatenate(chunks)
+
+
+def _import_numpy():
+    """Import and return the `numpy` module."""
+
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            "The numpy backend requires NumPy, install it with `pip install numpy`."
+        ) from None
+    return numpy
+
+
+def _as_column(np, iterable, name):
+    """Convert `iterable` to a one-dimensional array, copying only if needed."""
+
+    if isinstance(iterable, np.ndarray):
+        column = iterable
+    else:
+        try:
+            column = np.asarray(memoryview(iterable))
+        except TypeError:
+            column = np.asarray(list(iterable))
+    if column.ndim != 1:
+        raise ValueError(
+            "Field {!r} must be one-dimensional, not {}-dimensional.".format(
+                name, column.ndim
+            )
+        )
+    return column
+
+
+def _pad(np, column, rows, fill):
+    """Pad `column` to `rows` values with `fill`.
+
+    `column` keeps its data type if `fill` fits it exactly, and is
+    promoted by `numpy.concatenate` otherwise. None pads numeric columns
+    with NaN rather than turning them into object arrays.
+
+    """
+
+    if fill is None and column.dtype.kind in "iufc":
+        fill = np.nan
+    padding = np.full(rows - len(column), fill)
+    if _fits(np, padding[:1], column.dtype):
+        padding = padding.astype(column.dtype)
+    return np.concatenate([column, padding])
+
+
+def _fits(np, values, dtype):
+    """Check whether `values` can be cast to `dtype` without change."""
+
+    try:
+        with np.errstate(invalid="ignore", over="ignore"):
+            cast = values.astype(dtype)
+    except (TypeError, ValueError, OverflowError):
+        return False
+    same = cast == values
+    if cast.dtype.kind in "fc" and values.dtype.kind in "fc":
+        same |= np.isnan(cast) & np.isnan(values)
+    return bool(np.all(same))
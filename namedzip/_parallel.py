@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+"""This module implements :func:`namedzip_parallel`, which builds and
+transforms named tuples in a pool of worker processes.
+
+copyright: © 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import islice
+
+from .namedzip import (
+    _cache_key,
+    _check_defaults,
+    _compare_iterables_to_fields,
+    _create_zip,
+    _namedtuple_cache,
+)
+
+
+def namedzip_parallel(*iterables, typename, field_names, **kwargs):
+    """Builds named tuples and applies `func` to them in worker processes.
+
+    The iterables are zipped in the calling process, and chunks of
+    plain tuples are sent to a `concurrent.futures.ProcessPoolExecutor`.
+    Workers build the named tuples from their own cached class and apply
+    `func`, and results are generated in input order. Only a bounded
+    number of chunks is in flight at any time.
+
+    Returns a generator if `*iterables` are supplied, otherwise returns
+    a function for creating generators.
+
+    Parameters
+    ----------
+    *iterables : iterable, optional
+        Iterable objects passed as positional arguments.
+    typename : string
+        Type name for generated named tuple objects. Passed on to
+        `collections.namedtuple` factory function.
+    field_names : iterable
+        Field names for generated named tuple objects. Passed on to
+        `collections.namedtuple` factory function.
+    func : callable, optional
+        Picklable function applied to every named tuple in the workers,
+        e.g. a module level function. Named tuples are generated
+        unchanged if not specified (default is None).
+    workers : int, optional
+        Number of worker processes (default is `os.cpu_count()`).
+    chunksize : int, optional
+        Number of rows sent to a worker at a time (default is 1024).
+    executor : concurrent.futures.Executor, optional
+        Existing executor to use instead of starting a new process pool
+        for every generator. It is not shut down (default is None).
+    longest : bool, optional
+        Continue until the longest iterable is exhausted, filling in
+        missing values like `namedzip_longest` (default is False).
+    fillvalue : type, optional
+        Missing value used if `longest` is True (default is None).
+    defaults : iterable, optional
+        Individual default values for each iterable if `longest` is
+        True. Overrides `fillvalue` if specified.
+    **kwargs
+        Any additional keyword arguments will be passed on to the
+        `collections.namedtuple` factory function.
+
+    Returns
+    -------
+    generator object
+        If `*iterables` are supplied.
+    function object
+        If `*iterables` are not supplied.
+
+    Raises
+    ------
+    ValueError
+        If `chunksize` or `workers` is not positive, or if `defaults`
+        do not match the number of `field_names`.
+
+    """
+
+    func = kwargs.pop("func", None)
+    workers = kwargs.pop("workers", None) or os.cpu_count() or 1
+    chunksize = kwargs.pop("chunksize", 1024)
+    executor = kwargs.pop("executor", None)
+    longest = kwargs.pop("longest", False)
+    fillvalue = kwargs.pop("fillvalue", None)
+    defaults = kwargs.pop("defaults", None)
+    key = _cache_key(typename, field_names, kwargs)
+    named_tuple = _namedtuple_cache.get(key[0], key[1], **dict(key[2]))
+    defaults = _check_defaults(defaults, len(named_tuple._fields))
+    if chunksize < 1:
+        raise ValueError("chunksize must be positive, not {}.".format(chunksize))
+    if workers < 1:
+        raise ValueError("workers must be positive, not {}.".format(workers))
+    build = partial(_build_chunk, key, func)
+
+    def _namedzip_parallel_factory(*iterables):
+        _compare_iterables_to_fields(len(iterables), len(named_tuple._fields))
+        zipped = _create_zip(
+            *iterables, fillvalue=fillvalue, type_longest=longest, defaults=defaults
+        )
+        return _parallel_generator(zipped, build, workers, chunksize, executor)
+
+    if iterables:
+        return _namedzip_parallel_factory(*iterables)
+    else:
+        return _namedzip_parallel_factory
+
+
+def _parallel_generator(zipped, build, workers, chunksize, executor=None):
+    """Generates results of `build` for chunks of `zipped`, in order.
+
+    Parameters
+    ----------
+    zipped : iterable
+        Should be iterator produced by `_create_zip`.
+    build : callable
+        Picklable function mapping a list of tuples to a list of results.
+    workers : int
+        Number of worker processes, also used to bound the number of
+        chunks in flight.
+    chunksize : int
+        Number of tuples per chunk.
+    executor : concurrent.futures.Executor, optional
+        Executor to submit chunks to. A new `ProcessPoolExecutor` is
+        started and shut down if not specified.
+
+    Yields
+    ------
+    object
+        Result for each tuple in `zipped`.
+
+    """
+
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers=workers)
+    pending = deque()
+    chunks = iter(lambda: list(islice(zipped, chunksize)), [])
+    try:
+        for chunk in chunks:
+            pending.append(executor.submit(build, chunk))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+        if own_executor:
+            executor.shutdown(wait=True)
+
+
+def _build_chunk(key, func, chunk):
+    """Build named tuples for a chunk of tuples and apply `func`.
+
+    Runs in worker processes, which look up the named tuple class in
+    their own class cache, so only the cache key is pickled.
+
+    Parameters
+    ----------
+    key : tuple
+        Cache key of the named tuple class.
+    func : callable or None
+        Function applied to every named tuple.
+    chunk : list
+        Tuples with one value per field.
+
+    Returns
+    -------
+    list
+
+    """
+
+    typename, field_names, options = key
+    named_tuple = _namedtuple_cache.get(typename, field_names, **dict(options))
+    rows = map(partial(tuple.__new__, named_tuple), chunk)
+    if func is not None:
+        rows = map(func, rows)
+    return list(rows)
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""Threaded prefetching of input iterables for the `prefetch` option.
+
+Each source is drained by a background thread into a bounded queue, so
+slow or I/O-bound iterables are read concurrently instead of strictly
+one after another by `zip`.
+
+copyright: © 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+import queue
+import threading
+
+_POLL_INTERVAL = 0.1
+
+
+class Prefetcher:
+    """Iterator over values read ahead from `iterable` by a thread.
+
+    The thread starts immediately and blocks once `size` values are
+    waiting to be consumed. Exceptions raised by `iterable` are raised
+    again by `__next__`. Closing the prefetcher, explicitly or when it
+    is garbage collected, stops the thread and closes `iterable` if it
+    has a `close` method.
+
+    Parameters
+    ----------
+    iterable : iterable
+        Source to read from.
+    size : int
+        Maximum number of values read ahead.
+
+    Raises
+    ------
+    TypeError
+        If `iterable` is not iterable.
+    ValueError
+        If `size` is not positive.
+
+    """
+
+    def __init__(self, iterable, size):
+        self._stop = threading.Event()
+        self._done = True
+        if size < 1:
+            raise ValueError("prefetch must be positive, not {}.".format(size))
+        iterator = iter(iterable)
+        self._queue = queue.Queue(maxsize=size)
+        self._done = False
+        # The thread must not reference `self`, or the prefetcher could
+        # never be garbage collected while the thread is blocked.
+        self._thread = threading.Thread(
+            target=_fill, args=(iterator, self._queue, self._stop), daemon=True
+        )
+        self._thread.start()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._done:
+            raise StopIteration
+        done, value = self._queue.get()
+        if done:
+            self._done = True
+            self._stop.set()
+            if value is not None:
+                raise value
+            raise StopIteration
+        return value
+
+    def close(self):
+        """Stop the background thread and discard read-ahead values."""
+
+        self._done = True
+        self._stop.set()
+
+    def __del__(self):
+        self.close()
+
+
+def _fill(iterator, buffer, stop):
+    """Copy values from `iterator` into `buffer` until done or stopped.
+
+    Every item put into `buffer` is a ``(done, value)`` pair. The last
+    one has `done` set and the raised exception, if any, as `value`.
+
+    """
+
+    error = None
+    try:
+        for value in iterator:
+            if not _put(buffer, (False, value), stop):
+                break
+    except BaseException as exc:
+        # Includes KeyboardInterrupt and SystemExit, so the consumer is
+        # never left waiting for an item which is never put.
+        error = exc
+    finally:
+        _put(buffer, (True, error), stop)  # Gives up at once if stopped.
+    if stop.is_set():
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            close()
+
+
+def _put(buffer, item, stop):
+    """Put `item` into `buffer`, giving up once `stop` is set.
+
+    Returns
+    -------
+    bool
+        True if `item` was put into `buffer`.
+
+    """
+
+    while not stop.is_set():
+        try:
+            buffer.put(item, timeout=_POLL_INTERVAL)
+        except queue.Full:
+            continue
+        return True
+    return False
@@ -0,0 +1,254 @@
+# -*- coding: utf-8 -*-
+"""Compact row types for :func:`namedzip` and :func:`namedzip_longest`.
+
+Implements alternatives to named tuple rows, selected with the
+`row_type` option:
+
+- ``"slots"`` rows are instances of a `__slots__` class generated from
+  the field names of a named tuple class.
+- ``"view"`` rows are flyweights holding only a reference to a shared
+  batch of columns and a row index. Values are looked up on attribute
+  access, so the row object has the same size for any number of fields.
+
+It also implements the single mutable record reused for every row with
+the `reuse` option. All of them keep attribute access by field name and
+expose `_fields`.
+
+copyright: © 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+from functools import lru_cache
+from itertools import repeat
+
+
+@lru_cache(maxsize=128)
+def slots_class(named_tuple):
+    """Create a `__slots__` class with the fields of `named_tuple`.
+
+    Parameters
+    ----------
+    named_tuple : type
+        Named tuple class produced by `namedtuple` factory function.
+
+    Returns
+    -------
+    type
+        Class taking one positional argument per field.
+
+    """
+
+    fields = named_tuple._fields
+    # Field names have already been validated as identifiers by the
+    # `namedtuple` factory, so they are safe to use in generated source,
+    # in the same way `collections.namedtuple` generates `__new__`. They
+    # can't start with an underscore, so `_self` never clashes with them.
+    arg_list = ", ".join(fields)
+    body = (
+        "".join("    _self.{0} = {0}\n".format(name) for name in fields) or "    pass\n"
+    )
+    namespace = {}
+    exec("def __init__(_self, {}):\n{}".format(arg_list, body), namespace)
+
+    def __iter__(self):
+        for name in fields:
+            yield getattr(self, name)
+
+    namespace.update(
+        {
+            "__slots__": fields,
+            "__module__": named_tuple.__module__,
+            "_fields": fields,
+            "__iter__": __iter__,
+        }
+    )
+    return type(named_tuple.__name__, (_RowBase,), namespace)
+
+
+@lru_cache(maxsize=128)
+def view_class(named_tuple):
+    """Create a flyweight row class with the fields of `named_tuple`.
+
+    Instances are created with a batch of columns and a row index, and
+    read the value of a field from its column on attribute access.
+
+    Parameters
+    ----------
+    named_tuple : type
+        Named tuple class produced by `namedtuple` factory function.
+
+    Returns
+    -------
+    type
+        Class taking a sequence of columns and a row index.
+
+    """
+
+    fields = named_tuple._fields
+    namespace = {
+        name: _column_property(index, name) for index, name in enumerate(fields)
+    }
+    namespace.update(
+        {"__slots__": (), "__module__": named_tuple.__module__, "_fields": fields}
+    )
+    return type(named_tuple.__name__, (_ViewBase,), namespace)
+
+
+def view_rows(batches, view):
+    """Generates flyweight rows from batches of columns.
+
+    Parameters
+    ----------
+    batches : iterable
+        Named tuples with one column per field, as generated by
+        `namedzip_batches`.
+    view : type
+        Class produced by `view_class`.
+
+    Yields
+    ------
+    view object
+
+    """
+
+    for batch in batches:
+        yield from map(view, repeat(batch), range(len(batch[0])))
+
+
+@lru_cache(maxsize=128)
+def record_class(named_tuple):
+    """Create a mutable record class with the fields of `named_tuple`.
+
+    Instances hold a list of values, which `reused_rows` overwrites in
+    place for every row.
+
+    Parameters
+    ----------
+    named_tuple : type
+        Named tuple class produced by `namedtuple` factory function.
+
+    Returns
+    -------
+    type
+        Class taking a list with one value per field.
+
+    """
+
+    fields = named_tuple._fields
+    namespace = {
+        name: _value_property(index, name) for index, name in enumerate(fields)
+    }
+    namespace.update(
+        {
+            "__slots__": (),
+            "__module__": named_tuple.__module__,
+            "_fields": fields,
+            "_named_tuple": named_tuple,
+        }
+    )
+    return type(named_tuple.__name__, (_RecordBase,), namespace)
+
+
+def reused_rows(zipped, record):
+    """Generates the same record, overwriting its values for every row.
+
+    Parameters
+    ----------
+    zipped : iterable
+        Should be iterator produced by `zip` or `zip_longest`.
+    record : type
+        Class produced by `record_class`.
+
+    Yields
+    ------
+    record object
+        The identical object for every row.
+
+    """
+
+    row = record([None] * len(record._fields))
+    values = row._values
+    # Assigning each tuple to a slice of `values` copies it in place and
+    # drops the last reference to it, which lets `zip` reuse the tuple for
+    # the next row, so no objects are allocated per row.
+    for values[:] in zipped:
+        yield row
+
+
+class _RowBase:
+    """Common interface of generated row classes."""
+
+    __slots__ = ()
+    _fields = ()
+    __hash__ = None
+
+    def __len__(self):
+        return len(self._fields)
+
+    def __eq__(self, other):
+        if isinstance(other, _RowBase):
+            return self._fields == other._fields and tuple(self) == tuple(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return "{}({})".format(
+            type(self).__name__,
+            ", ".join("{}={!r}".format(n, v) for n, v in zip(self._fields, self)),
+        )
+
+    def _asdict(self):
+        """Return a new dict which maps field names to their values."""
+
+        return dict(zip(self._fields, self))
+
+
+class _ViewBase(_RowBase):
+    """Base class for flyweight rows over shared columns."""
+
+    __slots__ = ("_columns", "_index")
+
+    def __init__(self, columns, index):
+        self._columns = columns
+        self._index = index
+
+    def __iter__(self):
+        index = self._index
+        for column in self._columns:
+            yield column[index]
+
+
+class _RecordBase(_RowBase):
+    """Base class for mutable records reused for every row."""
+
+    __slots__ = ("_values",)
+    _named_tuple = tuple
+
+    def __init__(self, values):
+        self._values = values
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def _asnamedtuple(self):
+        """Return a named tuple copy of the current values."""
+
+        return tuple.__new__(self._named_tuple, self._values)
+
+
+def _value_property(index, name):
+    """Return a read-only property for the value at `index`."""
+
+    def fget(self):
+        return self._values[index]
+
+    return property(fget, doc="Value of field {!r}.".format(name))
+
+
+def _column_property(index, name):
+    """Return a read-only property for the column at `index`."""
+
+    def fget(self):
+        return self._columns[index][self._index]
+
+    return property(fget, doc="Value of field {!r}.".format(name))
@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+"""Opt-in instrumentation of :func:`namedzip` and :func:`namedzip_longest`.
+
+Implements :class:`ZipStats`, a collector passed with the `stats` option
+or installed for all calls with :func:`set_default_stats`. Without a
+collector, no instrumentation code runs per row.
+
+copyright: © 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+import threading
+from time import perf_counter
+
+_default_stats = None
+
+
+def set_default_stats(stats):
+    """Install a collector for all calls without the `stats` option.
+
+    Parameters
+    ----------
+    stats : ZipStats or None
+        Collector used by every `namedzip` and `namedzip_longest` call
+        that doesn't specify `stats`, or None to disable it.
+
+    Returns
+    -------
+    ZipStats or None
+        The previously installed collector.
+
+    """
+
+    global _default_stats
+    previous, _default_stats = _default_stats, stats
+    return previous
+
+
+def get_default_stats():
+    """Return the collector installed with `set_default_stats`, or None."""
+
+    return _default_stats
+
+
+class ZipStats:
+    """Collects statistics of instrumented named tuple iterators.
+
+    Every iterator created with a collector is a run. Runs are recorded
+    when they are exhausted, closed or garbage collected, and counters
+    are added up across runs. Collectors can be shared between threads.
+
+    Parameters
+    ----------
+    callback : callable, optional
+        Function called with a dict of the statistics of each recorded
+        run, in the format of `as_dict`, e.g. to feed a metrics system
+        (default is None).
+
+    Attributes
+    ----------
+    runs : int
+        Number of recorded runs.
+    rows : int
+        Number of rows produced.
+    filled_rows : int
+        Number of rows with at least one fill or default value.
+    elapsed : float
+        Seconds spent producing rows, including `blocked` time.
+    blocked : dict
+        Seconds spent waiting on each source, keyed by field name.
+    exhausted : dict
+        Number of values each source produced before it was exhausted,
+        keyed by field name, for the last recorded run. Sources which
+        were not exhausted are missing.
+
+    """
+
+    def __init__(self, callback=None):
+        self.callback = callback
+        self._lock = threading.Lock()
+        self.reset()
+
+    def __repr__(self):
+        return "<{} runs={} rows={} filled_rows={}>".format(
+            type(self).__name__, self.runs, self.rows, self.filled_rows
+        )
+
+    def reset(self):
+        """Set all counters back to zero."""
+
+        with self._lock:
+            self.runs = 0
+            self.rows = 0
+            self.filled_rows = 0
+            self.elapsed = 0.0
+            self.blocked = {}
+            self.exhausted = {}
+
+    def as_dict(self):
+        """Return the statistics as a plain dict.
+
+        Returns
+        -------
+        dict
+            Keys "runs", "rows", "filled_rows", "elapsed", "blocked" and
+            "exhausted" as described for the attributes, and "zip_time",
+            the seconds of `elapsed` not spent waiting on sources, i.e.
+            in zipping and building rows.
+
+        """
+
+        with self._lock:
+            return {
+                "runs": self.runs,
+                "rows": self.rows,
+                "filled_rows": self.filled_rows,
+                "elapsed": self.elapsed,
+                "zip_time": max(self.elapsed - sum(self.blocked.values()), 0.0),
+                "blocked": dict(self.blocked),
+                "exhausted": dict(self.exhausted),
+            }
+
+    def _record(self, run):
+        """Add the counters of a finished `_Run`."""
+
+        fields = run.fields
+        filled = 0
+        if run.filled is not None:
+            filled = run.filled
+        elif run.longest and run.exhausted:
+            filled = max(run.rows - min(run.exhausted.values()), 0)
+        blocked = dict(zip(fields, run.blocked))
+        exhausted = {fields[i]: count for i, count in run.exhausted.items()}
+        with self._lock:
+            self.runs += 1
+            self.rows += run.rows
+            self.filled_rows += filled
+            self.elapsed += run.elapsed
+            for name, seconds in blocked.items():
+                self.blocked[name] = self.blocked.get(name, 0.0) + seconds
+            self.exhausted = exhausted
+        if self.callback is not None:
+            self.callback(
+                {
+                    "runs": 1,
+                    "rows": run.rows,
+                    "filled_rows": filled,
+                    "elapsed": run.elapsed,
+                    "zip_time": max(run.elapsed - sum(run.blocked), 0.0),
+                    "blocked": blocked,
+                    "exhausted": exhausted,
+                }
+            )
+
+
+class _Run:
+    """Counters of a single instrumented iterator."""
+
+    __slots__ = (
+        "fields",
+        "longest",
+        "rows",
+        "filled",
+        "elapsed",
+        "blocked",
+        "exhausted",
+    )
+
+    def __init__(self, fields, longest):
+        self.fields = fields
+        self.longest = longest
+        self.rows = 0
+        self.filled = None  # Counted by `count_filled` if rows are filtered.
+        self.elapsed = 0.0
+        self.blocked = [0.0] * len(fields)
+        self.exhausted = {}
+
+
+def instrument_sources(iterables, fields, longest):
+    """Wrap `iterables` to time them and record their exhaustion.
+
+    Returns
+    -------
+    tuple
+        A new `_Run` and the list of wrapped iterables.
+
+    """
+
+    run = _Run(fields, longest)
+    return run, [_timed(it, run, i) for i, it in enumerate(iterables)]
+
+
+def instrument_rows(rows, run, stats):
+    """Wrap the row iterator of `run` to count rows and record the run.
+
+    Returns
+    -------
+    generator object
+
+    """
+
+    return _counted(iter(rows), run, stats)
+
+
+def count_filled(selectors, run):
+    """Wrap the row filter of `run` to count kept rows with fill values.
+
+    Without a filter, rows with fill values follow the point where the
+    first source was exhausted. With one, the same rule is applied to
+    the index of every kept row. Sources may be exhausted well before
+    their rows are reached, e.g. when `types` read them ahead, but
+    never after, since `itertools.compress` consumes a selector after
+    the zipped row it selects.
+
+    Returns
+    -------
+    generator object
+
+    """
+
+    return _counted_filled(selectors, run)
+
+
+def _counted_filled(selectors, run):
+    """Generates `selectors`, adding kept rows with fills to `run`."""
+
+    run.filled = 0
+    exhausted = run.exhausted
+    for index, selected in enumerate(selectors):
+        if selected and exhausted and index >= min(exhausted.values()):
+            run.filled += 1
+        yield selected
+
+
+def _timed(iterable, run, position):
+    """Generates the values of `iterable`, timing each `next` call.
+
+    Time is added to `run` on every call, since the run may be recorded
+    before this generator is closed.
+
+    """
+
+    iterator = iter(iterable)
+    clock = perf_counter
+    blocked = run.blocked
+    count = 0
+    while True:
+        start = clock()
+        try:
+            value = next(iterator)
+        except StopIteration:
+            run.exhausted[position] = count
+            return
+        finally:
+            blocked[position] += clock() - start
+        count += 1
+        yield value
+
+
+def _counted(rows, run, stats):
+    """Generates `rows`, counting and timing them, then records `run`."""
+
+    clock = perf_counter
+    count = 0
+    elapsed = 0.0
+    try:
+        while True:
+            start = clock()
+            try:
+                row = next(rows)
+            except StopIteration:
+                return
+            finally:
+                elapsed += clock() - start
+            count += 1
+            yield row
+    finally:
+        run.rows = count
+        run.elapsed = elapsed
+        stats._record(run)
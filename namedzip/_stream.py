@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+"""Incremental zipping of column data arriving over time.
+
+Implements :class:`NamedZipStream`, which buffers values pushed per
+field and generates named tuples as soon as every field has a value.
+
+copyright: © 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+from functools import partial
+
+from .namedzip import _check_defaults, _namedtuple_cache
+
+
+class NamedZipStream:
+    """Stateful zip of named tuples from values pushed over time.
+
+    Values are pushed per field with `push`, or as whole rows with
+    `push_rows`. Both return an iterator of the rows completed by the
+    push, i.e. rows for which every field has a value. Only values of
+    incomplete rows are buffered, so memory is bounded by the lag
+    between fields. `close` ends the stream and returns the remaining
+    rows with missing values filled in like `namedzip_longest`.
+
+    Parameters
+    ----------
+    typename : string
+        Type name for generated named tuple objects. Passed on to
+        `collections.namedtuple` factory function.
+    field_names : iterable
+        Field names for generated named tuple objects. Passed on to
+        `collections.namedtuple` factory function.
+    fillvalue : type, optional
+        Use for setting all missing values at the end of the stream to
+        the same default value (default is None).
+    defaults : iterable, optional
+        Individual default values for each field. Overrides `fillvalue`
+        if specified.
+    **kwargs
+        Any additional keyword arguments will be passed on to the
+        `collections.namedtuple` factory function.
+
+    Raises
+    ------
+    ValueError
+        If `defaults` are specified but do not match the number of
+        `field_names`.
+
+    """
+
+    __slots__ = ("_named_tuple", "_fills", "_buffers", "_positions", "_closed")
+
+    def __init__(self, *, typename, field_names, **kwargs):
+        fillvalue = kwargs.pop("fillvalue", None)
+        defaults = kwargs.pop("defaults", None)
+        self._named_tuple = _namedtuple_cache.get(typename, field_names, **kwargs)
+        fields = self._named_tuple._fields
+        defaults = _check_defaults(defaults, len(fields))
+        self._fills = defaults or (fillvalue,) * len(fields)
+        self._buffers = [[] for _ in fields]
+        self._positions = {name: i for i, name in enumerate(fields)}
+        self._closed = False
+
+    def __repr__(self):
+        return "<{} of {} rows ({}), buffered={}>".format(
+            type(self).__name__,
+            self._named_tuple.__name__,
+            "closed" if self._closed else "open",
+            self.buffered,
+        )
+
+    @property
+    def named_tuple(self):
+        """Named tuple class of the generated rows."""
+
+        return self._named_tuple
+
+    @property
+    def closed(self):
+        """True after `close` has been called."""
+
+        return self._closed
+
+    @property
+    def buffered(self):
+        """Number of buffered values for each field, keyed by field name."""
+
+        return {
+            name: len(buffer)
+            for name, buffer in zip(self._named_tuple._fields, self._buffers)
+        }
+
+    def push(self, field, values):
+        """Append `values` to `field` and return the completed rows.
+
+        Parameters
+        ----------
+        field : string
+            Name of the field the values belong to.
+        values : iterable
+            New values of the field, in order.
+
+        Returns
+        -------
+        iterator object
+            Named tuples completed by the pushed values.
+
+        Raises
+        ------
+        ValueError
+            If `field` is not one of the fields or the stream is closed.
+
+        """
+
+        self._check_open()
+        try:
+            position = self._positions[field]
+        except KeyError:
+            raise ValueError(
+                "Unknown field {!r}, expected one of {}.".format(
+                    field, self._named_tuple._fields
+                )
+            ) from None
+        self._buffers[position].extend(values)
+        return self._complete_rows()
+
+    def push_rows(self, rows):
+        """Append whole rows and return the completed rows.
+
+        Rows are appended after the values already buffered for each
+        field, so they only complete right away if no field lags behind.
+
+        Parameters
+        ----------
+        rows : iterable
+            Sequences with one value per field, e.g. tuples.
+
+        Returns
+        -------
+        iterator object
+            Named tuples completed by the pushed rows.
+
+        Raises
+        ------
+        ValueError
+            If a row does not have one value per field or the stream is
+            closed.
+
+        """
+
+        self._check_open()
+        rows = list(rows)
+        field_count = len(self._buffers)
+        for row in rows:
+            if len(row) != field_count:
+                raise ValueError(
+                    "Row with {} values for {} fields.".format(len(row), field_count)
+                )
+        if rows:
+            for buffer, values in zip(self._buffers, zip(*rows)):
+                buffer.extend(values)
+        return self._complete_rows()
+
+    def close(self):
+        """End the stream and return the remaining rows.
+
+        Missing values of the remaining rows are filled in with
+        `fillvalue` or `defaults`. Closing a closed stream returns no
+        rows.
+
+        Returns
+        -------
+        iterator object
+
+        """
+
+        if self._closed:
+            return iter(())
+        self._closed = True
+        row_count = max(map(len, self._buffers), default=0)
+        for buffer, fill in zip(self._buffers, self._fills):
+            buffer.extend([fill] * (row_count - len(buffer)))
+        return self._complete_rows()
+
+    def _complete_rows(self):
+        """Remove the values of complete rows from the buffers.
+
+        Returns
+        -------
+        iterator object
+            Named tuples of the removed values.
+
+        """
+
+        row_count = min(map(len, self._buffers), default=0)
+        if not row_count:
+            return iter(())
+        columns = []
+        for buffer in self._buffers:
+            columns.append(buffer[:row_count])
+            del buffer[:row_count]
+        return map(partial(tuple.__new__, self._named_tuple), zip(*columns))
+
+    def _check_open(self):
+        """Raise ValueError if the stream is closed."""
+
+        if self._closed:
+            raise ValueError("Can't push to a closed {}.".format(type(self).__name__))
@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+"""This module implements :func:`namedunzip`, the inverse of
+:func:`namedzip`, which collects the values of named tuple rows into
+columns.
+
+copyright: © 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+from array import array
+from itertools import chain, islice
+
+from . import _numpy_backend
+from .namedzip import _check_typecodes, _namedtuple_cache, sentinel
+
+INTO = ("list", "array", "numpy")
+
+
+def namedunzip(rows, **kwargs):
+    """Collects the values of rows into one column per field.
+
+    Rows are read in a single pass, a chunk at a time, and each chunk is
+    transposed and appended to the column builders, so no argument tuple
+    of all rows is created as with ``zip(*rows)``.
+
+    Parameters
+    ----------
+    rows : iterable
+        Named tuples, or other rows with a `_fields` attribute such as
+        those generated by `namedzip`. Plain tuples can be used if
+        `field_names` is specified.
+    into : {"list", "array", "numpy"}, optional
+        Type of the columns: lists, `array.array` objects requiring
+        `typecodes`, or NumPy arrays (default is "list").
+    typecodes : string or iterable, optional
+        `array.array` type code for each field, or a single type code for
+        all fields. Required if `into` is "array".
+    dtypes : object or list or tuple, optional
+        NumPy data type for each field as a list or tuple, or a single
+        data type for all fields, if `into` is "numpy". Inferred from
+        the values if not specified (default is None).
+    field_names : iterable, optional
+        Field names of the rows. Taken from `_fields` of the first row if
+        not specified (default is None).
+    typename : string, optional
+        Type name of the returned named tuple. Defaults to the type name
+        of the rows, so rows generated by `namedzip` are unzipped into an
+        instance of their own class.
+    chunk_size : int, optional
+        Number of rows transposed at a time (default is 4096).
+    chunked : bool, optional
+        Generate a named tuple of columns for every `chunk_size` rows
+        instead of returning one for all rows, so memory stays bounded
+        for streams which don't fit in memory (default is False).
+    **kwargs
+        Any additional keyword arguments will be passed on to the
+        `collections.namedtuple` factory function.
+
+    Returns
+    -------
+    named tuple object
+        Named tuple with a column for each field.
+    generator object
+        If `chunked` is True.
+
+    Raises
+    ------
+    ValueError
+        If `into` is not supported, `typecodes` are missing for "array",
+        the number of `typecodes` or `dtypes` does not match the fields,
+        `chunk_size` is not positive, fields can't be taken from the
+        first row, or a row doesn't have one value per field.
+    ImportError
+        If `into` is "numpy" and NumPy is not installed.
+
+    """
+
+    into = kwargs.pop("into", "list")
+    typecodes = kwargs.pop("typecodes", None)
+    dtypes = kwargs.pop("dtypes", None)
+    field_names = kwargs.pop("field_names", None)
+    typename = kwargs.pop("typename", None)
+    chunk_size = kwargs.pop("chunk_size", 4096)
+    chunked = kwargs.pop("chunked", False)
+    if into not in INTO:
+        raise ValueError(
+            "Unsupported into {!r}, expected one of {}.".format(
+                into, ", ".join(map(repr, INTO))
+            )
+        )
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive, not {}.".format(chunk_size))
+    rows = iter(rows)
+    first = next(rows, sentinel)
+    if first is not sentinel:
+        rows = chain((first,), rows)
+    if field_names is None:
+        field_names = getattr(first, "_fields", None)
+        if field_names is None:
+            raise ValueError(
+                "Can't take field names from {}, specify field_names.".format(
+                    "empty rows" if first is sentinel else type(first).__name__
+                )
+            )
+    if typename is None:
+        typename = type(first).__name__ if first is not sentinel else "Columns"
+    columns_tuple = _namedtuple_cache.get(typename, field_names, **kwargs)
+    field_count = len(columns_tuple._fields)
+    typecodes = _check_typecodes(typecodes, field_count)
+    if into == "array" and typecodes is None:
+        raise ValueError('into="array" requires typecodes.')
+    dtypes = _check_dtypes(dtypes, field_count)
+    builder = _Columns(into, typecodes, dtypes, field_count)
+    chunks = _transposed_chunks(rows, field_count, chunk_size)
+    if chunked:
+        return _unzip_chunks(chunks, builder, columns_tuple)
+    return tuple.__new__(columns_tuple, builder.join(chunks))
+
+
+def _unzip_chunks(chunks, builder, columns_tuple):
+    """Generates a named tuple of columns for every chunk."""
+
+    for chunk in chunks:
+        yield tuple.__new__(columns_tuple, builder.convert(chunk))
+
+
+def _transposed_chunks(rows, field_count, chunk_size):
+    """Generates the values of each chunk of rows as columns.
+
+    Yields
+    ------
+    list
+        Tuple of values for each field.
+
+    Raises
+    ------
+    ValueError
+        If a row doesn't have `field_count` values.
+
+    """
+
+    for chunk in iter(lambda: list(islice(rows, chunk_size)), []):
+        lengths = set(map(len, chunk))
+        if lengths != {field_count}:
+            raise ValueError(
+                "Row with {} values for {} fields.".format(
+                    max(lengths - {field_count}), field_count
+                )
+            )
+        yield list(zip(*chunk))
+
+
+class _Columns:
+    """Converts and joins transposed chunks into the requested type.
+
+    Parameters
+    ----------
+    into : {"list", "array", "numpy"}
+        Type of the columns.
+    typecodes : tuple or None
+        `array.array` type code for each field.
+    dtypes : tuple
+        NumPy data type for each field.
+    field_count : int
+        Number of fields.
+
+    """
+
+    __slots__ = ("into", "typecodes", "dtypes", "field_count")
+
+    def __init__(self, into, typecodes, dtypes, field_count):
+        self.into = into
+        self.typecodes = typecodes
+        self.dtypes = dtypes
+        self.field_count = field_count
+
+    def convert(self, chunk):
+        """Convert a transposed chunk to a list of columns."""
+
+        if self.into == "array":
+            return [array(code, values) for code, values in zip(self.typecodes, chunk)]
+        if self.into == "numpy":
+            return _numpy_backend.arrays(chunk, self.dtypes)
+        return [list(values) for values in chunk]
+
+    def join(self, chunks):
+        """Join transposed chunks into one column per field."""
+
+        if self.into == "numpy":
+            parts = [[] for _ in range(self.field_count)]
+            for chunk in chunks:
+                for part, values in zip(parts, self.convert(chunk)):
+                    part.append(values)
+            return [
+                _numpy_backend.concatenate(part, dtype)
+                for part, dtype in zip(parts, self.dtypes)
+            ]
+        if self.into == "array":
+            columns = [array(code) for code in self.typecodes]
+        else:
+            columns = [[] for _ in range(self.field_count)]
+        for chunk in chunks:
+            for column, values in zip(columns, chunk):
+                column.extend(values)
+        return columns
+
+
+def _check_dtypes(dtypes, field_count):
+    """Return a NumPy data type for each field.
+
+    Raises
+    ------
+    ValueError
+        If the number of `dtypes` does not match `field_count`.
+
+    """
+
+    if not isinstance(dtypes, (list, tuple)):
+        return (dtypes,) * field_count
+    dtypes = tuple(dtypes)
+    if len(dtypes) != field_count:
+        raise ValueError(
+            "Unequal number of field names ({}) and dtypes ({}).".format(
+                field_count, len(dtypes)
+            )
+        )
+    return dtypes
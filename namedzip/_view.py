@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""Lazy sequence views over zipped sequences.
+
+Implements :class:`NamedZipView`, returned by :func:`namedzip` and
+:func:`namedzip_longest` with the `as_view` option.
+
+copyright: © 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+from collections.abc import Mapping, Sequence
+from functools import partial
+from itertools import chain, repeat
+
+
+class NamedZipView(Sequence):
+    """Random access view of named tuples over zipped sequences.
+
+    Supports `len`, indexing and slicing without iterating, and can be
+    iterated any number of times. Only requested rows are built, and
+    slices are views themselves, so neither copies the sequences.
+
+    Parameters
+    ----------
+    sequences : tuple
+        Sequences supporting `len` and integer indexing, one per field
+        of `named_tuple`.
+    named_tuple : type
+        Named tuple class produced by `namedtuple` factory function.
+    fills : tuple or None, optional
+        Fill value for each sequence. If specified, the length of the
+        view follows the longest sequence and missing values are filled
+        in on access, otherwise it follows the shortest sequence
+        (default is None).
+
+    Raises
+    ------
+    TypeError
+        If any of `sequences` doesn't support `len` and indexing.
+
+    """
+
+    __slots__ = ("_sequences", "_named_tuple", "_fills", "_indices")
+
+    def __init__(self, sequences, named_tuple, fills=None):
+        for sequence in sequences:
+            if not _is_sequence(sequence):
+                raise TypeError(
+                    "as_view requires sequences, not {!r}.".format(
+                        type(sequence).__name__
+                    )
+                )
+        self._sequences = tuple(sequences)
+        self._named_tuple = named_tuple
+        self._fills = fills
+        # Row numbers of the underlying sequences for sliced views, or
+        # None for a view of all rows.
+        self._indices = None
+
+    def __len__(self):
+        if self._indices is not None:
+            return len(self._indices)
+        lengths = map(len, self._sequences)
+        if self._fills is None:
+            return min(lengths, default=0)
+        return max(lengths, default=0)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            view = NamedZipView.__new__(NamedZipView)
+            view._sequences = self._sequences
+            view._named_tuple = self._named_tuple
+            view._fills = self._fills
+            view._indices = self._rows()[index]
+            return view
+        rows = self._rows()
+        return self._build(rows[index])
+
+    def __iter__(self):
+        if self._indices is not None:
+            return map(self._build, self._indices)
+        # Full views are zipped in C, padding short sequences up front
+        # since all lengths are known.
+        if self._fills is None:
+            zipped = zip(*self._sequences)
+        else:
+            rows = len(self)
+            zipped = zip(
+                *(
+                    chain(sequence, repeat(fill, rows - len(sequence)))
+                    for sequence, fill in zip(self._sequences, self._fills)
+                )
+            )
+        return map(partial(tuple.__new__, self._named_tuple), zipped)
+
+    def __repr__(self):
+        return "<{} of {} {} rows>".format(
+            type(self).__name__, len(self), self._named_tuple.__name__
+        )
+
+    def _rows(self):
+        """Return the row numbers of the underlying sequences in the view."""
+
+        if self._indices is not None:
+            return self._indices
+        return range(len(self))
+
+    def _build(self, row):
+        """Build the named tuple for row number `row`."""
+
+        if self._fills is None:
+            values = [sequence[row] for sequence in self._sequences]
+        else:
+            values = [
+                sequence[row] if row < len(sequence) else fill
+                for sequence, fill in zip(self._sequences, self._fills)
+            ]
+        return tuple.__new__(self._named_tuple, values)
+
+
+def _is_sequence(obj):
+    """Check whether `obj` supports `len` and integer indexing."""
+
+    if isinstance(obj, Sequence):
+        return True
+    return (
+        not isinstance(obj, Mapping)
+        and hasattr(obj, "__len__")
+        and hasattr(obj, "__getitem__")
+    )
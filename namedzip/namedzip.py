@@ -1,23 +1,63 @@
 # -*- coding: utf-8 -*-
 """This module implements :func:`namedzip` and :func:`namedzip_longest`,
 which extend :func:`zip` and :func:`itertools.zip_longest` respectively
-to generate named tuples using :func:`collections.namedtuple`.
+to generate named tuples using :func:`collections.namedtuple`, the
+:class:`NamedZipper` objects they return for creating iterators, and
+:func:`namedzip_batches`, which generates blocks of columns instead.
 
 copyright: © 2019 by Erik R Berlin.
 license: MIT, see LICENSE for more details.
 
 """
 
-from collections import namedtuple
+import sys
+from _thread import allocate_lock
+from collections import OrderedDict, namedtuple
+from functools import partial
+from operator import itemgetter
+from itertools import chain, compress, islice, repeat, starmap, tee, zip_longest
+
+# Modules only needed by opt-in options (stats, types, prefetch, row_type,
+# backend, as_view, typecodes) are imported where they are used, so that
+# `import namedzip` stays as cheap as it was before those options existed.
+
+try:
+    from . import _namedzip as _speedups
+except ImportError:  # The optional C extension is not built.
+    _speedups = None
 
 sentinel = object()
 
+VIEW_BATCH_SIZE = 1024
+
+BACKENDS = ("python", "numpy", "auto")
+
+ROW_TYPES = ("namedtuple", "slots", "view")
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+# Options of `namedzip` and, with `_FILL_OPTIONS`, of `namedzip_longest`,
+# which are not passed on to `collections.namedtuple`.
+_ZIP_OPTIONS = (
+    "backend",
+    "row_type",
+    "typecodes",
+    "reuse",
+    "prefetch",
+    "as_view",
+    "stats",
+    "select",
+    "where",
+    "types",
+)
+_FILL_OPTIONS = ("fillvalue", "defaults")
+
 
 def namedzip(*iterables, typename, field_names, **kwargs):
     """Extends :func:`zip` to generate named tuples.
 
-    Returns a generator if `*iterables` are supplied, otherwise returns
-    a function for creating generators.
+    Returns an iterator if `*iterables` are supplied, otherwise returns
+    a picklable `NamedZipper` for creating iterators.
 
     Parameters
     ----------
@@ -29,37 +69,110 @@ def namedzip(*iterables, typename, field_names, **kwargs):
     field_names : iterable
         Field names for generated named tuple objects.Passed on to
         `collections.namedtuple` factory function.
+    backend : {"python", "numpy", "auto"}, optional
+        "numpy" returns a `numpy.recarray` with one field per iterable
+        instead of an iterator of named tuples. "auto" selects "numpy"
+        if all `*iterables` are NumPy arrays (default is "python").
+    row_type : {"namedtuple", "slots", "view"}, optional
+        Type of generated rows. "slots" generates instances of a compact
+        `__slots__` class, "view" generates flyweight rows reading their
+        values from shared batches of columns on attribute access. Both
+        provide attribute access by field name and `_fields`
+        (default is "namedtuple").
+    typecodes : string or iterable, optional
+        Only used with ``row_type="view"``. Columns with an
+        `array.array` type code store their values unboxed, see
+        `namedzip_batches` (default is None).
+    reuse : bool, optional
+        Generate one mutable record for all rows, overwriting its values
+        in place on every step instead of allocating a new row. The
+        record must not be kept beyond the current iteration step; use
+        its `_asnamedtuple` method to keep a copy (default is False).
+    prefetch : int, optional
+        Read ahead up to `prefetch` values from every iterable in a
+        background thread, so slow or I/O-bound iterables are read
+        concurrently. Exceptions raised by an iterable are raised again
+        when its value is needed (default is 0, no prefetching).
+    as_view : bool, optional
+        Return a `NamedZipView` supporting `len`, indexing, slicing and
+        repeated iteration, if all `*iterables` are sequences. Rows are
+        only built when accessed (default is False).
+    stats : ZipStats, optional
+        Collector recording rows produced, rows with fill values, where
+        each iterable was exhausted and time spent waiting on each of
+        them. Overrides a collector installed with `set_default_stats`
+        for all calls, which is not used with the numpy backend or
+        `as_view` (default is None, no instrumentation).
+    select : iterable, optional
+        Subset of `field_names` to generate rows of, in the given order.
+        Rows are instances of a named tuple class with only these fields,
+        and other values are dropped before rows are built (default is
+        None, all fields).
+    where : dict, optional
+        Predicate for each of any number of `field_names`, called with
+        the raw value of the field. Only rows for which all predicates
+        are true are built and generated, e.g. ``{"price": bool}``
+        (default is None).
+    types : dict, optional
+        Callable or NumPy data type for each of any number of
+        `field_names`, e.g. ``{"price": float, "qty": "i4"}``. Values are
+        converted per column, in batches of up to 1024, before rows are
+        built and before `where` predicates are applied. NumPy arrays
+        are cast with vectorized operations if the type is a data type
+        or one of `bool`, `int`, `float`, `complex` and `str`
+        (default is None).
     **kwargs : type
         Any additional keyword arguments will also be passed on to the
         `collections.namedtuple` factory function.
 
     Returns
     -------
-    generator object
+    iterator object
         If `*iterables` are supplied.
-    function object
+    NamedZipView
+        If `*iterables` are supplied and `as_view` is True.
+    numpy.recarray
+        If `*iterables` are supplied and the numpy backend is used.
+    NamedZipper
         If `*iterables` are not supplied.
 
-    """
+    Raises
+    ------
+    ValueError
+        If `backend` or `row_type` is not supported, if `prefetch` is
+        negative, if `typecodes` are specified for other row types than
+        "view", if `reuse` is combined with a `row_type` other than
+        "namedtuple", or if `as_view` is combined with any of these
+        options or `prefetch`, if a `backend` other than "python" is
+        combined with `row_type`, `reuse` or `prefetch`, if `stats` is
+        combined with `as_view` or a `backend` other than "python", or
+        if `select` or `where` name unknown fields or are combined with
+        `as_view`, ``row_type="view"`` or such a `backend`, if `types`
+        name unknown fields or invalid data types or are combined with
+        `as_view` or such a `backend`, or if a value can't be converted,
+        naming its field and row index.
+    TypeError
+        If `as_view` is True and any of `*iterables` is not a sequence.
 
-    named_tuple = namedtuple(typename, field_names, **kwargs)
+    Notes
+    -----
+    With ``row_type="view"``, or for fields with `types`, up to 1024
+    values are read ahead from every such iterable at a time.
 
-    def _namedzip_factory(*iterables):
-        _compare_iterables_to_fields(len(iterables), len(named_tuple._fields))
-        zipped = _create_zip(*iterables)
-        return _namedzip_generator(zipped, named_tuple)
+    """
 
+    zipper = NamedZipper(typename, field_names, **kwargs)
     if iterables:
-        return _namedzip_factory(*iterables)
+        return zipper(*iterables)
     else:
-        return _namedzip_factory
+        return zipper
 
 
 def namedzip_longest(*iterables, typename, field_names, **kwargs):
     """Extends :func:`itertools.zip_longest` to generate named tuples.
 
-    Returns a generator if `*iterables` are supplied, otherwise returns
-    a function for creating generators.
+    Returns an iterator if `*iterables` are supplied, otherwise returns
+    a picklable `NamedZipper` for creating iterators.
 
     Parameters
     ----------
@@ -78,52 +191,937 @@ def namedzip_longest(*iterables, typename, field_names, **kwargs):
         Individual default values for each iterable to zip. Overrides
         custom `fillvalue` if specified, and length must match the
         number of `*iterables` supplied.
+    backend : {"python", "numpy", "auto"}, optional
+        "numpy" returns a `numpy.recarray` with one field per iterable
+        instead of an iterator of named tuples, filling in missing
+        values with vectorized operations. "auto" selects "numpy" if all
+        `*iterables` are NumPy arrays (default is "python").
+    row_type : {"namedtuple", "slots", "view"}, optional
+        Type of generated rows. "slots" generates instances of a compact
+        `__slots__` class, "view" generates flyweight rows reading their
+        values from shared batches of columns on attribute access. Both
+        provide attribute access by field name and `_fields`
+        (default is "namedtuple").
+    typecodes : string or iterable, optional
+        Only used with ``row_type="view"``. Columns with an
+        `array.array` type code store their values unboxed, see
+        `namedzip_batches` (default is None).
+    reuse : bool, optional
+        Generate one mutable record for all rows, overwriting its values
+        in place on every step instead of allocating a new row. The
+        record must not be kept beyond the current iteration step; use
+        its `_asnamedtuple` method to keep a copy (default is False).
+    prefetch : int, optional
+        Read ahead up to `prefetch` values from every iterable in a
+        background thread, so slow or I/O-bound iterables are read
+        concurrently. Exceptions raised by an iterable are raised again
+        when its value is needed (default is 0, no prefetching).
+    as_view : bool, optional
+        Return a `NamedZipView` supporting `len`, indexing, slicing and
+        repeated iteration, if all `*iterables` are sequences. Rows are
+        only built when accessed (default is False).
+    stats : ZipStats, optional
+        Collector recording rows produced, rows with fill values, where
+        each iterable was exhausted and time spent waiting on each of
+        them. Overrides a collector installed with `set_default_stats`
+        for all calls, which is not used with the numpy backend or
+        `as_view` (default is None, no instrumentation).
+    select : iterable, optional
+        Subset of `field_names` to generate rows of, in the given order.
+        Rows are instances of a named tuple class with only these fields,
+        and other values are dropped before rows are built (default is
+        None, all fields).
+    where : dict, optional
+        Predicate for each of any number of `field_names`, called with
+        the raw value of the field. Only rows for which all predicates
+        are true are built and generated, e.g. ``{"price": bool}``
+        (default is None).
+    types : dict, optional
+        Callable or NumPy data type for each of any number of
+        `field_names`, e.g. ``{"price": float, "qty": "i4"}``. Values are
+        converted per column, in batches of up to 1024, before rows are
+        built and before `where` predicates are applied. NumPy arrays
+        are cast with vectorized operations if the type is a data type
+        or one of `bool`, `int`, `float`, `complex` and `str`
+        (default is None).
     **kwargs
         Any additional keyword arguments will be passed on to the
         `collections.namedtuple` factory function.
 
     Returns
     -------
-    generator object
+    iterator object
         If `*iterables` are supplied.
-    function object
+    NamedZipView
+        If `*iterables` are supplied and `as_view` is True.
+    numpy.recarray
+        If `*iterables` are supplied and the numpy backend is used.
+    NamedZipper
         If `*iterables` are not supplied.
 
     Raises
     ------
     ValueError
         If `defaults` are specified but do not match the number of
-        `field_names`.
+        `field_names`, if `backend` or `row_type` is not supported, if
+        `prefetch` is negative, if `typecodes` are specified for other
+        row types than "view", if `reuse` is combined with a `row_type`
+        other than "namedtuple", if `as_view` is combined with any of
+        these options or `prefetch`, if a `backend` other than "python"
+        is combined with `row_type`, `reuse` or `prefetch`, if `stats`
+        is combined with `as_view` or a `backend` other than "python",
+        or if `select` or `where` name unknown fields or are combined
+        with `as_view`, ``row_type="view"`` or such a `backend`, if
+        `types` name unknown fields or invalid data types or are
+        combined with `as_view` or such a `backend`, or if a fill value
+        or a value can't be converted, naming its field and row index.
+    TypeError
+        If `as_view` is True and any of `*iterables` is not a sequence.
 
     Notes
     -----
     Does not utilize the functionality of `collections.namedtuple` for
-    setting default values.
+    setting default values. With ``row_type="view"``, or for fields
+    with `types`, up to 1024 values are read ahead from every such
+    iterable at a time. Fill values of typed fields are converted once,
+    when the `NamedZipper` is created; None is kept as is.
+
+    """
+
+    zipper = NamedZipper(typename, field_names, longest=True, **kwargs)
+    if iterables:
+        return zipper(*iterables)
+    else:
+        return zipper
+
+
+class NamedZipper:
+    """Picklable function object creating named tuple iterators.
+
+    Returned by `namedzip` and `namedzip_longest` if no `*iterables` are
+    supplied, and calling it with iterables is the same as passing them
+    to these functions. Instances only hold the arguments they were
+    created with, so they can be pickled, e.g. to be sent to worker
+    processes, which rebuild the named tuple class from their own
+    process-wide cache when unpickling.
+
+    Parameters
+    ----------
+    typename : string
+        Type name for generated named tuple objects. Passed on to
+        `collections.namedtuple` factory function.
+    field_names : iterable
+        Field names for generated named tuple objects. Passed on to
+        `collections.namedtuple` factory function.
+    longest : bool, optional
+        Behave like `namedzip_longest` instead of `namedzip`, including
+        its `fillvalue` and `defaults` options (default is False).
+    **kwargs
+        Options of `namedzip` or `namedzip_longest`. Any additional
+        keyword arguments will be passed on to the
+        `collections.namedtuple` factory function.
+
+    Raises
+    ------
+    ValueError
+        If options are invalid, as described for `namedzip` and
+        `namedzip_longest`.
+
+    Notes
+    -----
+    Pickling fails if options hold objects which can't be pickled, e.g.
+    `where` predicates defined with ``lambda`` or a `ZipStats`
+    collector.
+
+    """
+
+    __slots__ = (
+        "_key",
+        "_longest",
+        "_options",
+        "_named_tuple",
+        "_row_tuple",
+        "_backend",
+        "_row_type",
+        "_typecodes",
+        "_indices",
+        "_predicates",
+        "_converters",
+        "_plain_rows",
+        "_fills",
+        "_defaults",
+        "_fillvalue",
+        "_reuse",
+        "_prefetch",
+        "_as_view",
+        "_stats",
+    )
+
+    def __init__(self, typename, field_names, longest=False, **kwargs):
+        options = {name: kwargs.pop(name) for name in _ZIP_OPTIONS if name in kwargs}
+        if longest:
+            options.update(
+                (name, kwargs.pop(name)) for name in _FILL_OPTIONS if name in kwargs
+            )
+        backend = _check_backend(options.get("backend", "python"))
+        row_type = _check_row_type(options.get("row_type", "namedtuple"))
+        reuse = options.get("reuse", False)
+        prefetch = options.get("prefetch", 0)
+        if prefetch < 0:
+            raise ValueError("prefetch must not be negative, not {}.".format(prefetch))
+        as_view = options.get("as_view", False)
+        select = options.get("select")
+        if select is not None:
+            # Normalized, so options stay picklable and one-shot iterables
+            # are only consumed once.
+            if isinstance(select, str):
+                select = [select]
+            select = options["select"] = tuple(select)
+        where = options.get("where")
+        types = options.get("types")
+        if reuse and row_type != "namedtuple":
+            raise ValueError(
+                "reuse can't be combined with row_type={!r}.".format(row_type)
+            )
+        if as_view and (
+            backend != "python" or row_type != "namedtuple" or reuse or prefetch
+        ):
+            raise ValueError(
+                "as_view can't be combined with backend, row_type, reuse or prefetch."
+            )
+        if backend != "python" and (row_type != "namedtuple" or reuse or prefetch):
+            raise ValueError(
+                "backend can't be combined with row_type, reuse or prefetch."
+            )
+        if options.get("stats") is not None and (as_view or backend != "python"):
+            raise ValueError("stats can't be combined with as_view or backend.")
+        if (select is not None or where) and (
+            as_view or backend != "python" or row_type == "view"
+        ):
+            raise ValueError(
+                "select and where can't be combined with as_view, backend or "
+                'row_type="view".'
+            )
+        if types and (as_view or backend != "python"):
+            raise ValueError("types can't be combined with as_view or backend.")
+        # Normalized, so one-shot iterables are only consumed once.
+        key = _cache_key(typename, field_names, kwargs)
+        typename, field_names, kwargs = key[0], key[1], dict(key[2])
+        named_tuple = _namedtuple_cache.get(typename, field_names, **kwargs)
+        fields = named_tuple._fields
+        self._typecodes = _check_view_typecodes(
+            options.get("typecodes"), row_type, len(fields)
+        )
+        if "typecodes" in options:
+            options["typecodes"] = self._typecodes
+        converters = None
+        if types:
+            from . import _convert
+
+            converters = _convert.check_types(types, fields)
+        indices, predicates = _check_pushdown(fields, select, where)
+        row_tuple = named_tuple
+        if indices is not None:
+            row_tuple = _namedtuple_cache.get(
+                typename, [fields[i] for i in indices], **kwargs
+            )
+            if row_tuple is named_tuple:
+                indices = None  # All fields selected in order.
+        defaults = fills = None
+        if longest:
+            defaults = _check_defaults(options.get("defaults"), len(fields))
+            if "defaults" in options:
+                options["defaults"] = defaults  # Before conversion by types.
+            fills = defaults or (options.get("fillvalue"),) * len(fields)
+            if converters is not None:
+                converted = _convert.convert_fills(fills, converters, fields)
+                if any(a is not b for a, b in zip(converted, fills)):
+                    fills = defaults = converted
+        self._key = key
+        self._longest = longest
+        self._options = options
+        self._named_tuple = named_tuple
+        self._row_tuple = row_tuple
+        self._backend = backend
+        self._row_type = row_type
+        self._indices = indices
+        self._predicates = predicates
+        self._converters = converters
+        self._plain_rows = (
+            row_type == "namedtuple"
+            and not reuse
+            and not predicates
+            and indices is None
+        )
+        self._fills = fills
+        self._defaults = defaults
+        self._fillvalue = options.get("fillvalue")
+        self._reuse = reuse
+        self._prefetch = prefetch
+        self._as_view = as_view
+        self._stats = options.get("stats")
+
+    def __repr__(self):
+        return "{}({!r}, {!r}, longest={!r})".format(
+            type(self).__name__, self._key[0], self._key[1], self._longest
+        )
+
+    def __reduce__(self):
+        return _restore_zipper, (self._key, self._longest, self._options)
+
+    @property
+    def named_tuple(self):
+        """type: Named tuple class of the generated rows."""
+
+        return self._named_tuple
+
+    @property
+    def longest(self):
+        """bool: Whether iterables are zipped like `namedzip_longest`."""
+
+        return self._longest
+
+    def __call__(self, *iterables):
+        """Return an iterator of named tuples aggregating `*iterables`.
+
+        Returns
+        -------
+        iterator object
+        NamedZipView
+            If `as_view` is True.
+        numpy.recarray
+            If the numpy backend is used.
+
+        """
+
+        named_tuple = self._named_tuple
+        fields = named_tuple._fields
+        longest = self._longest
+        fills = self._fills
+        _compare_iterables_to_fields(len(iterables), len(fields))
+        if self._as_view:
+            from ._view import NamedZipView
+
+            if longest:
+                return NamedZipView(iterables, named_tuple, fills)
+            return NamedZipView(iterables, named_tuple)
+        if _use_numpy(self._backend, iterables):
+            from . import _numpy_backend
+
+            if longest:
+                return _numpy_backend.records(
+                    iterables, fields, longest=True, fills=fills
+                )
+            return _numpy_backend.records(iterables, fields)
+        if self._prefetch:
+            iterables = _prefetch_all(iterables, self._prefetch)
+        collector = self._stats
+        if collector is None:
+            collector = _get_default_stats()
+        if collector is not None:
+            from . import _stats
+
+            run, iterables = _stats.instrument_sources(
+                iterables, fields, longest=longest
+            )
+        if self._converters is not None:
+            from . import _convert
+
+            iterables = _convert.convert_columns(iterables, self._converters, fields)
+        if self._row_type == "view":
+            from . import _rows
+
+            batches = _namedzip_batch_generator(
+                [iter(it) for it in iterables],
+                named_tuple,
+                VIEW_BATCH_SIZE,
+                longest=longest,
+                fills=fills,
+                typecodes=self._typecodes,
+            )
+            rows = _rows.view_rows(batches, _rows.view_class(named_tuple))
+        elif self._plain_rows and _speedups is not None:
+            if longest:
+                rows = _speedups.zip_rows(named_tuple, iterables, fills)
+            else:
+                rows = _speedups.zip_rows(named_tuple, iterables)
+        else:
+            selectors = None
+            if self._predicates:
+                iterables, selectors = _probe_columns(
+                    iterables, self._predicates, fills
+                )
+                if collector is not None and longest:
+                    selectors = _stats.count_filled(selectors, run)
+            zipped = _create_zip(
+                *iterables,
+                fillvalue=self._fillvalue,
+                type_longest=longest,
+                defaults=self._defaults
+            )
+            if selectors is not None or self._indices is not None:
+                zipped = _pushdown(zipped, selectors, self._indices)
+            rows = _build_rows(zipped, self._row_tuple, self._row_type, self._reuse)
+        if collector is not None:
+            return _stats.instrument_rows(rows, run, collector)
+        return rows
+
+    def map_chunks(self, chunks):
+        """Generates the rows of every chunk of iterables as a list.
+
+        Parameters
+        ----------
+        chunks : iterable
+            Sequences of iterables, one iterable per field, e.g. blocks
+            of columns of a larger data set.
+
+        Yields
+        ------
+        list
+            Rows aggregating the iterables of a chunk.
+
+        """
+
+        for chunk in chunks:
+            yield list(self(*chunk))
+
+
+def _restore_zipper(key, longest, options):
+    """Recreate a `NamedZipper` pickled by `NamedZipper.__reduce__`.
+
+    Parameters
+    ----------
+    key : tuple
+        Cache key of the named tuple class, see `_cache_key`.
+    longest : bool
+        Whether the zipper behaves like `namedzip_longest`.
+    options : dict
+        Options of `namedzip` or `namedzip_longest`.
+
+    Returns
+    -------
+    NamedZipper
+
+    """
+
+    typename, field_names, kwargs = key
+    kwargs = dict(kwargs)
+    kwargs.update(options)
+    return NamedZipper(typename, field_names, longest=longest, **kwargs)
+
+
+def namedzip_batches(*iterables, typename, field_names, batch_size=1024, **kwargs):
+    """Aggregates iterables into named tuples of column batches.
+
+    Instead of one named tuple per row, each generated named tuple holds
+    up to `batch_size` values per field, as a list or `array.array`.
+    This avoids allocating a tuple for every row when rows are passed
+    on in bulk.
+
+    Returns a generator if `*iterables` are supplied, otherwise returns
+    a function for creating generators.
+
+    Parameters
+    ----------
+    *iterables : iterable, optional
+        Iterable objects passed as positional arguments.
+    typename : string
+        Type name for generated named tuple objects. Passed on to
+        `collections.namedtuple` factory function.
+    field_names : iterable
+        Field names for generated named tuple objects. Passed on to
+        `collections.namedtuple` factory function.
+    batch_size : int, optional
+        Maximum number of rows per batch (default is 1024).
+    longest : bool, optional
+        Continue until the longest iterable is exhausted, filling in
+        missing values like `namedzip_longest` (default is False).
+    fillvalue : type, optional
+        Missing value used if `longest` is True (default is None).
+    defaults : iterable, optional
+        Individual default values for each iterable if `longest` is
+        True. Overrides `fillvalue` if specified.
+    typecodes : string or iterable, optional
+        `array.array` type code for each field, or a single type code
+        for all fields. Fields with a type code of None are returned as
+        lists (default is None, all fields are lists).
+    **kwargs
+        Any additional keyword arguments will be passed on to the
+        `collections.namedtuple` factory function.
+
+    Returns
+    -------
+    generator object
+        If `*iterables` are supplied.
+    function object
+        If `*iterables` are not supplied.
+
+    Raises
+    ------
+    ValueError
+        If `batch_size` is not positive, or if `defaults` or
+        `typecodes` do not match the number of `field_names`.
+
+    Notes
+    -----
+    Up to `batch_size` values are read from every iterable per batch,
+    so unlike `zip`, iterables longer than the shortest one may be
+    advanced past the last generated row.
 
     """
 
+    longest = kwargs.pop("longest", False)
     fillvalue = kwargs.pop("fillvalue", None)
     defaults = kwargs.pop("defaults", None)
-    named_tuple = namedtuple(typename, field_names, **kwargs)
-    if defaults and len(defaults) != len(named_tuple._fields):
+    typecodes = kwargs.pop("typecodes", None)
+    named_tuple = _namedtuple_cache.get(typename, field_names, **kwargs)
+    field_count = len(named_tuple._fields)
+    if batch_size < 1:
+        raise ValueError("batch_size must be positive, not {}.".format(batch_size))
+    defaults = _check_defaults(defaults, field_count)
+    fills = defaults if defaults is not None else (fillvalue,) * field_count
+    typecodes = _check_typecodes(typecodes, field_count)
+
+    def _namedzip_batches_factory(*iterables):
+        _compare_iterables_to_fields(len(iterables), field_count)
+        iterators = [iter(it) for it in iterables]
+        return _namedzip_batch_generator(
+            iterators, named_tuple, batch_size, longest, fills, typecodes
+        )
+
+    if iterables:
+        return _namedzip_batches_factory(*iterables)
+    else:
+        return _namedzip_batches_factory
+
+
+def namedtuple_cache_info():
+    """Report statistics for the named tuple class cache.
+
+    Returns
+    -------
+    CacheInfo
+        Named tuple with `hits`, `misses`, `maxsize` and `currsize`
+        fields, mirroring :func:`functools.lru_cache`.
+
+    """
+
+    return _namedtuple_cache.info()
+
+
+def namedtuple_cache_clear():
+    """Clear the named tuple class cache and its statistics."""
+
+    _namedtuple_cache.clear()
+
+
+class _NamedTupleCache:
+    """Bounded, thread-safe LRU cache of named tuple classes.
+
+    Classes are keyed on `typename`, normalized `field_names` and any
+    keyword arguments for `collections.namedtuple`, so the same key
+    always returns the identical class object, even after it has been
+    evicted or the cache cleared, as long as the class is alive.
+    Instances of cached classes are pickled by key, so they can be
+    unpickled in other processes without the class being importable.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Maximum number of cached classes. The least recently used class
+        is evicted once the limit is exceeded (default is 128).
+
+    """
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._classes = OrderedDict()
+        # Every class created, never evicted, so instances which outlive
+        # their class's cache entry still copy and unpickle to it. Created
+        # on the first miss, so importing the module doesn't import weakref.
+        self._created = None
+        self._lock = allocate_lock()
+
+    def get(self, typename, field_names, **kwargs):
+        """Return a cached named tuple class, creating it if needed.
+
+        Parameters
+        ----------
+        typename : string
+            Passed on to `collections.namedtuple` factory function.
+        field_names : iterable
+            Passed on to `collections.namedtuple` factory function.
+        **kwargs
+            Passed on to `collections.namedtuple` factory function.
+
+        Returns
+        -------
+        type
+            Named tuple class.
+
+        """
+
+        key = _cache_key(typename, field_names, kwargs)
+        # Build from the normalized key, since one-shot iterables supplied as
+        # `field_names` or `defaults` have been consumed by now.
+        typename, field_names, options = key
+        kwargs = dict(options)
+        try:
+            hash(key)
+        except TypeError:
+            # Unhashable arguments (e.g. list defaults holding lists) can't
+            # be cached, so fall back to building a fresh class.
+            with self._lock:
+                self.misses += 1
+            return namedtuple(typename, field_names, **kwargs)
+
+        with self._lock:
+            try:
+                named_tuple = self._classes[key]
+            except KeyError:
+                pass
+            else:
+                self._classes.move_to_end(key)
+                self.hits += 1
+                return named_tuple
+            # Create while holding the lock, so concurrent callers can never
+            # end up with two distinct classes for the same key.
+            if self._created is None:
+                import weakref
+
+                self._created = weakref.WeakValueDictionary()
+            named_tuple = self._created.get(key)
+            if named_tuple is None:
+                named_tuple = namedtuple(typename, field_names, **kwargs)
+                named_tuple._namedzip_key = key
+                named_tuple.__reduce__ = _reduce_row
+                self._created[key] = named_tuple
+            self.misses += 1
+            self._classes[key] = named_tuple
+            if len(self._classes) > self.maxsize:
+                self._classes.popitem(last=False)
+            return named_tuple
+
+    def info(self):
+        """Return a `CacheInfo` named tuple for the cache."""
+
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._classes))
+
+    def clear(self):
+        """Remove all cached classes and reset statistics."""
+
+        with self._lock:
+            self._classes.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+def _cache_key(typename, field_names, kwargs):
+    """Build a cache key for `_NamedTupleCache`.
+
+    Field names are normalized the same way `collections.namedtuple`
+    does, so that ``"a b"``, ``"a, b"`` and ``["a", "b"]`` share a key.
+
+    Parameters
+    ----------
+    typename : string
+        Type name for the named tuple class.
+    field_names : iterable
+        Field names for the named tuple class.
+    kwargs : dict
+        Additional `collections.namedtuple` keyword arguments.
+
+    Returns
+    -------
+    tuple
+
+    """
+
+    if isinstance(field_names, str):
+        field_names = field_names.replace(",", " ").split()
+    field_names = tuple(map(str, field_names))
+    options = []
+    for name, value in sorted(kwargs.items()):
+        if name == "defaults" and value is not None:
+            value = tuple(value)
+        options.append((name, value))
+    return (str(typename), field_names, tuple(options))
+
+
+def _reduce_row(row):
+    """Pickle support for instances of cached named tuple classes.
+
+    Parameters
+    ----------
+    row : named tuple object
+        Instance of a class created by `_NamedTupleCache`.
+
+    Returns
+    -------
+    tuple
+        Calls `_restore_row` with the cache key and values of `row`.
+
+    """
+
+    return _restore_row, (type(row)._namedzip_key, tuple(row))
+
+
+def _restore_row(key, values):
+    """Recreate a named tuple object pickled by `_reduce_row`.
+
+    The class is looked up with `_NamedTupleCache.get`, which returns
+    the original class if it is still alive, and creates it otherwise.
+
+    Parameters
+    ----------
+    key : tuple
+        Cache key of the named tuple class, see `_cache_key`.
+    values : tuple
+        Field values.
+
+    Returns
+    -------
+    named tuple object
+
+    """
+
+    typename, field_names, options = key
+    named_tuple = _namedtuple_cache.get(typename, field_names, **dict(options))
+    return tuple.__new__(named_tuple, values)
+
+
+_namedtuple_cache = _NamedTupleCache()
+
+
+def _check_defaults(defaults, field_count):
+    """Validate individual default values against the number of fields.
+
+    Parameters
+    ----------
+    defaults : iterable or None
+        Default values for each field.
+    field_count : int
+        Number of named tuple field names.
+
+    Returns
+    -------
+    tuple or None
+        `defaults` as a tuple, or None if no defaults were given.
+
+    Raises
+    ------
+    ValueError
+        If the number of `defaults` is not equal to `field_count`.
+
+    """
+
+    if defaults is None:
+        return None
+    # Precompute the fill tuple once, so one-shot iterables work too.
+    defaults = tuple(defaults)
+    if len(defaults) != field_count:
         raise ValueError(
             "Unequal number of field names ({}) and default values ({}).".format(
-                len(named_tuple._fields), len(defaults)
+                field_count, len(defaults)
             )
         )
-    elif defaults is not None:
-        # Override fillvalue if individual defaults are specified.
-        fillvalue = sentinel
+    return defaults
 
-    def _namedzip_longest_factory(*iterables):
-        _compare_iterables_to_fields(len(iterables), len(named_tuple._fields))
-        zipped = _create_zip(*iterables, fillvalue=fillvalue, type_longest=True)
-        return _namedzip_generator(zipped, named_tuple, defaults)
 
-    if iterables:
-        return _namedzip_longest_factory(*iterables)
-    else:
-        return _namedzip_longest_factory
+def _check_typecodes(typecodes, field_count):
+    """Validate `array.array` type codes against the number of fields.
+
+    Parameters
+    ----------
+    typecodes : string or iterable or None
+        Type code for each field, or a single type code for all fields.
+    field_count : int
+        Number of named tuple field names.
+
+    Returns
+    -------
+    tuple or None
+        Type code for each field, or None if no type codes were given.
+
+    Raises
+    ------
+    ValueError
+        If the number of `typecodes` is not equal to `field_count`.
+
+    """
+
+    if typecodes is None:
+        return None
+    if isinstance(typecodes, str) and len(typecodes) == 1:
+        typecodes = typecodes * field_count
+    typecodes = tuple(typecodes)
+    if len(typecodes) != field_count:
+        raise ValueError(
+            "Unequal number of field names ({}) and type codes ({}).".format(
+                field_count, len(typecodes)
+            )
+        )
+    return typecodes
+
+
+def _check_backend(backend):
+    """Validate the name of a backend.
+
+    Parameters
+    ----------
+    backend : string
+        One of the names in `BACKENDS`.
+
+    Returns
+    -------
+    string
+        `backend`, unchanged.
+
+    Raises
+    ------
+    ValueError
+        If `backend` is not supported.
+
+    """
+
+    if backend not in BACKENDS:
+        raise ValueError(
+            "Unsupported backend {!r}, expected one of {}.".format(
+                backend, ", ".join(map(repr, BACKENDS))
+            )
+        )
+    return backend
+
+
+def _use_numpy(backend, iterables):
+    """Decide whether to aggregate `iterables` with the numpy backend.
+
+    Parameters
+    ----------
+    backend : string
+        One of the names in `BACKENDS`.
+    iterables : tuple
+        Iterable objects to aggregate.
+
+    Returns
+    -------
+    bool
+
+    """
+
+    if backend == "auto":
+        from . import _numpy_backend
+
+        return bool(iterables) and all(map(_numpy_backend.is_ndarray, iterables))
+    return backend == "numpy"
+
+
+def _check_row_type(row_type):
+    """Validate the name of a row type.
+
+    Parameters
+    ----------
+    row_type : string
+        One of the names in `ROW_TYPES`.
+
+    Returns
+    -------
+    string
+        `row_type`, unchanged.
+
+    Raises
+    ------
+    ValueError
+        If `row_type` is not supported.
+
+    """
+
+    if row_type not in ROW_TYPES:
+        raise ValueError(
+            "Unsupported row_type {!r}, expected one of {}.".format(
+                row_type, ", ".join(map(repr, ROW_TYPES))
+            )
+        )
+    return row_type
+
+
+def _check_view_typecodes(typecodes, row_type, field_count):
+    """Validate type codes for flyweight view rows.
+
+    Parameters
+    ----------
+    typecodes : string or iterable or None
+        Type code for each field, or a single type code for all fields.
+    row_type : string
+        One of the names in `ROW_TYPES`.
+    field_count : int
+        Number of named tuple field names.
+
+    Returns
+    -------
+    tuple or None
+        Type code for each field, or None if no type codes were given.
+
+    Raises
+    ------
+    ValueError
+        If `typecodes` are given for other row types than "view", or do
+        not match `field_count`.
+
+    """
+
+    if typecodes is not None and row_type != "view":
+        raise ValueError('typecodes can only be used with row_type="view".')
+    return _check_typecodes(typecodes, field_count)
+
+
+def _check_pushdown(fields, select, where):
+    """Validate `select` and `where` options against field names.
+
+    Parameters
+    ----------
+    fields : tuple
+        Field names of the named tuple class.
+    select : iterable or None
+        Names of the fields to keep.
+    where : dict or None
+        Predicate for each of any number of fields.
+
+    Returns
+    -------
+    tuple
+        Indices of the selected fields, or None to keep all fields, and
+        a list of ``(index, predicate)`` pairs.
+
+    Raises
+    ------
+    ValueError
+        If `select` or `where` name fields which are not in `fields`,
+        or `select` is empty.
+
+    """
+
+    names = list(where or ())
+    if select is not None:
+        select = [select] if isinstance(select, str) else list(select)
+        if not select:
+            raise ValueError("select requires at least one field name.")
+        names.extend(select)
+    unknown = sorted(set(names).difference(fields))
+    if unknown:
+        raise ValueError(
+            "Unknown field names in select or where: {}.".format(", ".join(unknown))
+        )
+    indices = None
+    if select is not None:
+        indices = tuple(fields.index(name) for name in select)
+    predicates = [
+        (fields.index(name), predicate) for name, predicate in (where or {}).items()
+    ]
+    return indices, predicates
 
 
 def _compare_iterables_to_fields(iterable_count, field_count):
@@ -151,11 +1149,56 @@ def _compare_iterables_to_fields(iterable_count, field_count):
         )
 
 
-def _create_zip(*iterables, fillvalue=None, type_longest=False):
+def _get_default_stats():
+    """Return the default `ZipStats` collector, or None.
+
+    `namedzip._stats` is not imported for the lookup: unless it has been
+    imported, no default collector can have been installed.
+
+    """
+
+    stats = sys.modules.get(__package__ + "._stats")
+    return None if stats is None else stats.get_default_stats()
+
+
+def _prefetch_all(iterables, size):
+    """Wrap every iterable in a `namedzip._prefetch.Prefetcher`.
+
+    Parameters
+    ----------
+    iterables : tuple
+        Iterable objects to read ahead from.
+    size : int
+        Maximum number of values read ahead per iterable.
+
+    Returns
+    -------
+    tuple
+        Prefetching iterators, which stop their threads when closed or
+        garbage collected.
+
+    """
+
+    from . import _prefetch
+
+    prefetchers = []
+    try:
+        for iterable in iterables:
+            prefetchers.append(_prefetch.Prefetcher(iterable, size))
+    except BaseException:
+        for prefetcher in prefetchers:
+            prefetcher.close()
+        raise
+    return tuple(prefetchers)
+
+
+def _create_zip(*iterables, fillvalue=None, type_longest=False, defaults=None):
     """Zips supplied iterables and returns a generator.
 
     Aggregates `*iterables` using `zip` or `itertools.zip_longest`,
-    depending on the value of the `type_longest` parameter.
+    depending on the value of the `type_longest` parameter. If
+    individual `defaults` are given, missing values are filled in by
+    `_zip_with_defaults` instead.
 
     Parameters
     ----------
@@ -168,6 +1211,10 @@ def _create_zip(*iterables, fillvalue=None, type_longest=False):
     type_longest : bool, optional
         Specifies whether to use `zip_longest` over `zip`. Used by
         `namedzip_longest`. (default is False).
+    defaults : tuple or None, optional
+        Individual default value for each iterable. Overrides
+        `fillvalue`, only used if `type_longest` is True.
+        (default is None).
 
     Returns
     ------
@@ -175,39 +1222,225 @@ def _create_zip(*iterables, fillvalue=None, type_longest=False):
 
     """
 
-    if type_longest:
-        from itertools import zip_longest
-
+    if type_longest and defaults is not None:
+        zipped = _zip_with_defaults(iterables, defaults)
+    elif type_longest:
         zipped = zip_longest(*iterables, fillvalue=fillvalue)
     else:
         zipped = zip(*iterables)
     return zipped
 
 
-def _namedzip_generator(zipped, named_tuple, defaults=None):
-    """Generates named tuple objects.
+def _zip_with_defaults(iterables, defaults):
+    """Zips iterables, padding exhausted ones with individual defaults.
+
+    Each iterable is chained with a padding generator that takes over
+    once the iterable runs out, repeating its default value until the
+    last iterable is exhausted. Rows where nothing is exhausted are
+    passed through by `zip` untouched, and later rows only pay for the
+    columns that have actually ended, regardless of field count.
+
+    Parameters
+    ----------
+    iterables : tuple
+        Iterable objects to aggregate.
+    defaults : tuple
+        Default value for each iterable, same length as `iterables`.
+
+    Returns
+    -------
+    zip object
+
+    """
+
+    active = [len(iterables)]
+
+    def _pad(default):
+        active[0] -= 1
+        if active[0]:
+            yield from repeat(default)
+        # Returning when the last iterable runs out stops `zip`, which
+        # discards the partially filled final row like `zip_longest`.
 
-    Generates named tuple objects from tuples in `zipped`, based on
-    the `named_tuple` class. Also replaces None values in `zipped` if
-    `defaults` are specified.
+    columns = [chain(iter(it), _pad(d)) for it, d in zip(iterables, defaults)]
+    return zip(*columns)
+
+
+def _probe_columns(iterables, predicates, fills=None):
+    """Evaluates predicates on the columns they test, ahead of zipping.
+
+    Each tested iterable is split with `tee` into the column that is
+    zipped and a probe the predicate is mapped over, so predicates see
+    raw values and the zipped tuples are not shared.
+
+    Parameters
+    ----------
+    iterables : tuple
+        Iterable objects, one per field.
+    predicates : list
+        ``(index, predicate)`` pairs produced by `_check_pushdown`.
+    fills : tuple or None, optional
+        Fill value for each iterable when zipping to the longest one.
+        Probes continue with their fill value once exhausted, so that
+        predicates also test filled values (default is None).
+
+    Returns
+    -------
+    tuple
+        List of iterables to zip, and an iterator of booleans, true for
+        each row passing all predicates.
+
+    """
+
+    iterables = list(iterables)
+    selectors = []
+    for index, predicate in predicates:
+        iterables[index], probe = tee(iterables[index])
+        if fills is not None:
+            probe = chain(probe, repeat(fills[index]))
+        selectors.append(map(predicate, probe))
+    if len(selectors) == 1:
+        return iterables, selectors[0]
+    return iterables, map(all, zip(*selectors))
+
+
+def _pushdown(zipped, selectors=None, indices=None):
+    """Filters zipped tuples and projects them to selected fields.
+
+    Tuples are dropped with `compress` and projected with
+    `operator.itemgetter` before any rows are built.
+
+    Parameters
+    ----------
+    zipped : iterable
+        Should be iterator produced by `_create_zip`.
+    selectors : iterable or None, optional
+        Booleans produced by `_probe_columns`, true for tuples to keep
+        (default is None, keep all tuples).
+    indices : tuple or None, optional
+        Indices of the values to keep in each tuple (default is None,
+        keep all values).
+
+    Returns
+    -------
+    iterator object
+
+    """
+
+    if selectors is not None:
+        zipped = compress(zipped, selectors)
+    if indices is None:
+        return zipped
+    if len(indices) == 1:
+        # A single index makes itemgetter return the bare value.
+        return zip(map(itemgetter(indices[0]), zipped))
+    return map(itemgetter(*indices), zipped)
+
+
+def _build_rows(zipped, named_tuple, row_type="namedtuple", reuse=False):
+    """Builds rows of the requested type from zipped tuples.
 
     Parameters
     ----------
     zipped : iterable
-        Should be generator produced by `zip` or zip_longest`.
+        Should be iterator produced by `_create_zip`.
     named_tuple : type
         Named tuple class produced by `namedtuple` factory function.
-    defaults : iterable or None, optional
-        Default values for each index of tuples generated by `zipped`.
-        (default is None).
+    row_type : {"namedtuple", "slots"}, optional
+        Type of generated rows (default is "namedtuple").
+    reuse : bool, optional
+        Generate a single mutable record, overwritten in place for every
+        row (default is False).
+
+    Returns
+    -------
+    iterator object
+
+    """
+
+    if reuse:
+        from . import _rows
+
+        return _rows.reused_rows(zipped, _rows.record_class(named_tuple))
+    if row_type == "slots":
+        from . import _rows
+
+        return starmap(_rows.slots_class(named_tuple), zipped)
+    return _namedzip_map(zipped, named_tuple)
+
+
+def _namedzip_map(zipped, named_tuple):
+    """Maps tuples to named tuple objects without a Python-level loop.
+
+    Each tuple produced by `zipped` is passed directly to
+    ``tuple.__new__``, so rows are built entirely in C without resuming
+    a generator frame or unpacking arguments for every row.
+
+    Parameters
+    ----------
+    zipped : iterable
+        Should be iterator produced by `zip` or `zip_longest`, yielding
+        tuples with one value per field of `named_tuple`.
+    named_tuple : type
+        Named tuple class produced by `namedtuple` factory function.
+
+    Returns
+    -------
+    map object
+        Iterator of named tuple objects.
+
+    """
+
+    return map(partial(tuple.__new__, named_tuple), zipped)
+
+
+def _namedzip_batch_generator(
+    iterators, named_tuple, batch_size, longest=False, fills=None, typecodes=None
+):
+    """Generates named tuples of column batches.
+
+    Parameters
+    ----------
+    iterators : list
+        Iterator for each field of `named_tuple`.
+    named_tuple : type
+        Named tuple class produced by `namedtuple` factory function.
+    batch_size : int
+        Maximum number of rows per batch.
+    longest : bool, optional
+        Pad short columns with `fills` instead of truncating to the
+        shortest column (default is False).
+    fills : tuple or None, optional
+        Fill value for each column, required if `longest` is True.
+    typecodes : tuple or None, optional
+        `array.array` type code (or None) for each column.
 
     Yields
     ------
     named tuple object
+        With a list or `array.array` of values for each field.
 
     """
 
-    for vals in zipped:
-        if defaults:
-            vals = (x if x is not sentinel else defaults[i] for i, x in enumerate(vals))
-        yield named_tuple(*vals)
+    if typecodes is not None:
+        from array import array
+    while True:
+        columns = [list(islice(it, batch_size)) for it in iterators]
+        lengths = [len(column) for column in columns]
+        rows = max(lengths, default=0) if longest else min(lengths, default=0)
+        if not rows:
+            return
+        for column, fill in zip(columns, fills if longest else repeat(None)):
+            if len(column) > rows:
+                del column[rows:]
+            elif len(column) < rows:
+                column.extend(repeat(fill, rows - len(column)))
+        if typecodes is not None:
+            columns = [
+                column if code is None else array(code, column)
+                for column, code in zip(columns, typecodes)
+            ]
+        yield tuple.__new__(named_tuple, columns)
+        if rows < batch_size:
+            # At least one iterable ran out during this batch.
+            return
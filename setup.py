@@ -1,4 +1,4 @@
-from setuptools import setup
+from setuptools import Extension, setup
 
 with open("README.rst", "r", encoding="utf-8") as f:
     README = f.read()
@@ -22,5 +22,10 @@ setup(
         "Programming Language :: Python :: 3.7",
     ],
     packages=["namedzip"],
+    # Optional C accelerator; the pure Python implementation is used if it
+    # can't be built.
+    ext_modules=[
+        Extension("namedzip._namedzip", ["namedzip/_namedzip.c"], optional=True)
+    ],
     python_requires=">=3.4",
 )
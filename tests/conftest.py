@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+"""Shared test fixtures.
+
+copyright: © 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+import sys
+from importlib import import_module
+
+import pytest
+
+# anamedzip requires Python 3.6 and its tests use `asyncio.run`.
+collect_ignore = ["test_async.py"] if sys.version_info < (3, 7) else []
+
+# Package attribute `namedzip` is the function, not the module.
+namedzip_module = import_module("namedzip.namedzip")
+
+
+@pytest.fixture(params=["python", "c"])
+def implementation(request, monkeypatch):
+    """Run a test against the pure Python and the C implementation.
+
+    Applied with ``pytestmark`` by the modules building rows with
+    `namedzip` and `namedzip_longest`.
+
+    """
+    if request.param == "python":
+        monkeypatch.setattr(namedzip_module, "_speedups", None)
+    elif namedzip_module._speedups is None:
+        pytest.skip("C extension namedzip._namedzip is not built.")
+    return request.param
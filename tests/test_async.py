@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+"""Tests for the namedzip._async module.
+
+copyright: © 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+import asyncio
+import types
+
+import pytest
+
+from namedzip import anamedzip, anamedzip_longest
+
+
+async def agen(values, delay=0):
+    """Async generator yielding `values`, optionally sleeping before each."""
+    for value in values:
+        await asyncio.sleep(delay)
+        yield value
+
+
+async def failing(values):
+    """Async generator raising `RuntimeError` after yielding `values`."""
+    for value in values:
+        yield value
+    raise RuntimeError("source failed")
+
+
+async def collect(aiterable):
+    """Return the values of an async iterable as a list."""
+    return [value async for value in aiterable]
+
+
+def run(coroutine):
+    """Run `coroutine` in a new event loop."""
+    return asyncio.run(coroutine)
+
+
+class TestAnamedzip:
+    """Collection of tests for `namedzip._async.anamedzip`."""
+
+    def test_anamedzip_generator_type(self):
+        """`anamedzip` returns an async generator when called with positional args."""
+        pairs = anamedzip(agen("A"), agen([1]), typename="Pair", field_names=["a", "b"])
+        assert isinstance(pairs, types.AsyncGeneratorType)
+        run(pairs.aclose())
+
+    def test_anamedzip_factory_type(self):
+        """`anamedzip` returns a function when called without positional args."""
+        zip_pairs = anamedzip(typename="Pair", field_names=["a", "b"])
+        assert isinstance(zip_pairs, types.FunctionType)
+
+    def test_anamedzip_yields_namedtuples(self):
+        """Rows are named tuples and stop at the shortest source."""
+        pairs = anamedzip(
+            agen("ABC"),
+            agen(range(5)),
+            typename="Pair",
+            field_names=["letter", "number"],
+        )
+        rows = run(collect(pairs))
+        assert rows == [("A", 0), ("B", 1), ("C", 2)]
+        assert rows[0].letter == "A"
+
+    def test_anamedzip_sync_iterables(self):
+        """Synchronous iterables can be mixed with async ones."""
+        zip_pairs = anamedzip(typename="Pair", field_names=["letter", "number"])
+        rows = run(collect(zip_pairs("AB", agen([1, 2]))))
+        assert rows == [("A", 1), ("B", 2)]
+
+    def test_anamedzip_concurrent(self):
+        """Sources are advanced concurrently on every step."""
+        pairs = anamedzip(
+            agen(range(5), delay=0.02),
+            agen(range(5), delay=0.02),
+            agen(range(5), delay=0.02),
+            typename="Triple",
+            field_names=["a", "b", "c"],
+        )
+
+        async def timed():
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            rows = await collect(pairs)
+            return rows, loop.time() - start
+
+        rows, elapsed = run(timed())
+        assert len(rows) == 5
+        assert elapsed < 0.25  # Sequential advancing takes at least 0.3 s.
+
+    @pytest.mark.parametrize("buffer", [0, 2])
+    def test_anamedzip_exception_propagated(self, buffer):
+        """Exceptions raised by a source are raised to the consumer."""
+        pairs = anamedzip(
+            failing("AB"),
+            agen(range(5)),
+            typename="Pair",
+            field_names=["a", "b"],
+            buffer=buffer,
+        )
+        with pytest.raises(RuntimeError):
+            run(collect(pairs))
+
+    def test_anamedzip_buffer(self):
+        """Read-ahead buffering generates the same rows."""
+        pairs = anamedzip(
+            agen("ABC"),
+            agen(range(3), delay=0.001),
+            typename="Pair",
+            field_names=["letter", "number"],
+            buffer=2,
+        )
+        assert run(collect(pairs)) == [("A", 0), ("B", 1), ("C", 2)]
+
+    def test_anamedzip_iterables_fieldnames_mismatch(self):
+        """ValueError is raised for non-equal number of iterables and field names."""
+        with pytest.raises(ValueError):
+            anamedzip(agen("A"), typename="Pair", field_names=["a", "b"])
+
+
+class TestAnamedziplongest:
+    """Collection of tests for `namedzip._async.anamedzip_longest`."""
+
+    def test_anamedzip_longest_fillvalue(self):
+        """Missing values are replaced by `fillvalue`."""
+        pairs = anamedzip_longest(
+            agen("A"),
+            agen(range(3)),
+            typename="Pair",
+            field_names=["letter", "number"],
+            fillvalue="?",
+        )
+        assert run(collect(pairs)) == [("A", 0), ("?", 1), ("?", 2)]
+
+    @pytest.mark.parametrize("buffer", [0, 1])
+    def test_anamedzip_longest_defaults(self, buffer):
+        """`defaults` override `fillvalue` per source."""
+        zip_groups = anamedzip_longest(
+            typename="Group",
+            field_names=["letter", "number", "symbol"],
+            fillvalue="?",
+            defaults=("X", 99, "#"),
+            buffer=buffer,
+        )
+        groups = zip_groups(agen("AB"), agen([1]), agen(".?!"))
+        assert run(collect(groups)) == [
+            ("A", 1, "."),
+            ("B", 99, "?"),
+            ("X", 99, "!"),
+        ]
+
+    def test_anamedzip_longest_empty(self):
+        """Nothing is generated when all sources are empty."""
+        pairs = anamedzip_longest(agen([]), [], typename="Pair", field_names="a b")
+        assert run(collect(pairs)) == []
+
+    def test_anamedzip_longest_fieldnames_defaults_mismatch(self):
+        """ValueError is raised for non-equal number of field names and defaults."""
+        with pytest.raises(ValueError):
+            anamedzip_longest(typename="Pair", field_names=["a", "b"], defaults=[1])
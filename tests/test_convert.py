@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+"""Tests for the `types` option implemented by namedzip._convert.
+
+copyright: © 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+import pytest
+
+from namedzip import namedzip, namedzip_longest
+from namedzip._convert import check_types, convert_columns, convert_fills
+
+pytestmark = pytest.mark.usefixtures("implementation")
+
+
+class TestConvertUnit:
+    """Collection of tests for the `namedzip._convert` helpers."""
+
+    def test_check_types_without_types(self):
+        """No types give no converters."""
+        assert check_types(None, ("a", "b")) is None
+        assert check_types({}, ("a", "b")) is None
+
+    def test_check_types_orders_by_field(self):
+        """Converters are returned in field order, None for untyped fields."""
+        assert check_types({"b": int}, ("a", "b", "c")) == (None, int, None)
+
+    def test_check_types_unknown_field(self):
+        """Unknown field names raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown field names in types: x"):
+            check_types({"x": int}, ("a", "b"))
+
+    def test_check_types_invalid_dtype(self):
+        """Data types NumPy doesn't understand raise ValueError."""
+        pytest.importorskip("numpy")
+        with pytest.raises(ValueError, match="Invalid type"):
+            check_types({"a": object()}, ("a",))
+
+    def test_convert_fills(self):
+        """Fill values of typed fields are converted, None is kept."""
+        fills = convert_fills(("1", None, "x"), (int, float, None), ("a", "b", "c"))
+        assert fills == (1, None, "x")
+
+    def test_convert_fills_error(self):
+        """Fill values which can't be converted raise ValueError."""
+        with pytest.raises(ValueError, match="fill value 'x' of field 'a'"):
+            convert_fills(("x",), (int,), ("a",))
+
+    def test_convert_columns_batches(self):
+        """Values are converted across batch boundaries."""
+        columns = convert_columns(
+            (map(str, range(10)), "abc"), (int, None), ("a", "b"), batch_size=3
+        )
+        assert list(columns[0]) == list(range(10))
+        assert columns[1] == "abc"
+
+    def test_convert_columns_error_row_index(self):
+        """Conversion errors name the value, the field and the row index."""
+        (column,) = convert_columns(
+            (["1", "2", "3", "x", "5"],), (int,), ("qty",), batch_size=2
+        )
+        with pytest.raises(ValueError, match="'x' of field 'qty' in row 3") as info:
+            list(column)
+        assert isinstance(info.value.__cause__, ValueError)
+
+    def test_convert_columns_dtype(self):
+        """Data types convert batches with NumPy to Python values."""
+        np = pytest.importorskip("numpy")
+        (column,) = convert_columns(
+            (["1.5", "2", "3"],), (np.dtype("f8"),), ("a",), batch_size=2
+        )
+        values = list(column)
+        assert values == [1.5, 2.0, 3.0]
+        assert all(type(value) is float for value in values)
+
+    def test_convert_columns_ndarray(self):
+        """NumPy arrays are cast in vectorized batches."""
+        np = pytest.importorskip("numpy")
+        (column,) = convert_columns(
+            (np.arange(5, dtype="i8"),), (float,), ("a",), batch_size=2
+        )
+        values = list(column)
+        assert values == [0.0, 1.0, 2.0, 3.0, 4.0]
+        assert all(type(value) is float for value in values)
+
+    def test_convert_columns_ndarray_error_row_index(self):
+        """Failed vectorized casts name the row index as well."""
+        np = pytest.importorskip("numpy")
+        (column,) = convert_columns(
+            (np.array(["1", "2", "x"]),), (np.dtype("i8"),), ("a",), batch_size=2
+        )
+        with pytest.raises(ValueError, match="field 'a' in row 2"):
+            list(column)
+
+    @pytest.mark.parametrize(
+        "values, dtype, row",
+        [
+            ([1, 300], "i1", 1),
+            ([0, -1], "u8", 1),
+            ([1.0, 1.7], "i4", 1),
+            ([-2.5], "i4", 0),
+            ([1.0, float("nan")], "i8", 1),
+            ([1e300], "f4", 0),
+        ],
+    )
+    def test_convert_columns_dtype_out_of_range(self, values, dtype, row):
+        """Values a data type can't represent raise instead of wrapping."""
+        np = pytest.importorskip("numpy")
+        for column in (values, np.array(values)):
+            (converted,) = convert_columns(
+                (column,), (np.dtype(dtype),), ("a",), batch_size=2
+            )
+            with pytest.raises(ValueError, match="field 'a' in row {}".format(row)):
+                list(converted)
+
+    def test_convert_columns_ndarray_int(self):
+        """int truncates arrays like it truncates floats, but rejects NaN."""
+        np = pytest.importorskip("numpy")
+        (column,) = convert_columns((np.array([1.7, -2.5]),), (int,), ("a",))
+        assert list(column) == [1, -2]
+        (column,) = convert_columns((np.array([1.0, np.nan]),), (int,), ("a",))
+        with pytest.raises(ValueError, match="field 'a' in row 1"):
+            list(column)
+
+    def test_convert_fills_out_of_range(self):
+        """Fill values a data type can't represent raise ValueError."""
+        np = pytest.importorskip("numpy")
+        with pytest.raises(ValueError, match="fill value 300 of field 'a'"):
+            convert_fills((300,), (np.dtype("i1"),), ("a",))
+
+
+class TestTypesIntegration:
+    """Collection of tests for the `types` option of `namedzip` and
+    `namedzip_longest`."""
+
+    def test_namedzip_types(self):
+        """Typed fields are converted, untyped fields are left alone."""
+        rows = list(
+            namedzip(
+                ["1", "2"],
+                ["0.5", "1.5"],
+                ["x", "y"],
+                typename="Row",
+                field_names="qty price name",
+                types={"qty": int, "price": float},
+            )
+        )
+        assert rows == [(1, 0.5, "x"), (2, 1.5, "y")]
+        assert type(rows[0].qty) is int
+
+    def test_namedzip_types_factory(self):
+        """The factory converts every set of iterables."""
+        zipper = namedzip(typename="Row", field_names="a b", types={"a": int})
+        assert list(zipper(["1"], ["b"])) == [(1, "b")]
+        assert list(zipper(["2", "3"], "cd")) == [(2, "c"), (3, "d")]
+
+    def test_namedzip_types_error(self):
+        """Conversion errors are raised while iterating, with the row index."""
+        rows = namedzip(
+            ["1", "two"], "ab", typename="Row", field_names="a b", types={"a": int}
+        )
+        with pytest.raises(ValueError, match="'two' of field 'a' in row 1"):
+            list(rows)
+
+    def test_namedzip_types_before_where(self):
+        """Predicates are called with converted values."""
+        rows = namedzip(
+            ["1", "5", "3"],
+            "abc",
+            typename="Row",
+            field_names="a b",
+            types={"a": int},
+            where={"a": lambda value: value > 2},
+        )
+        assert list(rows) == [(5, "b"), (3, "c")]
+
+    def test_namedzip_types_select_and_row_types(self):
+        """Conversion is combined with select and other row types."""
+        rows = namedzip(
+            ["1"],
+            ["2"],
+            typename="Row",
+            field_names="a b",
+            types={"b": int},
+            select=["b"],
+        )
+        assert list(rows) == [(2,)]
+        for row_type in ("slots", "view"):
+            (row,) = namedzip(
+                ["1"],
+                ["2"],
+                typename="Row",
+                field_names="a b",
+                types={"b": int},
+                row_type=row_type,
+            )
+            assert (row.a, row.b) == ("1", 2)
+
+    def test_namedzip_types_unknown_field(self):
+        """Unknown field names raise ValueError at factory creation."""
+        with pytest.raises(ValueError, match="Unknown field names"):
+            namedzip(typename="Row", field_names="a b", types={"c": int})
+
+    @pytest.mark.parametrize("option", [{"as_view": True}, {"backend": "numpy"}])
+    def test_namedzip_types_invalid_combination(self, option):
+        """types can't be combined with as_view or another backend."""
+        with pytest.raises(ValueError, match="types can't be combined"):
+            namedzip(typename="Row", field_names="a b", types={"a": int}, **option)
+
+    def test_namedzip_longest_types_fills(self):
+        """Fill values are converted once and not per row."""
+        calls = []
+
+        def to_int(value):
+            calls.append(value)
+            return int(value)
+
+        zipper = namedzip_longest(
+            typename="Row",
+            field_names="a b",
+            defaults=("0", None),
+            types={"a": to_int},
+        )
+        assert calls == ["0"]
+        rows = list(zipper(["1"], "xyz"))
+        assert rows == [(1, "x"), (0, "y"), (0, "z")]
+        assert calls == ["0", "1"]
+
+    def test_namedzip_longest_types_fillvalue_none(self):
+        """A fill value of None is not converted."""
+        rows = namedzip_longest(
+            ["1"], "xy", typename="Row", field_names="a b", types={"a": int}
+        )
+        assert list(rows) == [(1, "x"), (None, "y")]
+
+    def test_namedzip_longest_types_fill_error(self):
+        """Fill values which can't be converted raise at factory creation."""
+        with pytest.raises(ValueError, match="fill value 'x' of field 'a'"):
+            namedzip_longest(
+                typename="Row", field_names="a b", fillvalue="x", types={"a": int}
+            )
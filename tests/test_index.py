@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+"""Tests for the namedzip._index module.
+
+copyright: © 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+import types
+from collections.abc import Mapping
+from itertools import count
+
+import pytest
+
+from namedzip import NamedZipIndex, namedzip, namedzip_index
+from namedzip._index import _transpose
+
+
+@pytest.fixture()
+def items():
+    """Test fixture to provide columns with a non-unique key."""
+    return (
+        [3, 1, 2, 1],
+        ["c", "a", "b", "d"],
+        [0.3, 0.1, 0.2, 0.4],
+    )
+
+
+class TestTransposeUnit:
+    """Collection of tests for `namedzip._index._transpose`."""
+
+    def test__transpose_columns(self):
+        """Tuples are collected into one list per column across batches."""
+        zipped = iter([(1, "a"), (2, "b"), (3, "c")])
+        assert _transpose(zipped, 2, batch_size=2) == [[1, 2, 3], ["a", "b", "c"]]
+
+    def test__transpose_empty(self):
+        """No tuples result in empty columns."""
+        assert _transpose(iter([]), 2) == [[], []]
+
+
+class TestNamedzipIndex:
+    """Collection of tests for `namedzip._index.namedzip_index`."""
+
+    def test_namedzip_index_type(self, items):
+        """`namedzip_index` returns a mapping when called with positional args."""
+        index = namedzip_index(
+            [1, 2], "ab", typename="Item", field_names=("id", "name"), key="id"
+        )
+        assert isinstance(index, NamedZipIndex)
+        assert isinstance(index, Mapping)
+
+    def test_namedzip_index_factory_type(self):
+        """`namedzip_index` returns a function without positional args."""
+        factory = namedzip_index(typename="Item", field_names=("id", "name"), key="id")
+        assert isinstance(factory, types.FunctionType)
+        assert factory([1], "a")[1] == (1, "a")
+
+    def test_namedzip_index_unique_lookup(self):
+        """Keys map to the same named tuples `namedzip` builds."""
+        fields = ("id", "name", "price")
+        columns = ([3, 1, 2], "cab", [0.3, 0.1, 0.2])
+        index = namedzip_index(*columns, typename="Item", field_names=fields, key="id")
+        rows = list(namedzip(*columns, typename="Item", field_names=fields))
+        assert dict(index) == {row.id: row for row in rows}
+        assert index[1].name == "a"
+        assert type(index[1]) is type(rows[0])
+
+    def test_namedzip_index_mapping_interface(self):
+        """Keys iterate in input order and missing keys raise KeyError."""
+        index = namedzip_index(
+            [3, 1, 2], "cab", typename="Item", field_names=("id", "name"), key="id"
+        )
+        assert list(index) == [3, 1, 2]
+        assert len(index) == index.row_count == 3
+        assert 2 in index and 4 not in index
+        assert index.get(4) is None
+        with pytest.raises(KeyError):
+            index[4]
+
+    def test_namedzip_index_other_key_field(self):
+        """Any field can be the key."""
+        index = namedzip_index(
+            [3, 1], "ca", typename="Item", field_names=("id", "name"), key="name"
+        )
+        assert index["a"] == (1, "a")
+
+    def test_namedzip_index_duplicate_keys(self, items):
+        """Duplicate keys raise ValueError when `unique` is True."""
+        with pytest.raises(ValueError):
+            namedzip_index(
+                *items, typename="Item", field_names=("id", "name", "price"), key="id"
+            )
+
+    def test_namedzip_index_non_unique(self, items):
+        """Keys map to lists of rows in input order if `unique` is False."""
+        index = namedzip_index(
+            *items,
+            typename="Item",
+            field_names=("id", "name", "price"),
+            key="id",
+            unique=False
+        )
+        assert len(index) == 3
+        assert index.row_count == 4
+        assert [row.name for row in index[1]] == ["a", "d"]
+        assert index[3] == [(3, "c", 0.3)]
+
+    def test_namedzip_index_unknown_key(self):
+        """Keys which are not fields raise ValueError."""
+        with pytest.raises(ValueError):
+            namedzip_index(typename="Item", field_names=("id", "name"), key="ID")
+
+    def test_namedzip_index_shortest(self):
+        """Rows stop at the shortest iterable, which may be infinite."""
+        index = namedzip_index(
+            count(), "abc", typename="Item", field_names=("id", "name"), key="id"
+        )
+        assert index.row_count == 3
+        assert index[2] == (2, "c")
+
+    def test_namedzip_index_longest(self):
+        """Missing values are filled in like `namedzip_longest`."""
+        index = namedzip_index(
+            [1, 2, 3],
+            "a",
+            typename="Item",
+            field_names=("id", "name"),
+            key="id",
+            longest=True,
+            defaults=(0, "-"),
+        )
+        assert index[3] == (3, "-")
+
+    def test_namedzip_index_irange(self, items):
+        """Ranges include `start`, exclude `stop` and generate in key order."""
+        index = namedzip_index(
+            *items,
+            typename="Item",
+            field_names=("id", "name", "price"),
+            key="id",
+            unique=False
+        )
+        assert [row.name for row in index.irange()] == ["a", "d", "b", "c"]
+        assert [row.name for row in index.irange(2)] == ["b", "c"]
+        assert [row.name for row in index.irange(stop=2)] == ["a", "d"]
+        assert [row.name for row in index.irange(1.5, 3)] == ["b"]
+        assert list(index.irange(4)) == []
+
+    def test_namedzip_index_irange_unique(self):
+        """Unique indexes generate one row per key."""
+        index = namedzip_index(
+            [30, 10, 20], "cab", typename="Item", field_names=("id", "name"), key="id"
+        )
+        assert list(index.irange(10, 30)) == [(10, "a"), (20, "b")]
+
+    def test_namedzip_index_repr(self):
+        """The repr shows the number of keys and type name."""
+        index = namedzip_index(
+            [1, 2], "ab", typename="Item", field_names=("id", "name"), key="id"
+        )
+        assert repr(index) == "<NamedZipIndex of 2 Item keys>"
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""Tests for the namedzip package namespace.
+
+copyright: © 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+import namedzip
+
+
+class TestLazyImports:
+    """Collection of tests for lazily imported package attributes."""
+
+    @pytest.mark.skipif(
+        sys.version_info < (3, 7), reason="Lazy imports require Python 3.7."
+    )
+    @pytest.mark.parametrize(
+        "statement",
+        [
+            "import namedzip",
+            "from namedzip import namedzip; "
+            "list(namedzip([1], [2], typename='P', field_names='a b'))",
+        ],
+    )
+    def test_optional_modules_not_imported(self, statement):
+        """Importing and zipping don't import asyncio, csv and co."""
+        code = (
+            statement + "; import sys; "
+            "print(sorted(m for m in ('array', 'asyncio', 'concurrent.futures', "
+            "'csv', 'numpy', 'queue', 'threading', 'namedzip._async', "
+            "'namedzip._convert', 'namedzip._prefetch', 'namedzip._rows', "
+            "'namedzip._stats', 'namedzip._view') if m in sys.modules))"
+        )
+        output = subprocess.check_output([sys.executable, "-c", code])
+        assert output.strip() == b"[]"
+
+    def test_all_names_resolve(self):
+        """Every name in `__all__` can be accessed and imported."""
+        for name in namedzip.__all__:
+            assert getattr(namedzip, name) is not None
+        assert set(namedzip.__all__) <= set(dir(namedzip))
+
+    @pytest.mark.skipif(
+        sys.version_info < (3, 6), reason="anamedzip requires Python 3.6."
+    )
+    def test_lazy_name_identity(self):
+        """Lazy names are the objects defined in their modules."""
+        from namedzip import anamedzip
+        from namedzip._async import anamedzip as defined
+
+        assert anamedzip is defined
+
+    def test_unknown_name(self):
+        """Unknown names raise AttributeError."""
+        with pytest.raises(AttributeError):
+            namedzip.missing_name
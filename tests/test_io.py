@@ -0,0 +1,332 @@
+# -*- coding: utf-8 -*-
+"""Tests for the namedzip._io module.
+
+copyright: © 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+import csv
+import io
+import json
+import struct
+from array import array
+
+import pytest
+
+from namedzip import (
+    from_files,
+    namedzip,
+    read_csv,
+    write_csv,
+    write_jsonl,
+    write_struct,
+)
+from namedzip._io import _file_column, _fspath, _record_format, _write_batch
+
+
+@pytest.fixture()
+def column_files(tmp_path):
+    """Test fixture writing binary column files of unequal length."""
+    ids = tmp_path / "ids.bin"
+    ids.write_bytes(array("q", [1, 2, 3]).tobytes())
+    prices = tmp_path / "prices.bin"
+    prices.write_bytes(struct.pack("<2d", 0.5, 1.5))
+    return ids, prices
+
+
+class TestFileColumnUnit:
+    """Collection of tests for `namedzip._io._file_column`."""
+
+    def test__file_column_cast_format(self, column_files):
+        """Native single character formats are decoded."""
+        assert list(_file_column(column_files[0], "q")) == [1, 2, 3]
+
+    def test__file_column_struct_format(self, column_files):
+        """Other formats are decoded with `struct`."""
+        assert list(_file_column(column_files[1], "<d")) == [0.5, 1.5]
+
+    def test__file_column_multiple_items(self, tmp_path):
+        """Formats with several items generate tuples."""
+        path = tmp_path / "points.bin"
+        path.write_bytes(struct.pack("<4h", 1, 2, 3, 4))
+        assert list(_file_column(path, "<2h")) == [(1, 2), (3, 4)]
+
+    def test__file_column_empty(self, tmp_path):
+        """Empty files generate nothing."""
+        path = tmp_path / "empty.bin"
+        path.write_bytes(b"")
+        assert list(_file_column(path, "q")) == []
+
+    def test__file_column_closed_early(self, column_files):
+        """Closing the generator early releases the memory map."""
+        values = _file_column(column_files[0], "q")
+        assert next(values) == 1
+        values.close()
+
+
+class TestFspathUnit:
+    """Collection of tests for `namedzip._io._fspath`."""
+
+    def test__fspath(self, tmp_path):
+        """pathlib paths become strings, other arguments are kept."""
+        path = tmp_path / "ids.bin"
+        assert _fspath(path) == str(path)
+        assert type(_fspath(path)) is str
+        stream = io.BytesIO()
+        for other in ("ids.bin", b"ids.bin", stream):
+            assert _fspath(other) is other
+
+
+class TestFromFiles:
+    """Collection of tests for `namedzip._io.from_files`."""
+
+    def test_from_files_shortest(self, column_files):
+        """Rows stop at the shortest file by default."""
+        rows = from_files(
+            column_files,
+            typename="Item",
+            field_names=["id", "price"],
+            formats=("q", "<d"),
+        )
+        assert list(rows) == [(1, 0.5), (2, 1.5)]
+
+    def test_from_files_longest(self, column_files):
+        """`longest` fills missing values like `namedzip_longest`."""
+        rows = from_files(
+            column_files,
+            typename="Item",
+            field_names=["id", "price"],
+            formats=("q", "<d"),
+            longest=True,
+            defaults=(0, 0.0),
+        )
+        assert list(rows) == [(1, 0.5), (2, 1.5), (3, 0.0)]
+
+    def test_from_files_single_format(self, tmp_path):
+        """A single format applies to all files."""
+        paths = [tmp_path / "a.bin", tmp_path / "b.bin"]
+        for path in paths:
+            path.write_bytes(array("i", [7, 8]).tobytes())
+        rows = from_files(paths, typename="Pair", field_names="a b", formats="i")
+        assert [row.b for row in rows] == [7, 8]
+
+    def test_from_files_validation(self, column_files):
+        """ValueError is raised for mismatched formats or file sizes."""
+        with pytest.raises(ValueError):
+            from_files(column_files, typename="Item", field_names="a b", formats=["q"])
+        with pytest.raises(ValueError):  # 16 bytes is not a multiple of 3.
+            from_files(column_files, typename="Item", field_names="a b", formats="3s")
+
+
+@pytest.fixture()
+def csv_file(tmp_path):
+    """Test fixture writing a CSV file with a header and a short row."""
+    path = tmp_path / "items.csv"
+    path.write_text('id,name,price\n1,apple,0.5\n\n2,"pear, green"\n3,plum,1.5\n')
+    return path
+
+
+class TestReadCsv:
+    """Collection of tests for `namedzip._io.read_csv`."""
+
+    def test_read_csv_header(self, csv_file):
+        """Field names are taken from the header row."""
+        rows = list(read_csv(csv_file, typename="Item"))
+        assert rows[0]._fields == ("id", "name", "price")
+        assert rows[0] == ("1", "apple", "0.5")
+        assert rows[1].name == "pear, green"
+        assert len(rows) == 3  # Blank line skipped.
+
+    def test_read_csv_short_rows(self, csv_file):
+        """Short rows are filled like `namedzip_longest`."""
+        rows = list(read_csv(csv_file, typename="Item", fillvalue="?"))
+        assert rows[1].price == "?"
+        rows = list(read_csv(csv_file, typename="Item", defaults=(0, "", 9.9)))
+        assert rows[1].price == 9.9
+
+    def test_read_csv_converters(self, csv_file):
+        """Converters are applied per column, but not to fill values."""
+        rows = read_csv(
+            csv_file,
+            typename="Item",
+            converters={"id": int, "price": float},
+            chunk_size=2,
+        )
+        assert [(r.id, r.price) for r in rows] == [(1, 0.5), (2, None), (3, 1.5)]
+
+    def test_read_csv_field_names(self):
+        """Explicit field names treat the first row as data, like DictReader."""
+        f = io.StringIO("a\tb\nc\td\n")
+        rows = read_csv(f, typename="Pair", field_names="x y", delimiter="\t")
+        assert list(rows) == [("a", "b"), ("c", "d")]
+        assert not f.closed
+
+    def test_read_csv_rename(self):
+        """Invalid header names can be renamed."""
+        rows = read_csv(io.StringIO("id,class\n1,2\n"), typename="Row", rename=True)
+        assert next(rows)._fields == ("id", "_1")
+
+    def test_read_csv_cached_class(self, csv_file):
+        """Repeated reads generate instances of the identical class."""
+        first = next(read_csv(csv_file, typename="Item"))
+        second = next(read_csv(csv_file, typename="Item"))
+        assert type(first) is type(second)
+
+    def test_read_csv_errors(self, csv_file):
+        """ValueError is raised for long rows and unknown converters."""
+        with pytest.raises(ValueError):
+            list(read_csv(io.StringIO("a,b\n1,2,3\n"), typename="Pair"))
+        with pytest.raises(ValueError):
+            list(read_csv(csv_file, typename="Item", converters={"cost": float}))
+
+
+@pytest.fixture()
+def items():
+    """Test fixture with rows of mixed value types."""
+    return list(
+        namedzip(
+            [1, 2, 3],
+            ["a", 'b "quoted", ü', "c"],
+            [0.5, float("nan"), 2.0],
+            [True, False, None],
+            typename="Item",
+            field_names="id name price flag",
+        )
+    )
+
+
+class TestWriteUnit:
+    """Collection of tests for helpers of the `namedzip._io` writers."""
+
+    def test__record_format(self):
+        """Field formats are joined under their common byte order."""
+        assert _record_format("<id") == "<id"
+        assert _record_format(["<i", "<d"]) == "<id"
+        assert _record_format(["i", "@d"]) == "@id"
+
+    def test__record_format_byte_orders(self):
+        """Field formats with different byte orders raise ValueError."""
+        with pytest.raises(ValueError, match="different byte orders"):
+            _record_format(["<i", ">d"])
+
+    def test__write_batch(self, tmp_path):
+        """All bytes of a batch are written in order."""
+        path = tmp_path / "batch.bin"
+        with open(str(path), "wb", buffering=0) as f:
+            _write_batch(f, [b"ab", b"", b"cde"])
+        assert path.read_bytes() == b"abcde"
+
+
+class TestWriteJsonl:
+    """Collection of tests for `namedzip._io.write_jsonl`."""
+
+    def test_write_jsonl_matches_json_dumps(self, tmp_path, items):
+        """Lines are identical to `json.dumps` of the rows as dicts."""
+        path = tmp_path / "items.jsonl"
+        write_jsonl(items, path, chunk_size=2, buffer_size=16)
+        expected = "".join(json.dumps(row._asdict()) + "\n" for row in items)
+        assert path.read_text(encoding="utf-8") == expected
+
+    def test_write_jsonl_mixed_column(self):
+        """Columns of mixed types are encoded value by value."""
+        rows = namedzip([1, "1", [1]], typename="Row", field_names="a")
+        f = io.StringIO()
+        write_jsonl(rows, f)
+        assert f.getvalue() == '{"a": 1}\n{"a": "1"}\n{"a": [1]}\n'
+
+    def test_write_jsonl_default(self):
+        """default serializes other objects."""
+        rows = namedzip([{1, 2}], typename="Row", field_names="a")
+        f = io.BytesIO()
+        write_jsonl(rows, f, default=sorted)
+        assert f.getvalue() == b'{"a": [1, 2]}\n'
+
+    def test_write_jsonl_field_names(self):
+        """Plain tuples are written with field_names as keys."""
+        f = io.StringIO()
+        write_jsonl([(1, 2)], f, field_names=["x", "y"])
+        assert f.getvalue() == '{"x": 1, "y": 2}\n'
+
+    def test_write_jsonl_without_fields(self):
+        """Rows without field names raise ValueError."""
+        with pytest.raises(ValueError, match="specify field_names"):
+            write_jsonl([(1, 2)], io.StringIO())
+
+    def test_write_jsonl_empty(self, tmp_path):
+        """No rows give an empty file."""
+        path = tmp_path / "empty.jsonl"
+        write_jsonl([], path)
+        assert path.read_bytes() == b""
+
+
+class TestWriteCsv:
+    """Collection of tests for `namedzip._io.write_csv`."""
+
+    def test_write_csv_round_trip(self, tmp_path, items):
+        """Written files are read back by `csv.reader`."""
+        path = tmp_path / "items.csv"
+        write_csv(items, path, chunk_size=2, buffer_size=8)
+        with open(str(path), newline="", encoding="utf-8") as f:
+            lines = list(csv.reader(f))
+        assert lines[0] == ["id", "name", "price", "flag"]
+        assert lines[1:] == [
+            ["" if value is None else str(value) for value in row] for row in items
+        ]
+
+    def test_write_csv_without_header(self):
+        """header=False writes only the rows, plain tuples included."""
+        f = io.StringIO(newline="")
+        write_csv([(1, "a"), (2, "b")], f, header=False, delimiter=";")
+        assert f.getvalue() == "1;a\r\n2;b\r\n"
+
+    def test_write_csv_empty(self):
+        """Empty rows write a header only if field_names are given."""
+        f = io.StringIO(newline="")
+        write_csv([], f)
+        assert f.getvalue() == ""
+        write_csv([], f, field_names=["a", "b"])
+        assert f.getvalue() == "a,b\r\n"
+
+    def test_write_csv_read_csv(self, tmp_path):
+        """read_csv reads back what write_csv writes."""
+        path = tmp_path / "pairs.csv"
+        rows = list(namedzip("ab", [1, 2], typename="Pair", field_names="x n"))
+        write_csv(rows, path)
+        read = list(read_csv(path, typename="Pair", converters={"n": int}))
+        assert read == rows
+
+
+class TestWriteStruct:
+    """Collection of tests for `namedzip._io.write_struct`."""
+
+    def test_write_struct(self, tmp_path):
+        """Rows are packed with the record format."""
+        path = tmp_path / "rows.bin"
+        rows = namedzip([1, 2, 3], [0.5, 1.5, 2.5], typename="Row", field_names="a b")
+        write_struct(rows, path, "<id", chunk_size=2, buffer_size=1)
+        assert list(struct.iter_unpack("<id", path.read_bytes())) == [
+            (1, 0.5),
+            (2, 1.5),
+            (3, 2.5),
+        ]
+
+    def test_write_struct_field_formats(self):
+        """Formats can be given per field."""
+        f = io.BytesIO()
+        write_struct([(1, 2)], f, ["<h", "<b"])
+        assert f.getvalue() == struct.pack("<hb", 1, 2)
+
+    def test_write_struct_from_files(self, tmp_path):
+        """Column files written per field are read back by from_files."""
+        rows = [(1, 0.5), (2, 1.5)]
+        paths = [tmp_path / "a.bin", tmp_path / "b.bin"]
+        write_struct([(1,), (2,)], paths[0], "<q")
+        write_struct([(0.5,), (1.5,)], paths[1], "<d")
+        read = from_files(paths, "Row", "a b", ["<q", "<d"])
+        assert list(read) == rows
+
+    def test_write_struct_mismatch(self):
+        """Rows not matching the format raise struct.error."""
+        with pytest.raises(struct.error):
+            write_struct([(1, 2)], io.BytesIO(), "<i")
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""Tests for the namedzip._join module.
+
+copyright: © 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+import types
+from itertools import count
+from operator import itemgetter
+
+import pytest
+
+from namedzip import namedzip_join
+
+
+class TestNamedzipJoin:
+    """Collection of tests for `namedzip._join.namedzip_join`."""
+
+    def test_inner_join(self):
+        """Only keys present in all iterables are generated."""
+        rows = namedzip_join(
+            [1, 2, 4, 5], [2, 3, 4, 5], [0, 2, 5], typename="Row", field_names="a b c"
+        )
+        assert isinstance(rows, types.GeneratorType)
+        assert list(rows) == [(2, 2, 2), (5, 5, 5)]
+
+    def test_outer_join_fillvalue(self):
+        """Every key is generated, with fillvalue for missing values."""
+        rows = namedzip_join(
+            [1, 3], [2, 3], typename="Row", field_names="a b", how="outer", fillvalue=0
+        )
+        assert list(rows) == [(1, 0), (0, 2), (3, 3)]
+
+    def test_outer_join_defaults(self):
+        """defaults give a missing value per iterable."""
+        rows = namedzip_join(
+            [1],
+            [2],
+            typename="Row",
+            field_names="a b",
+            how="outer",
+            defaults=("-", "?"),
+        )
+        assert list(rows) == [(1, "?"), ("-", 2)]
+
+    def test_key_function(self):
+        """Values are joined on the key returned by the key function."""
+        prices = [("a", 1.5), ("b", 2.0), ("c", 0.5)]
+        stock = [("a", 10), ("c", 0)]
+        rows = list(
+            namedzip_join(
+                prices,
+                stock,
+                typename="Item",
+                field_names="price stock",
+                key=itemgetter(0),
+            )
+        )
+        assert rows == [(("a", 1.5), ("a", 10)), (("c", 0.5), ("c", 0))]
+        assert rows[0].stock == ("a", 10)
+
+    def test_key_per_iterable(self):
+        """A key function can be given for each iterable."""
+        rows = namedzip_join(
+            [{"id": 1}, {"id": 2}],
+            [(2, "x")],
+            typename="Row",
+            field_names="a b",
+            key=[itemgetter("id"), itemgetter(0)],
+        )
+        assert list(rows) == [({"id": 2}, (2, "x"))]
+
+    def test_inner_join_stops_at_exhausted_iterable(self):
+        """Inner joins stop reading when any iterable is exhausted."""
+        rows = namedzip_join([1, 2], count(), typename="Row", field_names="a b")
+        assert list(rows) == [(1, 1), (2, 2)]
+
+    def test_values_are_not_compared(self):
+        """Values with equal keys are never compared with each other."""
+        rows = namedzip_join(
+            [(1, {})],
+            [(1, {})],
+            typename="Row",
+            field_names="a b",
+            key=itemgetter(0),
+            how="outer",
+        )
+        assert list(rows) == [((1, {}), (1, {}))]
+
+    def test_factory(self):
+        """Without iterables, a function for creating iterators is returned."""
+        join = namedzip_join(typename="Row", field_names="a b", how="outer")
+        assert isinstance(join, types.FunctionType)
+        assert list(join([1], [1])) == [(1, 1)]
+        assert list(join([], [2])) == [(None, 2)]
+
+    def test_unsorted_keys(self):
+        """Keys which are not strictly ascending raise ValueError."""
+        rows = namedzip_join([1, 1], [1], typename="Row", field_names="a b")
+        with pytest.raises(ValueError, match="field 'a' are not strictly ascending"):
+            list(rows)
+
+    def test_unsupported_how(self):
+        """Unsupported join types raise ValueError."""
+        with pytest.raises(ValueError, match="Unsupported how 'left'"):
+            namedzip_join(typename="Row", field_names="a b", how="left")
+
+    def test_unequal_keys(self):
+        """The number of key functions must match the fields."""
+        with pytest.raises(ValueError, match="keys"):
+            namedzip_join(typename="Row", field_names="a b", key=[abs])
+
+    def test_unequal_iterables(self):
+        """The number of iterables must match the fields."""
+        with pytest.raises(ValueError):
+            namedzip_join([1], typename="Row", field_names="a b")
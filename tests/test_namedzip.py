@@ -6,19 +6,42 @@ license: MIT, see LICENSE for more details.
 
 """
 
+import copy
+import pickle
+import sys
+import threading
 import types
 from collections import namedtuple
+from array import array
+from collections.abc import Iterator
 from itertools import zip_longest
 
 import pytest
 
-from namedzip import namedzip, namedzip_longest
+from namedzip import (
+    NamedZipper,
+    namedtuple_cache_clear,
+    namedtuple_cache_info,
+    namedzip,
+    namedzip_batches,
+    namedzip_longest,
+)
 from namedzip.namedzip import (
+    _NamedTupleCache,
+    _check_pushdown,
     _compare_iterables_to_fields,
     _create_zip,
-    _namedzip_generator,
+    _namedtuple_cache,
+    _namedzip_map,
+    _probe_columns,
+    _pushdown,
+    _speedups,
+    _zip_with_defaults,
+    sentinel,
 )
 
+pytestmark = pytest.mark.usefixtures("implementation")
+
 
 @pytest.fixture()
 def two_iterables():
@@ -51,16 +74,17 @@ class TestUnitNamedzip:
     """Collection of tests for `namedzip.namedzip.namedzip`."""
 
     def test_namedzip_generator_type(self, two_iterables):
-        """`namedzip` returns a generator when called with positional arguments."""
+        """`namedzip` returns an iterator when called with positional arguments."""
         pairs = namedzip(
             *two_iterables, typename="Pair", field_names=["letter", "number"]
         )
-        assert isinstance(pairs, types.GeneratorType)
+        assert isinstance(pairs, Iterator)
 
     def test_namedzip_factory_type(self):
-        """`namedzip` returns a function when called without positional arguments."""
+        """`namedzip` returns a NamedZipper when called without positional arguments."""
         zip_pairs = namedzip(typename="Pair", field_names=["letter", "number"])
-        assert isinstance(zip_pairs, types.FunctionType)
+        assert isinstance(zip_pairs, NamedZipper)
+        assert not zip_pairs.longest
 
     def test_namedzip_required_keyword_args(self):
         """`namedzip` requires `typename` and `field_names` keyword arguments."""
@@ -121,16 +145,24 @@ class TestNamedziplongest:
     """Collection of tests for `namedzip.namedzip.namedzip_longest`."""
 
     def test_namedzip_longest_generator_type(self, two_iterables):
-        """`namedzip_longest` returns a generator when called with positional args."""
+        """`namedzip_longest` returns an iterator when called with positional args."""
         pairs = namedzip_longest(
             *two_iterables, typename="Pair", field_names=["letter", "number"]
         )
-        assert isinstance(pairs, types.GeneratorType)
+        assert isinstance(pairs, Iterator)
+        pairs = namedzip_longest(
+            *two_iterables,
+            typename="Pair",
+            field_names=["letter", "number"],
+            defaults=("X", 99)
+        )
+        assert isinstance(pairs, Iterator)
 
     def test_namedzip_longest_factory_type(self):
-        """`namedzip_longest` returns a function when called without positional args."""
+        """`namedzip_longest` returns a NamedZipper when called without iterables."""
         zip_pairs = namedzip_longest(typename="Pair", field_names=["letter", "number"])
-        assert isinstance(zip_pairs, types.FunctionType)
+        assert isinstance(zip_pairs, NamedZipper)
+        assert zip_pairs.longest
 
     def test_namedzip_longest_required_keyword_args(self):
         """`namedzip` requires `typename` and `field_names` keyword arguments."""
@@ -231,6 +263,17 @@ class TestNamedziplongest:
         else:
             raise AssertionError("Value assertions were not executed.")
 
+    def test_namedzip_longest_defaults_generator(self):
+        """`defaults` may be a one-shot iterable."""
+        pairs = namedzip_longest(
+            ["A"],
+            [1, 2],
+            typename="Pair",
+            field_names=["letter", "number"],
+            defaults=(x for x in ("X", 99)),
+        )
+        assert list(pairs) == [("A", 1), ("X", 2)]
+
     def test_namedzip_longest_fieldnames_defaults_mismatch(self, two_iterables):
         """ValueError is raiesd for non-equal number of field names and defaults"""
         with pytest.raises(ValueError):  # Three field names, two default values.
@@ -241,6 +284,123 @@ class TestNamedziplongest:
             namedzip_longest(
                 typename="ABC", field_names=["A", "B", "C"], defaults=[1, 2, 3, 4]
             )
+        with pytest.raises(ValueError):  # Three field names, no default values.
+            namedzip_longest(typename="ABC", field_names=["A", "B", "C"], defaults=[])
+
+
+class TestNamedzipBatches:
+    """Collection of tests for `namedzip.namedzip.namedzip_batches`."""
+
+    def test_namedzip_batches_generator_type(self, two_iterables):
+        """`namedzip_batches` returns a generator when called with positional args."""
+        batches = namedzip_batches(
+            *two_iterables, typename="Pair", field_names=["letter", "number"]
+        )
+        assert isinstance(batches, types.GeneratorType)
+
+    def test_namedzip_batches_factory_type(self):
+        """`namedzip_batches` returns a function when called without positional args."""
+        zip_batches = namedzip_batches(typename="Pair", field_names=["a", "b"])
+        assert isinstance(zip_batches, types.FunctionType)
+
+    def test_namedzip_batches_columns(self):
+        """Batches hold up to `batch_size` values per field."""
+        batches = namedzip_batches(
+            "ABCDE",
+            range(5),
+            typename="Pair",
+            field_names=["letter", "number"],
+            batch_size=2,
+        )
+        assert [tuple(batch) for batch in batches] == [
+            (["A", "B"], [0, 1]),
+            (["C", "D"], [2, 3]),
+            (["E"], [4]),
+        ]
+
+    def test_namedzip_batches_shortest(self):
+        """Columns are truncated to the shortest iterable by default."""
+        batches = list(
+            namedzip_batches(
+                "ABC", range(10), typename="Pair", field_names=["letter", "number"]
+            )
+        )
+        assert len(batches) == 1
+        assert batches[0].letter == ["A", "B", "C"]
+        assert batches[0].number == [0, 1, 2]
+
+    def test_namedzip_batches_longest_fillvalue(self):
+        """`longest` pads short columns with `fillvalue`."""
+        batches = namedzip_batches(
+            "AB",
+            range(3),
+            typename="Pair",
+            field_names=["letter", "number"],
+            batch_size=2,
+            longest=True,
+            fillvalue="?",
+        )
+        assert [tuple(batch) for batch in batches] == [
+            (["A", "B"], [0, 1]),
+            (["?"], [2]),
+        ]
+
+    def test_namedzip_batches_longest_defaults(self):
+        """`defaults` override `fillvalue` per column."""
+        batches = namedzip_batches(
+            "A",
+            range(3),
+            [None],
+            typename="Group",
+            field_names=["letter", "number", "symbol"],
+            longest=True,
+            fillvalue="?",
+            defaults=("X", 99, "#"),
+        )
+        batch = next(batches)
+        assert batch.letter == ["A", "X", "X"]
+        assert batch.number == [0, 1, 2]
+        assert batch.symbol == [None, "#", "#"]
+
+    def test_namedzip_batches_typecodes(self):
+        """Fields with a type code are returned as `array.array`."""
+        batch = next(
+            namedzip_batches(
+                "AB",
+                [1, 2],
+                [0.5, 1.5],
+                typename="Group",
+                field_names=["letter", "number", "value"],
+                typecodes=(None, "q", "d"),
+            )
+        )
+        assert batch.letter == ["A", "B"]
+        assert batch.number == array("q", [1, 2])
+        assert batch.value == array("d", [0.5, 1.5])
+        single = next(
+            namedzip_batches(
+                [1], [2], typename="Pair", field_names=["a", "b"], typecodes="q"
+            )
+        )
+        assert single == (array("q", [1]), array("q", [2]))
+
+    def test_namedzip_batches_empty(self):
+        """Nothing is generated for empty iterables."""
+        batches = namedzip_batches(
+            [], [], typename="Pair", field_names=["a", "b"], longest=True
+        )
+        assert list(batches) == []
+
+    def test_namedzip_batches_validation(self):
+        """ValueError is raised for invalid arguments."""
+        with pytest.raises(ValueError):
+            namedzip_batches([1], typename="Pair", field_names=["a", "b"])
+        with pytest.raises(ValueError):
+            namedzip_batches(typename="Pair", field_names=["a", "b"], batch_size=0)
+        with pytest.raises(ValueError):
+            namedzip_batches(typename="Pair", field_names=["a", "b"], defaults=[1])
+        with pytest.raises(ValueError):
+            namedzip_batches(typename="Pair", field_names=["a", "b"], typecodes="qd?")
 
 
 class TestCompareIterablesToFieldsUnit:
@@ -300,23 +460,616 @@ class TestCreateZipUnit:
         assert pairs[-1] == 99
 
 
-class TestNamedzipGeneratorUnit:
-    """Collection of tests for `namedzip.namedzip._namedzip_generator`."""
+class TestZipWithDefaultsUnit:
+    """Collection of tests for `namedzip.namedzip._zip_with_defaults`."""
+
+    def test__zip_with_defaults_matches_zip_longest(self):
+        """Missing values are replaced by the default of their column."""
+
+        iterables = (["A", "B"], [1, 2, 3, 4], [".", "?", "!"])
+        defaults = ("X", 99, "#")
+        expected = [
+            tuple(d if v is sentinel else v for v, d in zip(row, defaults))
+            for row in zip_longest(*iterables, fillvalue=sentinel)
+        ]
+        assert list(_zip_with_defaults(iterables, defaults)) == expected
+
+    def test__zip_with_defaults_equal_lengths(self):
+        """Equal length iterables are zipped without substitution."""
+
+        iterables = (["A", "B"], [1, 2])
+        zipped = _zip_with_defaults(iterables, ("X", 99))
+        assert list(zipped) == [("A", 1), ("B", 2)]
+
+    def test__zip_with_defaults_empty(self):
+        """Nothing is generated when all iterables are empty."""
+
+        assert list(_zip_with_defaults(([], []), ("X", 99))) == []
+        assert list(_zip_with_defaults((), ())) == []
+
+    def test__zip_with_defaults_one_shot_iterables(self):
+        """Generators are consumed exactly once."""
 
-    def test__namedzip_generator_return_type(self):
-        """Should return a generator object."""
+        letters = (x for x in "AB")
+        numbers = (x for x in range(3))
+        zipped = _zip_with_defaults((letters, numbers), ("X", 99))
+        assert list(zipped) == [("A", 0), ("B", 1), ("X", 2)]
+
+    def test__zip_with_defaults_non_iterable(self):
+        """TypeError is raised eagerly for non-iterable objects."""
+
+        with pytest.raises(TypeError):
+            _zip_with_defaults(("A", 1), ("X", 99))
+
+
+class TestNamedzipMapUnit:
+    """Collection of tests for `namedzip.namedzip._namedzip_map`."""
+
+    def test__namedzip_map_return_type(self):
+        """Should return a C-level `map` iterator."""
 
         zipped = zip(("A", "B", "C"), (1, 2, 3))
         named_tuple = namedtuple("Pair", ["letter", "number"])
-        nz_generator = _namedzip_generator(zipped, named_tuple)
-        assert isinstance(nz_generator, types.GeneratorType)
+        assert isinstance(_namedzip_map(zipped, named_tuple), map)
 
-    def test__namedzip_generator_yields_named_tuple(self):
-        """Returned object should yield named tuples."""
+    def test__namedzip_map_yields_named_tuple(self):
+        """Returned object should yield instances of `named_tuple`."""
 
         zipped = zip(("A", "B", "C"), (1, 2, 3))
         named_tuple = namedtuple("Pair", ["letter", "number"])
-        expected = named_tuple("A", 1)
-        nz_generator = _namedzip_generator(zipped, named_tuple)
-        yielded = next(nz_generator)
-        assert yielded == expected
+        rows = list(_namedzip_map(zipped, named_tuple))
+        assert rows == [named_tuple("A", 1), named_tuple("B", 2), named_tuple("C", 3)]
+        assert all(type(row) is named_tuple for row in rows)
+        assert rows[0].letter == "A"
+
+
+class TestNamedTupleCacheUnit:
+    """Collection of tests for `namedzip.namedzip._NamedTupleCache`."""
+
+    def test__namedtuple_cache_identical_class(self):
+        """The same key returns the identical class."""
+
+        cache = _NamedTupleCache()
+        first = cache.get("Pair", ["letter", "number"])
+        second = cache.get("Pair", "letter, number")
+        assert first is second
+        assert cache.info() == (1, 1, 128, 1)
+
+    def test__namedtuple_cache_distinct_keys(self):
+        """Different typenames or options return different classes."""
+
+        cache = _NamedTupleCache()
+        pair = cache.get("Pair", ["letter", "number"])
+        assert cache.get("Other", ["letter", "number"]) is not pair
+        assert cache.get("Pair", ["number", "letter"]) is not pair
+        assert cache.get("Pair", ["letter", "number"], rename=True) is not pair
+
+    def test__namedtuple_cache_lru_eviction(self):
+        """Least recently used classes are evicted beyond `maxsize`."""
+
+        cache = _NamedTupleCache(maxsize=2)
+        a = cache.get("A", ["x"])
+        cache.get("B", ["x"])
+        cache.get("A", ["x"])  # Mark "A" as recently used.
+        cache.get("C", ["x"])  # Evicts "B".
+        assert cache.info().currsize == 2
+        assert cache.get("A", ["x"]) is a
+        misses = cache.info().misses
+        cache.get("B", ["x"])
+        assert cache.info().misses == misses + 1
+
+    def test__namedtuple_cache_one_shot_field_names(self):
+        """Generators passed as `field_names` are not lost."""
+
+        cache = _NamedTupleCache()
+        named_tuple = cache.get("Pair", (f for f in ["letter", "number"]))
+        assert named_tuple._fields == ("letter", "number")
+
+    @pytest.mark.skipif(
+        sys.version_info < (3, 7), reason="namedtuple defaults require Python 3.7."
+    )
+    def test__namedtuple_cache_one_shot_defaults(self):
+        """Generators passed as `defaults` are not lost."""
+
+        cache = _NamedTupleCache()
+        named_tuple = cache.get("Pair", ["letter", "number"], defaults=(d for d in [1]))
+        assert named_tuple("A") == ("A", 1)
+
+    @pytest.mark.skipif(
+        sys.version_info < (3, 7), reason="namedtuple defaults require Python 3.7."
+    )
+    def test__namedtuple_cache_unhashable_defaults(self):
+        """Unhashable arguments bypass the cache instead of failing."""
+
+        cache = _NamedTupleCache()
+        named_tuple = cache.get("Pair", ["letter", "number"], defaults=[[], []])
+        assert named_tuple() == ([], [])
+        assert cache.info().currsize == 0
+
+    def test__namedtuple_cache_thread_safe(self):
+        """Concurrent lookups for one key all return the same class."""
+
+        cache = _NamedTupleCache()
+        classes = []
+
+        def lookup():
+            for _ in range(100):
+                classes.append(cache.get("Pair", ["letter", "number"]))
+
+        threads = [threading.Thread(target=lookup) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(set(map(id, classes))) == 1
+
+    def test__namedtuple_cache_clear(self):
+        """`clear` empties the cache and resets statistics."""
+
+        cache = _NamedTupleCache()
+        cache.get("Pair", ["letter", "number"])
+        cache.clear()
+        assert cache.info() == (0, 0, 128, 0)
+
+    def test__namedtuple_cache_identity_after_clear(self):
+        """Classes still alive are returned again after a clear."""
+
+        cache = _NamedTupleCache()
+        pair = cache.get("Pair", ["letter", "number"])
+        cache.clear()
+        assert cache.get("Pair", ["letter", "number"]) is pair
+        assert cache.info() == (0, 1, 128, 1)
+
+
+class TestNamedTupleCacheIntegration:
+    """Tests for the class cache shared by `namedzip` and `namedzip_longest`."""
+
+    def test_namedzip_reuses_class(self, two_iterables):
+        """Repeated calls generate instances of the identical class."""
+
+        namedtuple_cache_clear()
+        first = next(namedzip(*two_iterables, typename="Pair", field_names="a b"))
+        second = next(
+            namedzip_longest(*two_iterables, typename="Pair", field_names=["a", "b"])
+        )
+        assert type(first) is type(second)
+        info = namedtuple_cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+    @pytest.mark.skipif(
+        sys.version_info < (3, 6), reason="namedtuple module requires Python 3.6."
+    )
+    def test_namedzip_cached_class_pickles(self, two_iterables):
+        """Rows of a cached class with an importable module can be pickled."""
+
+        pair = next(
+            namedzip(
+                *two_iterables,
+                typename="Pair",
+                field_names=["letter", "number"],
+                module=__name__
+            )
+        )
+        globals()["Pair"] = type(pair)
+        try:
+            assert pickle.loads(pickle.dumps(pair)) == pair
+        finally:
+            del globals()["Pair"]
+
+    def test_namedzip_rows_copy_after_clear(self, two_iterables):
+        """Rows copy and unpickle to their own class after a cache clear."""
+
+        row = next(namedzip(*two_iterables, typename="Pair", field_names="a b"))
+        namedtuple_cache_clear()
+        assert type(copy.copy(row)) is type(row)
+        assert type(copy.deepcopy(row)) is type(row)
+        assert type(pickle.loads(pickle.dumps(row))) is type(row)
+        zipper = namedzip(typename="Pair", field_names="a b")
+        assert zipper.named_tuple is type(row)
+
+    def test_namedzip_rows_pickle_after_eviction(self, two_iterables, monkeypatch):
+        """Rows unpickle to their own class after it has been evicted."""
+
+        monkeypatch.setattr(_namedtuple_cache, "maxsize", 1)
+        row = next(namedzip(*two_iterables, typename="Pair", field_names="a b"))
+        namedzip(typename="Other", field_names="a b")  # Evicts "Pair".
+        assert len(_namedtuple_cache._classes) == 1
+        restored = pickle.loads(pickle.dumps(row))
+        assert type(restored) is type(row)
+        assert restored == row
+
+    def test_namedtuple_cache_clear_public(self):
+        """`namedtuple_cache_clear` empties the shared cache."""
+
+        namedzip(typename="Pair", field_names=["letter", "number"])
+        namedtuple_cache_clear()
+        assert namedtuple_cache_info().currsize == 0
+        assert len(_namedtuple_cache._classes) == 0
+
+
+class TestPushdownUnit:
+    """Collection of tests for `select` and `where` helper functions."""
+
+    def test__check_pushdown_indices(self):
+        """Selected names map to field indices in the given order."""
+
+        indices, predicates = _check_pushdown(("a", "b", "c"), ["c", "a"], None)
+        assert indices == (2, 0)
+        assert predicates == []
+
+    def test__check_pushdown_single_name(self):
+        """A single field name string selects one field."""
+
+        assert _check_pushdown(("a", "b"), "b", None)[0] == (1,)
+
+    def test__check_pushdown_predicates(self):
+        """Predicates are paired with the index of their field."""
+
+        _, predicates = _check_pushdown(("a", "b"), None, {"b": bool})
+        assert predicates == [(1, bool)]
+
+    @pytest.mark.parametrize(
+        "select, where", [(["a", "x"], None), (None, {"x": bool}), ([], None)]
+    )
+    def test__check_pushdown_invalid(self, select, where):
+        """Unknown field names and empty selections raise ValueError."""
+
+        with pytest.raises(ValueError):
+            _check_pushdown(("a", "b"), select, where)
+
+    def test__probe_columns(self):
+        """Selectors are true where all predicates hold."""
+
+        iterables, selectors = _probe_columns(
+            ([1, 0, 1, 1], "abcd"), [(0, bool), (1, lambda c: c != "d")]
+        )
+        assert list(selectors) == [True, False, True, False]
+        assert [list(it) for it in iterables] == [[1, 0, 1, 1], list("abcd")]
+
+    def test__probe_columns_fills(self):
+        """Probes continue with fill values for longest zipping."""
+
+        _, selectors = _probe_columns(([1],), [(0, bool)], fills=(0,))
+        assert [next(selectors) for _ in range(3)] == [True, False, False]
+
+    def test__pushdown(self):
+        """Tuples are filtered by selectors and projected to indices."""
+
+        zipped = iter([(1, "a", 0.1), (2, "b", 0.2), (3, "c", 0.3)])
+        result = _pushdown(zipped, [True, False, True], (2, 0))
+        assert list(result) == [(0.1, 1), (0.3, 3)]
+
+    def test__pushdown_single_index(self):
+        """A single index still produces tuples."""
+
+        assert list(_pushdown(iter([(1, "a"), (2, "b")]), None, (1,))) == [
+            ("a",),
+            ("b",),
+        ]
+
+
+class TestPushdownIntegration:
+    """Collection of tests for the `select` and `where` options."""
+
+    def test_namedzip_select(self, two_iterables):
+        """Rows only have the selected fields."""
+
+        letters, numbers = two_iterables
+        rows = list(
+            namedzip(
+                letters,
+                numbers,
+                [0.1, 0.2, 0.3, 0.4],
+                typename="Item",
+                field_names=["letter", "number", "price"],
+                select=["price", "letter"],
+            )
+        )
+        assert rows[0]._fields == ("price", "letter")
+        assert rows == [(0.1, "A"), (0.2, "B"), (0.3, "C"), (0.4, "D")]
+
+    def test_namedzip_select_single_name(self):
+        """A single field name can be selected as a string."""
+
+        zipper = namedzip(typename="Row", field_names=["price", "qty"], select="price")
+        assert list(zipper([1, 2], [3, 4])) == [(1,), (2,)]
+        restored = pickle.loads(pickle.dumps(zipper))
+        assert list(restored([5], [6])) == [(5,)]
+
+    def test_namedzip_select_keeps_shortest(self):
+        """Unselected iterables still limit the number of rows."""
+
+        rows = namedzip(
+            "abc", [1], typename="Pair", field_names=["a", "b"], select=["a"]
+        )
+        assert list(rows) == [("a",)]
+
+    def test_namedzip_select_all_fields(self, two_iterables):
+        """Selecting all fields in order generates the full rows."""
+
+        rows = namedzip(
+            *two_iterables, typename="Pair", field_names=["a", "b"], select=["a", "b"]
+        )
+        assert list(rows) == list(zip(*two_iterables))
+
+    def test_namedzip_where(self, two_iterables):
+        """Only rows passing all predicates are generated."""
+
+        rows = namedzip(
+            *two_iterables,
+            typename="Pair",
+            field_names=["letter", "number"],
+            where={"number": lambda n: n % 2 == 0, "letter": lambda c: c != "D"}
+        )
+        assert list(rows) == [("B", 2)]
+
+    def test_namedzip_where_unselected_field(self, two_iterables):
+        """Predicates can test fields that are not selected."""
+
+        rows = namedzip(
+            *two_iterables,
+            typename="Pair",
+            field_names=["letter", "number"],
+            select=["letter"],
+            where={"number": lambda n: n > 2}
+        )
+        assert [row.letter for row in rows] == ["C", "D"]
+
+    def test_namedzip_where_raw_values(self):
+        """Predicates see raw values, one call per row."""
+
+        seen = []
+
+        def predicate(value):
+            seen.append(value)
+            return True
+
+        rows = namedzip(
+            "abc",
+            [1, 2],
+            typename="Pair",
+            field_names=["a", "b"],
+            where={"a": predicate},
+        )
+        assert list(rows) == [("a", 1), ("b", 2)]
+        assert seen[:2] == ["a", "b"]
+
+    def test_namedzip_longest_where_fill_values(self):
+        """Predicates also test fill values."""
+
+        rows = namedzip_longest(
+            [1, 2, 3],
+            [10],
+            typename="Pair",
+            field_names=["a", "b"],
+            defaults=(0, 0),
+            where={"b": bool},
+            select=["a"],
+        )
+        assert list(rows) == [(1,)]
+
+    def test_namedzip_longest_select(self):
+        """Selected fields keep their fill values."""
+
+        rows = namedzip_longest(
+            [1, 2],
+            [10],
+            typename="Pair",
+            field_names=["a", "b"],
+            fillvalue=-1,
+            select=["b"],
+        )
+        assert list(rows) == [(10,), (-1,)]
+
+    @pytest.mark.parametrize("option", [{"row_type": "slots"}, {"reuse": True}])
+    def test_namedzip_pushdown_row_options(self, two_iterables, option):
+        """Projected rows can be built as other row types."""
+
+        rows = namedzip(
+            *two_iterables,
+            typename="Pair",
+            field_names=["letter", "number"],
+            select=["number"],
+            where={"letter": lambda c: c in "AC"},
+            **option
+        )
+        assert [(row.number, row._fields) for row in rows] == [
+            (1, ("number",)),
+            (3, ("number",)),
+        ]
+
+    @pytest.mark.parametrize(
+        "option", [{"as_view": True}, {"backend": "numpy"}, {"row_type": "view"}]
+    )
+    def test_namedzip_pushdown_conflicting_options(self, option):
+        """`select` and `where` can't be combined with some options."""
+
+        with pytest.raises(ValueError):
+            namedzip(typename="Pair", field_names=["a", "b"], select=["a"], **option)
+        with pytest.raises(ValueError):
+            namedzip_longest(
+                typename="Pair", field_names=["a", "b"], where={"a": bool}, **option
+            )
+
+
+@pytest.mark.skipif(_speedups is None, reason="C extension is not built.")
+class TestZipRowsUnit:
+    """Collection of tests for the C accelerator `namedzip._namedzip.zip_rows`."""
+
+    def test_zip_rows_shortest(self, two_iterables):
+        """Stops at the shortest iterable, like `zip`."""
+
+        Pair = namedtuple("Pair", ["letter", "number"])
+        rows = list(_speedups.zip_rows(Pair, (two_iterables[0], [1, 2])))
+        assert rows == [("A", 1), ("B", 2)]
+        assert type(rows[0]) is Pair
+        assert rows[1].number == 2
+
+    def test_zip_rows_fills(self):
+        """Continues with individual fills to the longest iterable."""
+
+        Pair = namedtuple("Pair", ["letter", "number"])
+        rows = _speedups.zip_rows(Pair, ("ABC", [1]), fills=("-", 0))
+        assert list(rows) == [("A", 1), ("B", 0), ("C", 0)]
+
+    def test_zip_rows_empty(self):
+        """No iterables or only empty ones generate no rows."""
+
+        Pair = namedtuple("Pair", ["letter", "number"])
+        assert list(_speedups.zip_rows(Pair, ())) == []
+        assert list(_speedups.zip_rows(Pair, ([], []), fills=(0, 0))) == []
+
+    def test_zip_rows_stays_exhausted(self):
+        """Exhausted iterators aren't advanced again."""
+
+        Pair = namedtuple("Pair", ["letter", "number"])
+        letters = iter("AB")
+        rows = _speedups.zip_rows(Pair, (letters, [1]))
+        assert list(rows) == [("A", 1)]
+        assert next(rows, None) is None
+        assert list(letters) == []
+
+    def test_zip_rows_propagates_errors(self):
+        """Exceptions raised by iterables are propagated."""
+
+        def failing():
+            yield "A"
+            raise KeyError("failing")
+
+        Pair = namedtuple("Pair", ["letter", "number"])
+        rows = _speedups.zip_rows(Pair, (failing(), [1, 2]), fills=(None, None))
+        assert next(rows) == ("A", 1)
+        with pytest.raises(KeyError):
+            next(rows)
+
+    @pytest.mark.parametrize(
+        "args, kwargs, error",
+        [
+            ((tuple, ["A"]), {"fills": (1, 2)}, ValueError),
+            ((list, ["A"]), {}, TypeError),
+            ((tuple, [1]), {}, TypeError),
+        ],
+    )
+    def test_zip_rows_invalid(self, args, kwargs, error):
+        """Invalid row types, fills or iterables raise errors."""
+
+        with pytest.raises(error):
+            _speedups.zip_rows(*args, **kwargs)
+
+    def test_namedzip_uses_zip_rows(self, two_iterables, implementation):
+        """`namedzip` uses the accelerator for plain named tuple rows."""
+
+        rows = namedzip(*two_iterables, typename="Pair", field_names=["a", "b"])
+        assert isinstance(rows, _speedups.zip_rows) == (implementation == "c")
+
+
+def double(value):
+    """Module level predicate, so `where` options can be pickled."""
+    return value * 2
+
+
+class TestNamedZipper:
+    """Collection of tests for `namedzip.namedzip.NamedZipper`."""
+
+    def test_call_matches_namedzip(self):
+        """Calling a NamedZipper is the same as calling `namedzip`."""
+        zipper = NamedZipper("Pair", "letter number")
+        assert list(zipper("ab", [1, 2, 3])) == list(
+            namedzip("ab", [1, 2, 3], typename="Pair", field_names="letter number")
+        )
+
+    def test_call_matches_namedzip_longest(self):
+        """With longest=True, fill options behave like `namedzip_longest`."""
+        zipper = NamedZipper("Pair", "letter number", longest=True, defaults="?0")
+        assert list(zipper("ab", [1])) == [("a", 1), ("b", "0")]
+
+    def test_named_tuple(self):
+        """The named tuple class comes from the shared cache."""
+        zipper = NamedZipper("Pair", ["letter", "number"])
+        (row,) = zipper("a", [1])
+        assert type(row) is zipper.named_tuple
+        assert zipper.named_tuple is NamedZipper("Pair", "letter, number").named_tuple
+
+    def test_one_shot_field_names(self):
+        """Field names from one-shot iterables are kept for pickling."""
+        zipper = NamedZipper("Pair", iter(["letter", "number"]))
+        assert pickle.loads(pickle.dumps(zipper)).named_tuple._fields == (
+            "letter",
+            "number",
+        )
+
+    @pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+    def test_pickle(self, protocol):
+        """Pickled zippers keep their options and share the cached class."""
+        zipper = namedzip_longest(
+            typename="Pair",
+            field_names="letter number",
+            fillvalue=0,
+            row_type="slots",
+            where={"number": double},
+        )
+        restored = pickle.loads(pickle.dumps(zipper, protocol))
+        assert isinstance(restored, NamedZipper)
+        assert restored.named_tuple is zipper.named_tuple
+        assert restored.longest
+        rows = [(row.letter, row.number) for row in restored("abc", [1, 2])]
+        assert rows == [("a", 1), ("b", 2)]
+
+    def test_pickle_one_shot_options(self):
+        """defaults and select given as one-shot iterables are pickled."""
+        zipper = namedzip_longest(
+            typename="Row",
+            field_names="a b c",
+            defaults=iter((0, 1, 2)),
+            select=(name for name in ("c", "a")),
+        )
+        restored = pickle.loads(pickle.dumps(zipper))
+        rows = [tuple(row) for row in restored([1], [], "xy")]
+        assert rows == [("x", 1), ("y", 0)]
+        assert rows == [tuple(row) for row in zipper([1], [], "xy")]
+
+    def test_pickle_typed_defaults(self):
+        """Defaults are pickled before conversion by types."""
+        zipper = namedzip_longest(
+            typename="Row", field_names="a b", defaults=("7", None), types={"a": int}
+        )
+        restored = pickle.loads(pickle.dumps(zipper))
+        assert list(restored([], "x")) == [(7, "x")]
+
+    def test_pickle_namedtuple_kwargs(self):
+        """Keyword arguments for `collections.namedtuple` are kept."""
+        zipper = namedzip(typename="Pair", field_names="a def", rename=True)
+        restored = pickle.loads(pickle.dumps(zipper))
+        assert restored.named_tuple._fields == ("a", "_1")
+
+    def test_pickle_unpicklable_option(self):
+        """Options which can't be pickled make pickling fail."""
+        zipper = namedzip(typename="Pair", field_names="a b", where={"a": lambda v: v})
+        with pytest.raises((pickle.PicklingError, AttributeError, TypeError)):
+            pickle.dumps(zipper)
+
+    def test_map_chunks(self):
+        """map_chunks generates a list of rows for every chunk."""
+        zipper = namedzip(typename="Pair", field_names="letter number")
+        chunks = [("ab", [1, 2]), ("c", [3])]
+        assert list(zipper.map_chunks(chunks)) == [
+            [("a", 1), ("b", 2)],
+            [("c", 3)],
+        ]
+
+    def test_slots(self):
+        """Instances have no `__dict__`."""
+        zipper = NamedZipper("Pair", "a b")
+        with pytest.raises(AttributeError):
+            zipper.extra = 1
+
+    def test_repr(self):
+        """The repr shows type name, fields and mode."""
+        assert repr(NamedZipper("Pair", "a b", longest=True)) == (
+            "NamedZipper('Pair', ('a', 'b'), longest=True)"
+        )
+
+    def test_invalid_options(self):
+        """Invalid options raise ValueError when the zipper is created."""
+        with pytest.raises(ValueError):
+            NamedZipper("Pair", "a b", reuse=True, row_type="slots")
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""Tests for the namedzip._numpy_backend module.
+
+copyright: © 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+from array import array
+from collections.abc import Iterator
+
+import pytest
+
+from namedzip import namedzip, namedzip_longest
+from namedzip._numpy_backend import is_ndarray, records
+
+np = pytest.importorskip("numpy")
+
+
+class TestRecordsUnit:
+    """Collection of tests for `namedzip._numpy_backend.records`."""
+
+    def test_records_fields(self):
+        """Returns a record array with one field per iterable."""
+        recs = records((np.arange(3), np.array([0.5, 1.5, 2.5])), ("a", "b"))
+        assert isinstance(recs, np.recarray)
+        assert recs.dtype.names == ("a", "b")
+        assert recs.a.tolist() == [0, 1, 2]
+        assert recs[1].b == 1.5
+
+    def test_records_shortest(self):
+        """Columns are truncated to the shortest iterable."""
+        recs = records((np.arange(5), [10, 20]), ("a", "b"))
+        assert recs.a.tolist() == [0, 1]
+        assert recs.b.tolist() == [10, 20]
+
+    def test_records_longest(self):
+        """Short columns are padded with their fill value."""
+        recs = records(
+            (np.arange(3), np.array([1.5]), ["x"]),
+            ("a", "b", "c"),
+            longest=True,
+            fills=(-1, 0.0, "?"),
+        )
+        assert recs.a.tolist() == [0, 1, 2]
+        assert recs.b.tolist() == [1.5, 0.0, 0.0]
+        assert recs.c.tolist() == ["x", "?", "?"]
+
+    @pytest.mark.parametrize(
+        "dtype, fill, expected",
+        [
+            ("f4", 0.0, "f4"),
+            ("f4", None, "f4"),
+            ("i4", -1, "i4"),
+            ("u1", 255, "u1"),
+            ("i4", None, "f8"),
+            ("i4", 0.5, "f8"),
+            ("i4", 2**40, "i8"),
+            ("f4", 1e300, "f8"),
+        ],
+    )
+    def test_records_longest_keeps_dtype(self, dtype, fill, expected):
+        """Padding keeps the column data type unless the fill doesn't fit."""
+        recs = records(
+            (np.arange(3), np.arange(1, dtype=dtype)),
+            ("a", "b"),
+            longest=True,
+            fills=(0, fill),
+        )
+        assert recs.b.dtype == np.dtype(expected)
+        assert recs.b[0] == 0
+        if fill is None:
+            assert np.isnan(recs.b[1:]).all()
+        else:
+            assert (recs.b[1:] == fill).all()
+
+    def test_records_longest_none_fill_strings(self):
+        """None pads non-numeric columns as before, in an object array."""
+        recs = records((np.arange(2), ["x"]), ("a", "b"), longest=True, fills=(0, None))
+        assert recs.b.tolist() == ["x", None]
+
+    def test_records_buffer_and_iterables(self):
+        """Buffers and plain iterables are accepted."""
+        recs = records((array("d", [1.0, 2.0]), (x for x in "AB")), ("a", "b"))
+        assert recs.a.dtype == np.float64
+        assert recs.b.tolist() == ["A", "B"]
+
+    def test_records_not_one_dimensional(self):
+        """ValueError is raised for multi-dimensional arrays."""
+        with pytest.raises(ValueError):
+            records((np.zeros((2, 2)), np.arange(2)), ("a", "b"))
+
+    def test_is_ndarray(self):
+        """Only NumPy arrays are detected."""
+        assert is_ndarray(np.arange(2))
+        assert not is_ndarray([0, 1])
+
+
+class TestNumpyBackend:
+    """Tests for the `backend` option of `namedzip` and `namedzip_longest`."""
+
+    def test_namedzip_backend_numpy(self):
+        """`backend="numpy"` returns a record array."""
+        recs = namedzip(
+            [1, 2, 3], "ABC", typename="Pair", field_names=["n", "s"], backend="numpy"
+        )
+        assert isinstance(recs, np.recarray)
+        assert recs.n.tolist() == [1, 2, 3]
+
+    def test_namedzip_backend_numpy_factory(self):
+        """The numpy backend keeps the factory calling contract."""
+        zip_pairs = namedzip(typename="Pair", field_names=["n", "s"], backend="numpy")
+        assert isinstance(zip_pairs(np.arange(2), np.arange(2)), np.recarray)
+
+    def test_namedzip_backend_auto(self):
+        """`backend="auto"` only selects numpy for NumPy array inputs."""
+        zip_pairs = namedzip(typename="Pair", field_names=["a", "b"], backend="auto")
+        assert isinstance(zip_pairs(np.arange(2), np.arange(2)), np.recarray)
+        assert isinstance(zip_pairs(np.arange(2), [0, 1]), Iterator)
+
+    def test_namedzip_longest_backend_numpy_defaults(self):
+        """`defaults` fill missing values with the numpy backend."""
+        recs = namedzip_longest(
+            np.arange(3),
+            np.arange(1),
+            typename="Pair",
+            field_names=["a", "b"],
+            defaults=(-1, -2),
+            backend="numpy",
+        )
+        assert recs.b.tolist() == [0, -2, -2]
+
+    def test_namedzip_longest_backend_numpy_fillvalue(self):
+        """`fillvalue` fills missing values with the numpy backend."""
+        recs = namedzip_longest(
+            np.arange(1.0, 3.0),
+            np.arange(1.0, 2.0),
+            typename="Pair",
+            field_names=["a", "b"],
+            fillvalue=0.0,
+            backend="numpy",
+        )
+        assert recs.b.tolist() == [1.0, 0.0]
+
+    @pytest.mark.parametrize("backend", ["numpy", "auto"])
+    @pytest.mark.parametrize(
+        "option",
+        [{"row_type": "slots"}, {"row_type": "view"}, {"reuse": True}, {"prefetch": 4}],
+    )
+    def test_conflicting_options(self, backend, option):
+        """Other backends can't be combined with row options or prefetch."""
+        with pytest.raises(ValueError, match="backend can't be combined"):
+            namedzip(typename="Pair", field_names="a b", backend=backend, **option)
+        with pytest.raises(ValueError, match="backend can't be combined"):
+            namedzip_longest(
+                typename="Pair", field_names="a b", backend=backend, **option
+            )
+
+    def test_namedzip_backend_invalid(self):
+        """ValueError is raised for unsupported backends."""
+        with pytest.raises(ValueError):
+            namedzip(typename="Pair", field_names=["a", "b"], backend="cuda")
+        with pytest.raises(ValueError):
+            namedzip_longest(typename="Pair", field_names=["a", "b"], backend="")
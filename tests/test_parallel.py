@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""Tests for the namedzip._parallel module.
+
+copyright: © 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+import pickle
+import types
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from namedzip import namedzip, namedzip_parallel
+from namedzip._parallel import _build_chunk
+from namedzip.namedzip import _cache_key
+
+
+def total(row):
+    """Module level transform, picklable for worker processes."""
+    return row.a + row.b
+
+
+def identity(row):
+    """Module level transform returning the row itself."""
+    return row
+
+
+class TestBuildChunkUnit:
+    """Collection of tests for `namedzip._parallel._build_chunk`."""
+
+    def test__build_chunk_rows(self):
+        """Builds named tuples from the cache key."""
+        key = _cache_key("Pair", ["a", "b"], {})
+        rows = _build_chunk(key, None, [(1, 2), (3, 4)])
+        assert rows == [(1, 2), (3, 4)]
+        assert rows[0]._fields == ("a", "b")
+
+    def test__build_chunk_func(self):
+        """Applies `func` to every named tuple."""
+        key = _cache_key("Pair", ["a", "b"], {})
+        assert _build_chunk(key, total, [(1, 2), (3, 4)]) == [3, 7]
+
+
+class TestNamedzipParallel:
+    """Collection of tests for `namedzip._parallel.namedzip_parallel`."""
+
+    def test_namedzip_parallel_generator_type(self):
+        """`namedzip_parallel` returns a generator when called with positional args."""
+        results = namedzip_parallel(
+            [1], [2], typename="Pair", field_names=["a", "b"], workers=1
+        )
+        assert isinstance(results, types.GeneratorType)
+        results.close()
+
+    def test_namedzip_parallel_factory_type(self):
+        """`namedzip_parallel` returns a function without positional args."""
+        zip_pairs = namedzip_parallel(typename="Pair", field_names=["a", "b"])
+        assert isinstance(zip_pairs, types.FunctionType)
+
+    def test_namedzip_parallel_func_ordered(self):
+        """Results of `func` are generated in input order."""
+        results = namedzip_parallel(
+            range(1000),
+            range(0, 2000, 2),
+            typename="Pair",
+            field_names=["a", "b"],
+            func=total,
+            workers=2,
+            chunksize=7,
+        )
+        assert list(results) == [3 * i for i in range(1000)]
+
+    def test_namedzip_parallel_rows_pickled_back(self):
+        """Named tuples returned by workers are instances of the cached class."""
+        rows = list(
+            namedzip_parallel(
+                "ABC",
+                range(3),
+                typename="Pair",
+                field_names=["a", "b"],
+                func=identity,
+                workers=2,
+                chunksize=2,
+            )
+        )
+        expected = list(namedzip("ABC", range(3), typename="Pair", field_names="a b"))
+        assert rows == expected
+        assert type(rows[0]) is type(expected[0])
+
+    def test_namedzip_parallel_longest_defaults(self):
+        """`longest` applies `defaults` like `namedzip_longest`."""
+        with ThreadPoolExecutor(2) as executor:
+            rows = namedzip_parallel(
+                "A",
+                range(3),
+                typename="Pair",
+                field_names=["a", "b"],
+                longest=True,
+                defaults=("X", 99),
+                executor=executor,
+            )
+            assert list(rows) == [("A", 0), ("X", 1), ("X", 2)]
+
+    def test_namedzip_parallel_executor_not_shut_down(self):
+        """A supplied executor is left running."""
+        with ProcessPoolExecutor(1) as executor:
+            zip_pairs = namedzip_parallel(
+                typename="Pair", field_names=["a", "b"], func=total, executor=executor
+            )
+            assert list(zip_pairs([1], [2])) == [3]
+            assert list(zip_pairs([3], [4])) == [7]
+
+    def test_namedzip_parallel_validation(self):
+        """ValueError is raised for invalid arguments."""
+        with pytest.raises(ValueError):
+            namedzip_parallel(typename="Pair", field_names=["a", "b"], chunksize=0)
+        with pytest.raises(ValueError):
+            namedzip_parallel(typename="Pair", field_names=["a", "b"], workers=-1)
+        with pytest.raises(ValueError):
+            namedzip_parallel([1], typename="Pair", field_names=["a", "b"])
+
+
+class TestRowPickling:
+    """Tests for pickling instances of cached named tuple classes."""
+
+    def test_cached_rows_pickle_by_key(self):
+        """Rows are picklable without the class being importable."""
+        row = next(namedzip([1], [2], typename="Unimportable", field_names="a b"))
+        restored = pickle.loads(pickle.dumps(row))
+        assert restored == row
+        assert type(restored) is type(row)
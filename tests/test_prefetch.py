@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""Tests for the namedzip._prefetch module.
+
+copyright: © 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+import threading
+import time
+
+import pytest
+
+from namedzip import namedzip, namedzip_longest
+from namedzip._prefetch import Prefetcher
+
+
+def slow(values, delay):
+    """Generator yielding `values`, sleeping before each."""
+    for value in values:
+        time.sleep(delay)
+        yield value
+
+
+def failing(values):
+    """Generator raising `RuntimeError` after yielding `values`."""
+    yield from values
+    raise RuntimeError("source failed")
+
+
+class TestPrefetcherUnit:
+    """Collection of tests for `namedzip._prefetch.Prefetcher`."""
+
+    def test_prefetcher_values(self):
+        """All values are generated in order."""
+        assert list(Prefetcher(range(100), 3)) == list(range(100))
+
+    def test_prefetcher_bounded(self):
+        """No more than `size` values are read ahead."""
+        pulled = []
+
+        def source():
+            for i in range(100):
+                pulled.append(i)
+                yield i
+
+        prefetcher = Prefetcher(source(), 5)
+        time.sleep(0.05)
+        # `size` queued values plus one blocked in `put`.
+        assert len(pulled) <= 6
+        assert next(prefetcher) == 0
+        prefetcher.close()
+
+    def test_prefetcher_exception(self):
+        """Exceptions are raised after the preceding values."""
+        prefetcher = Prefetcher(failing([1, 2]), 2)
+        assert next(prefetcher) == 1
+        assert next(prefetcher) == 2
+        with pytest.raises(RuntimeError):
+            next(prefetcher)
+        with pytest.raises(StopIteration):
+            next(prefetcher)
+
+    @pytest.mark.parametrize("exc_type", [KeyboardInterrupt, SystemExit])
+    def test_prefetcher_base_exception(self, exc_type):
+        """Exceptions not derived from Exception end iteration as well."""
+
+        def source():
+            yield 1
+            raise exc_type
+
+        prefetcher = Prefetcher(source(), 2)
+        assert next(prefetcher) == 1
+        with pytest.raises(exc_type):
+            next(prefetcher)
+        prefetcher._thread.join(1)
+        assert not prefetcher._thread.is_alive()
+
+    def test_prefetcher_close(self):
+        """Closing stops the thread and closes the source."""
+        closed = threading.Event()
+
+        def source():
+            try:
+                while True:
+                    yield 1
+            finally:
+                closed.set()
+
+        prefetcher = Prefetcher(source(), 2)
+        next(prefetcher)
+        prefetcher.close()
+        prefetcher._thread.join(1)
+        assert not prefetcher._thread.is_alive()
+        assert closed.is_set()
+        with pytest.raises(StopIteration):
+            next(prefetcher)
+
+    def test_prefetcher_garbage_collected(self):
+        """Dropping an unfinished prefetcher stops its thread."""
+        prefetcher = Prefetcher(iter(int, 1), 2)  # Infinite source.
+        thread = prefetcher._thread
+        del prefetcher
+        thread.join(1)
+        assert not thread.is_alive()
+
+    def test_prefetcher_invalid(self):
+        """TypeError and ValueError are raised eagerly."""
+        with pytest.raises(TypeError):
+            Prefetcher(1, 2)
+        with pytest.raises(ValueError):
+            Prefetcher([], 0)
+
+
+class TestPrefetchOption:
+    """Tests for the `prefetch` option of `namedzip` and `namedzip_longest`."""
+
+    def test_namedzip_prefetch(self):
+        """Prefetching generates the same rows."""
+        pairs = namedzip(
+            "ABC", range(5), typename="Pair", field_names=["a", "b"], prefetch=2
+        )
+        assert list(pairs) == [("A", 0), ("B", 1), ("C", 2)]
+
+    def test_namedzip_prefetch_concurrent(self):
+        """Slow sources are read concurrently."""
+        start = time.perf_counter()
+        triples = namedzip(
+            slow(range(5), 0.02),
+            slow(range(5), 0.02),
+            slow(range(5), 0.02),
+            typename="Triple",
+            field_names=["a", "b", "c"],
+            prefetch=8,
+        )
+        assert len(list(triples)) == 5
+        assert time.perf_counter() - start < 0.25  # Sequential takes 0.3 s.
+
+    def test_namedzip_longest_prefetch_defaults(self):
+        """Prefetching applies `defaults`."""
+        pairs = namedzip_longest(
+            "A",
+            range(2),
+            typename="Pair",
+            field_names=["a", "b"],
+            defaults=("X", 99),
+            prefetch=1,
+        )
+        assert list(pairs) == [("A", 0), ("X", 1)]
+
+    def test_namedzip_prefetch_exception(self):
+        """Source exceptions propagate to the consumer."""
+        pairs = namedzip(
+            failing("AB"), range(5), typename="Pair", field_names=["a", "b"], prefetch=4
+        )
+        with pytest.raises(RuntimeError):
+            list(pairs)
+
+    def test_namedzip_prefetch_negative(self):
+        """Negative prefetch sizes raise ValueError at factory creation."""
+        with pytest.raises(ValueError, match="prefetch must not be negative"):
+            namedzip(typename="Pair", field_names=["a", "b"], prefetch=-1)
+        with pytest.raises(ValueError, match="prefetch must not be negative"):
+            namedzip_longest(typename="Pair", field_names=["a", "b"], prefetch=-1)
@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+"""Tests for the namedzip._rows module.
+
+copyright: © 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+from array import array
+from collections import namedtuple
+
+import pytest
+
+from namedzip import namedzip, namedzip_longest
+from namedzip._rows import (
+    record_class,
+    reused_rows,
+    slots_class,
+    view_class,
+    view_rows,
+)
+
+pytestmark = pytest.mark.usefixtures("implementation")
+
+
+@pytest.fixture()
+def pair_tuple():
+    """Test fixture to provide a named tuple class."""
+    return namedtuple("Pair", ["letter", "number"])
+
+
+class TestSlotsClassUnit:
+    """Collection of tests for `namedzip._rows.slots_class`."""
+
+    def test_slots_class_attributes(self, pair_tuple):
+        """Instances provide attribute access, `_fields` and no `__dict__`."""
+        pair = slots_class(pair_tuple)("A", 1)
+        assert (pair.letter, pair.number) == ("A", 1)
+        assert pair._fields == ("letter", "number")
+        assert not hasattr(pair, "__dict__")
+
+    def test_slots_class_protocols(self, pair_tuple):
+        """Instances support iteration, len, equality, repr and `_asdict`."""
+        cls = slots_class(pair_tuple)
+        pair = cls("A", 1)
+        assert tuple(pair) == ("A", 1)
+        assert len(pair) == 2
+        assert pair == cls("A", 1)
+        assert pair != cls("B", 1)
+        assert repr(pair) == "Pair(letter='A', number=1)"
+        assert pair._asdict() == {"letter": "A", "number": 1}
+
+    def test_slots_class_cached(self, pair_tuple):
+        """The same named tuple class maps to the identical slots class."""
+        assert slots_class(pair_tuple) is slots_class(pair_tuple)
+
+    def test_slots_class_self_field(self):
+        """A field named "self" doesn't clash with the instance argument."""
+        rows = namedzip(
+            "ab", [1, 2], typename="Row", field_names=["self", "x"], row_type="slots"
+        )
+        assert [(row.self, row.x) for row in rows] == [("a", 1), ("b", 2)]
+
+
+class TestViewClassUnit:
+    """Collection of tests for `namedzip._rows.view_class`."""
+
+    def test_view_class_reads_columns(self, pair_tuple):
+        """Values are read from the shared columns on attribute access."""
+        columns = (["A", "B"], [1, 2])
+        row = view_class(pair_tuple)(columns, 1)
+        assert (row.letter, row.number) == ("B", 2)
+        assert row._fields == ("letter", "number")
+        assert tuple(row) == ("B", 2)
+        columns[1][1] = 99
+        assert row.number == 99
+
+    def test_view_class_read_only(self, pair_tuple):
+        """Fields can't be assigned."""
+        row = view_class(pair_tuple)((["A"], [1]), 0)
+        with pytest.raises(AttributeError):
+            row.letter = "B"
+
+    def test_view_rows(self, pair_tuple):
+        """One row is generated per value in each batch."""
+        batches = [pair_tuple(["A", "B"], [1, 2]), pair_tuple(["C"], [3])]
+        rows = view_rows(batches, view_class(pair_tuple))
+        assert [tuple(row) for row in rows] == [("A", 1), ("B", 2), ("C", 3)]
+
+
+class TestRecordClassUnit:
+    """Collection of tests for `namedzip._rows.record_class`."""
+
+    def test_record_class_attributes(self, pair_tuple):
+        """Records read values from their list and expose `_fields`."""
+        values = ["A", 1]
+        record = record_class(pair_tuple)(values)
+        assert (record.letter, record.number) == ("A", 1)
+        assert record._fields == ("letter", "number")
+        values[0] = "B"
+        assert record.letter == "B"
+
+    def test_record_class_asnamedtuple(self, pair_tuple):
+        """`_asnamedtuple` returns an independent named tuple copy."""
+        values = ["A", 1]
+        copy = record_class(pair_tuple)(values)._asnamedtuple()
+        values[0] = "B"
+        assert copy == pair_tuple("A", 1)
+        assert type(copy) is pair_tuple
+
+    def test_reused_rows(self, pair_tuple):
+        """The identical record is generated for every row."""
+        rows = reused_rows(zip("AB", [1, 2]), record_class(pair_tuple))
+        first = next(rows)
+        assert tuple(first) == ("A", 1)
+        second = next(rows)
+        assert second is first
+        assert tuple(first) == ("B", 2)
+        assert list(rows) == []
+
+
+class TestRowTypeOption:
+    """Tests for the `row_type` option of `namedzip` and `namedzip_longest`."""
+
+    @pytest.mark.parametrize("row_type", ["namedtuple", "slots", "view"])
+    def test_namedzip_row_type(self, row_type):
+        """All row types generate the same values."""
+        rows = namedzip(
+            "ABC",
+            range(5),
+            typename="Pair",
+            field_names=["letter", "number"],
+            row_type=row_type,
+        )
+        assert [(r.letter, r.number) for r in rows] == [("A", 0), ("B", 1), ("C", 2)]
+
+    @pytest.mark.parametrize("row_type", ["namedtuple", "slots", "view"])
+    def test_namedzip_longest_row_type(self, row_type):
+        """All row types apply `defaults`."""
+        zip_pairs = namedzip_longest(
+            typename="Pair",
+            field_names=["letter", "number"],
+            defaults=("X", 99),
+            row_type=row_type,
+        )
+        rows = zip_pairs("A", range(3))
+        assert [tuple(r) for r in rows] == [("A", 0), ("X", 1), ("X", 2)]
+
+    def test_namedzip_view_typecodes(self):
+        """View rows read unboxed values from `array.array` columns."""
+        row = next(
+            namedzip(
+                "AB",
+                [1.5, 2.5],
+                typename="Pair",
+                field_names=["letter", "number"],
+                row_type="view",
+                typecodes=(None, "d"),
+            )
+        )
+        assert isinstance(row._columns.number, array)
+        assert row.number == 1.5
+
+    def test_namedzip_reuse(self):
+        """`reuse` overwrites one record in place for every row."""
+        rows = namedzip(
+            "ABC",
+            range(3),
+            typename="Pair",
+            field_names=["letter", "number"],
+            reuse=True,
+        )
+        copies = [(row.letter, row.number, id(row)) for row in rows]
+        assert [c[:2] for c in copies] == [("A", 0), ("B", 1), ("C", 2)]
+        assert len({c[2] for c in copies}) == 1
+
+    def test_namedzip_longest_reuse_defaults(self):
+        """`reuse` applies `defaults` like named tuple rows."""
+        rows = namedzip_longest(
+            "A",
+            range(2),
+            typename="Pair",
+            field_names=["letter", "number"],
+            defaults=("X", 99),
+            reuse=True,
+        )
+        assert [row._asnamedtuple() for row in rows] == [("A", 0), ("X", 1)]
+
+    def test_namedzip_row_type_invalid(self):
+        """ValueError is raised for unsupported row types and options."""
+        with pytest.raises(ValueError):
+            namedzip(typename="Pair", field_names=["a", "b"], row_type="dict")
+        with pytest.raises(ValueError):
+            namedzip(typename="Pair", field_names=["a", "b"], typecodes="q")
+        with pytest.raises(ValueError):
+            namedzip_longest(
+                typename="Pair", field_names=["a", "b"], row_type="slots", typecodes="q"
+            )
+        with pytest.raises(ValueError):
+            namedzip(
+                typename="Pair", field_names=["a", "b"], row_type="view", reuse=True
+            )
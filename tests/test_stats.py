@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+"""Tests for the namedzip._stats module.
+
+copyright: © 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+import time
+import types
+
+import pytest
+
+from namedzip import (
+    ZipStats,
+    get_default_stats,
+    namedzip,
+    namedzip_longest,
+    set_default_stats,
+)
+
+pytestmark = pytest.mark.usefixtures("implementation")
+
+
+def slow(values, delay=0.002):
+    """Generate `values`, sleeping `delay` seconds before each."""
+    for value in values:
+        time.sleep(delay)
+        yield value
+
+
+@pytest.fixture()
+def default_stats():
+    """Test fixture to install and afterwards remove a default collector."""
+    stats = ZipStats()
+    previous = set_default_stats(stats)
+    yield stats
+    set_default_stats(previous)
+
+
+class TestZipStats:
+    """Collection of tests for `namedzip._stats.ZipStats`."""
+
+    def test_namedzip_rows_and_exhaustion(self):
+        """Rows and the exhaustion point of the shortest source are recorded."""
+        stats = ZipStats()
+        rows = list(
+            namedzip("abc", [1, 2], typename="Pair", field_names="a b", stats=stats)
+        )
+        assert rows == [("a", 1), ("b", 2)]
+        assert stats.runs == 1
+        assert stats.rows == 2
+        assert stats.filled_rows == 0
+        assert stats.exhausted == {"b": 2}
+
+    def test_namedzip_longest_filled_rows(self):
+        """Rows with fill values are counted after sources run out."""
+        stats = ZipStats()
+        list(
+            namedzip_longest(
+                "abcd", [1], typename="Pair", field_names="a b", stats=stats
+            )
+        )
+        assert stats.rows == 4
+        assert stats.filled_rows == 3
+        assert stats.exhausted == {"a": 4, "b": 1}
+
+    @pytest.mark.parametrize(
+        "predicate, rows, filled",
+        [
+            (lambda a: a >= 8, [(8, -1), (9, -1)], 2),
+            (lambda a: a < 2, [(0, 0), (1, 1)], 0),
+            (lambda a: a in (1, 5), [(1, 1), (5, -1)], 1),
+        ],
+    )
+    def test_namedzip_longest_where_filled_rows(self, predicate, rows, filled):
+        """Only rows kept by where are counted as filled rows."""
+        stats = ZipStats()
+        zipped = namedzip_longest(
+            range(10),
+            range(3),
+            typename="Pair",
+            field_names="a b",
+            fillvalue=-1,
+            where={"a": predicate},
+            stats=stats,
+        )
+        assert list(zipped) == rows
+        assert stats.rows == len(rows)
+        assert stats.filled_rows == filled
+
+    def test_namedzip_longest_types_where_filled_rows(self):
+        """Sources read ahead by types don't count rows as filled early."""
+        stats = ZipStats()
+        zipped = namedzip_longest(
+            ["1", "2", "3"],
+            [1, 2, 3, 4],
+            typename="Pair",
+            field_names="a b",
+            types={"a": int},
+            where={"b": bool},
+            stats=stats,
+        )
+        assert list(zipped) == [(1, 1), (2, 2), (3, 3), (None, 4)]
+        assert stats.rows == 4
+        assert stats.filled_rows == 1
+
+    def test_namedzip_longest_defaults_filled_rows(self):
+        """Rows with `defaults` are counted as filled."""
+        stats = ZipStats()
+        list(
+            namedzip_longest(
+                "ab",
+                [1, 2, 3],
+                typename="Pair",
+                field_names="a b",
+                defaults=("-", 0),
+                stats=stats,
+            )
+        )
+        assert stats.filled_rows == 1
+
+    def test_blocked_time(self):
+        """Time waiting on each source is recorded by field name."""
+        stats = ZipStats()
+        list(
+            namedzip(
+                slow("abcde"), range(5), typename="Pair", field_names="a b", stats=stats
+            )
+        )
+        assert stats.blocked["a"] >= 0.01
+        assert stats.blocked["b"] < stats.blocked["a"]
+        assert stats.elapsed >= stats.blocked["a"]
+
+    def test_as_dict(self):
+        """Statistics are exported as a plain dict."""
+        stats = ZipStats()
+        list(namedzip("ab", [1, 2], typename="Pair", field_names="a b", stats=stats))
+        exported = stats.as_dict()
+        assert set(exported) == {
+            "runs",
+            "rows",
+            "filled_rows",
+            "elapsed",
+            "zip_time",
+            "blocked",
+            "exhausted",
+        }
+        assert exported["rows"] == 2
+        assert exported["zip_time"] <= exported["elapsed"]
+        assert set(exported["blocked"]) == {"a", "b"}
+
+    def test_accumulates_across_runs(self):
+        """Counters are added up across runs and reset to zero."""
+        stats = ZipStats()
+        zip_pairs = namedzip(typename="Pair", field_names="a b", stats=stats)
+        list(zip_pairs("ab", [1, 2]))
+        list(zip_pairs("abc", [1, 2, 3]))
+        assert stats.runs == 2
+        assert stats.rows == 5
+        stats.reset()
+        assert stats.as_dict()["rows"] == 0
+        assert stats.blocked == {}
+
+    def test_callback_per_run(self):
+        """The callback receives the statistics of each run."""
+        received = []
+        stats = ZipStats(callback=received.append)
+        zip_pairs = namedzip(typename="Pair", field_names="a b", stats=stats)
+        list(zip_pairs("ab", [1, 2]))
+        list(zip_pairs("abc", [1, 2, 3]))
+        assert [run["rows"] for run in received] == [2, 3]
+        assert all(run["runs"] == 1 for run in received)
+
+    def test_closed_iterator_recorded(self):
+        """Iterators closed before exhaustion are recorded."""
+        stats = ZipStats()
+        rows = namedzip(
+            range(10), range(10), typename="Pair", field_names="a b", stats=stats
+        )
+        next(rows)
+        rows.close()
+        assert stats.rows == 1
+        assert stats.exhausted == {}
+
+    def test_closed_iterator_blocked_time(self):
+        """Time waiting on sources is kept for iterators closed early."""
+        stats = ZipStats()
+        rows = namedzip(
+            slow(range(10), 0.01),
+            range(10),
+            typename="Pair",
+            field_names="a b",
+            stats=stats,
+        )
+        next(rows)
+        next(rows)
+        rows.close()
+        assert stats.blocked["a"] >= 0.02
+        assert stats.as_dict()["zip_time"] < stats.blocked["a"]
+
+    @pytest.mark.parametrize("option", [{"row_type": "view"}, {"reuse": True}])
+    def test_row_options(self, option):
+        """Instrumentation works with other row options."""
+        stats = ZipStats()
+        rows = namedzip_longest(
+            "abc", [1], typename="Pair", field_names="a b", stats=stats, **option
+        )
+        assert [tuple(row) for row in rows] == [("a", 1), ("b", None), ("c", None)]
+        assert stats.rows == 3
+        assert stats.filled_rows == 2
+
+    @pytest.mark.parametrize("option", [{"as_view": True}, {"backend": "numpy"}])
+    def test_conflicting_options(self, option):
+        """`stats` can't be combined with `as_view` or other backends."""
+        with pytest.raises(ValueError):
+            namedzip(typename="Pair", field_names="a b", stats=ZipStats(), **option)
+
+    def test_default_stats(self, default_stats):
+        """An installed default collector records calls without `stats`."""
+        assert get_default_stats() is default_stats
+        list(namedzip("ab", [1, 2], typename="Pair", field_names="a b"))
+        assert default_stats.rows == 2
+
+    def test_default_stats_overridden(self, default_stats):
+        """`stats` overrides the default collector."""
+        stats = ZipStats()
+        list(namedzip("ab", [1, 2], typename="Pair", field_names="a b", stats=stats))
+        assert stats.rows == 2
+        assert default_stats.rows == 0
+
+    def test_disabled_returns_plain_iterator(self):
+        """Without a collector, rows are not wrapped in a generator."""
+        assert get_default_stats() is None
+        rows = namedzip("ab", [1, 2], typename="Pair", field_names="a b")
+        assert not isinstance(rows, types.GeneratorType)
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""Tests for the namedzip._stream module.
+
+copyright: © 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+import pytest
+
+from namedzip import NamedZipStream, namedzip
+
+
+@pytest.fixture()
+def stream():
+    """Test fixture to provide an open stream of pairs."""
+    return NamedZipStream(typename="Pair", field_names=("letter", "number"))
+
+
+class TestNamedZipStream:
+    """Collection of tests for `namedzip._stream.NamedZipStream`."""
+
+    def test_push_completes_rows(self, stream):
+        """Rows are returned as soon as every field has a value."""
+        assert list(stream.push("letter", "abc")) == []
+        rows = list(stream.push("number", [1, 2]))
+        assert rows == [("a", 1), ("b", 2)]
+        assert rows[0].letter == "a"
+        assert list(stream.push("number", [3, 4])) == [("c", 3)]
+
+    def test_push_buffers_lag_only(self, stream):
+        """Only values of incomplete rows are buffered."""
+        list(stream.push("letter", "abc"))
+        list(stream.push("number", [1]))
+        assert stream.buffered == {"letter": 2, "number": 0}
+
+    def test_push_matches_namedzip(self, stream):
+        """Rows are of the same class and value as `namedzip` rows."""
+        rows = list(stream.push("letter", "ab")) + list(stream.push("number", [1, 2]))
+        expected = list(
+            namedzip("ab", [1, 2], typename="Pair", field_names=("letter", "number"))
+        )
+        assert rows == expected
+        assert type(rows[0]) is type(expected[0]) is stream.named_tuple
+
+    def test_push_accepts_iterables(self, stream):
+        """Values may be any iterable, including generators."""
+        list(stream.push("letter", (c for c in "ab")))
+        assert list(stream.push("number", range(2))) == [("a", 0), ("b", 1)]
+
+    def test_push_unknown_field(self, stream):
+        """Unknown fields raise ValueError."""
+        with pytest.raises(ValueError):
+            stream.push("symbol", "ab")
+
+    def test_push_rows(self, stream):
+        """Whole rows complete right away if no field lags behind."""
+        assert list(stream.push_rows([("a", 1), ("b", 2)])) == [("a", 1), ("b", 2)]
+        assert list(stream.push_rows([])) == []
+
+    def test_push_rows_after_lagging_field(self, stream):
+        """Whole rows are appended after buffered values."""
+        list(stream.push("letter", "a"))
+        assert list(stream.push_rows([("b", 1)])) == [("a", 1)]
+        assert stream.buffered == {"letter": 1, "number": 0}
+
+    def test_push_rows_wrong_length(self, stream):
+        """Rows without one value per field raise ValueError."""
+        with pytest.raises(ValueError):
+            stream.push_rows([("a", 1, None)])
+
+    def test_close_fills_remaining_rows(self, stream):
+        """Remaining rows are filled in with `fillvalue` on close."""
+        list(stream.push("letter", "abc"))
+        list(stream.push("number", [1]))
+        assert list(stream.close()) == [("b", None), ("c", None)]
+        assert stream.closed
+        assert list(stream.close()) == []
+
+    def test_close_defaults(self):
+        """Remaining rows are filled in with individual `defaults`."""
+        stream = NamedZipStream(
+            typename="Pair", field_names=("letter", "number"), defaults=("-", 0)
+        )
+        list(stream.push("number", [1, 2]))
+        assert list(stream.close()) == [("-", 1), ("-", 2)]
+
+    def test_close_fillvalue(self):
+        """Remaining rows are filled in with a common `fillvalue`."""
+        stream = NamedZipStream(
+            typename="Pair", field_names=("letter", "number"), fillvalue=0
+        )
+        list(stream.push("letter", "a"))
+        assert list(stream.close()) == [("a", 0)]
+
+    def test_defaults_length(self):
+        """`defaults` not matching the number of fields raise ValueError."""
+        with pytest.raises(ValueError):
+            NamedZipStream(typename="Pair", field_names=("a", "b"), defaults=(1,))
+
+    def test_push_after_close(self, stream):
+        """Pushing to a closed stream raises ValueError."""
+        stream.close()
+        with pytest.raises(ValueError):
+            stream.push("letter", "a")
+        with pytest.raises(ValueError):
+            stream.push_rows([("a", 1)])
+
+    def test_repr(self, stream):
+        """The repr shows the type name, state and buffered values."""
+        list(stream.push("letter", "a"))
+        assert repr(stream) == (
+            "<NamedZipStream of Pair rows (open), buffered={'letter': 1, 'number': 0}>"
+        )
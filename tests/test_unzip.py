@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""Tests for the namedzip._unzip module.
+
+copyright: © 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+import types
+from array import array
+from collections import namedtuple
+
+import pytest
+
+from namedzip import namedunzip, namedzip
+from namedzip._unzip import _check_dtypes, _transposed_chunks
+
+
+@pytest.fixture()
+def pairs():
+    """Test fixture to provide named tuple rows generated by `namedzip`."""
+    return list(
+        namedzip("ABCDE", range(5), typename="Pair", field_names=("letter", "number"))
+    )
+
+
+class TestUnzipHelpersUnit:
+    """Collection of tests for `namedzip._unzip` helper functions."""
+
+    def test__transposed_chunks(self):
+        """Rows are transposed a chunk at a time."""
+        chunks = _transposed_chunks(iter([(1, "a"), (2, "b"), (3, "c")]), 2, 2)
+        assert list(chunks) == [[(1, 2), ("a", "b")], [(3,), ("c",)]]
+
+    def test__transposed_chunks_row_length(self):
+        """Rows without one value per field raise ValueError."""
+        with pytest.raises(ValueError):
+            list(_transposed_chunks(iter([(1, "a"), (2,)]), 2, 10))
+
+    def test__check_dtypes(self):
+        """A single data type is used for all fields."""
+        assert _check_dtypes(None, 2) == (None, None)
+        assert _check_dtypes("f8", 2) == ("f8", "f8")
+        assert _check_dtypes(["i8", "f8"], 2) == ("i8", "f8")
+        with pytest.raises(ValueError):
+            _check_dtypes(["i8"], 2)
+
+
+class TestNamedunzip:
+    """Collection of tests for `namedzip._unzip.namedunzip`."""
+
+    def test_namedunzip_lists(self, pairs):
+        """Rows are unzipped into an instance of their own class."""
+        columns = namedunzip(pairs)
+        assert type(columns) is type(pairs[0])
+        assert columns.letter == list("ABCDE")
+        assert columns.number == [0, 1, 2, 3, 4]
+
+    def test_namedunzip_round_trip(self, pairs):
+        """`namedzip` of the unzipped columns restores the rows."""
+        columns = namedunzip(iter(pairs), chunk_size=2)
+        assert (
+            list(namedzip(*columns, typename="Pair", field_names=columns._fields))
+            == pairs
+        )
+
+    def test_namedunzip_array(self, pairs):
+        """Columns can be `array.array` objects."""
+        columns = namedunzip(
+            ((row.number, row.number / 2) for row in pairs),
+            into="array",
+            typecodes="qd",
+            field_names=("number", "half"),
+        )
+        assert columns.number == array("q", range(5))
+        assert columns.half[-1] == 2.0
+
+    def test_namedunzip_array_requires_typecodes(self, pairs):
+        """`into="array"` without `typecodes` raises ValueError."""
+        with pytest.raises(ValueError):
+            namedunzip(pairs, into="array")
+
+    def test_namedunzip_numpy(self, pairs):
+        """Columns can be NumPy arrays joined from chunks."""
+        np = pytest.importorskip("numpy")
+        columns = namedunzip(pairs, into="numpy", dtypes=["U1", "i8"], chunk_size=2)
+        assert isinstance(columns.number, np.ndarray)
+        assert columns.number.dtype == np.int64
+        assert columns.number.tolist() == [0, 1, 2, 3, 4]
+        assert columns.letter.tolist() == list("ABCDE")
+
+    def test_namedunzip_numpy_empty(self):
+        """Empty rows produce empty arrays."""
+        pytest.importorskip("numpy")
+        columns = namedunzip([], into="numpy", field_names=("a", "b"), dtypes="f8")
+        assert len(columns.a) == 0
+        assert columns.a.dtype.name == "float64"
+
+    def test_namedunzip_chunked(self, pairs):
+        """Chunked mode generates a named tuple of columns per chunk."""
+        chunks = namedunzip(iter(pairs), chunked=True, chunk_size=2)
+        assert isinstance(chunks, types.GeneratorType)
+        chunks = list(chunks)
+        assert [chunk.number for chunk in chunks] == [[0, 1], [2, 3], [4]]
+        assert chunks[0]._fields == ("letter", "number")
+
+    def test_namedunzip_chunked_array(self, pairs):
+        """Chunks are converted to the requested column type."""
+        chunks = namedunzip(
+            (row[1:] for row in pairs),
+            into="array",
+            typecodes="q",
+            field_names=["number"],
+            chunked=True,
+            chunk_size=3,
+        )
+        assert [chunk.number for chunk in chunks] == [
+            array("q", [0, 1, 2]),
+            array("q", [3, 4]),
+        ]
+
+    def test_namedunzip_plain_tuples(self):
+        """Plain tuples can be unzipped with `field_names`."""
+        columns = namedunzip([(1, "a"), (2, "b")], field_names=("id", "name"))
+        assert type(columns).__name__ == "tuple"
+        assert columns.name == ["a", "b"]
+
+    def test_namedunzip_typename(self, pairs):
+        """`typename` names the returned named tuple class."""
+        assert type(namedunzip(pairs, typename="Columns")).__name__ == "Columns"
+
+    def test_namedunzip_other_row_types(self):
+        """Rows with `_fields`, like slots rows, can be unzipped."""
+        rows = namedzip(
+            "AB", [1, 2], typename="Pair", field_names="a b", row_type="slots"
+        )
+        assert namedunzip(rows, typename="Pair") == (["A", "B"], [1, 2])
+
+    def test_namedunzip_empty_with_field_names(self):
+        """Empty rows produce empty columns if `field_names` are given."""
+        Columns = namedtuple("Columns", ["a", "b"])
+        assert namedunzip([], field_names=("a", "b")) == Columns([], [])
+
+    @pytest.mark.parametrize(
+        "rows, kwargs",
+        [
+            ([], {}),
+            ([(1, 2)], {}),
+            ([(1, 2)], {"field_names": "a b", "into": "dict"}),
+            ([(1, 2)], {"field_names": "a b", "chunk_size": 0}),
+            ([(1, 2)], {"field_names": "a b", "into": "array", "typecodes": "qqq"}),
+        ],
+    )
+    def test_namedunzip_invalid(self, rows, kwargs):
+        """Missing field names and invalid options raise ValueError."""
+        with pytest.raises(ValueError):
+            namedunzip(rows, **kwargs)
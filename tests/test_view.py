@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""Tests for the namedzip._view module.
+
+copyright: © 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+from collections import namedtuple
+
+import pytest
+
+from namedzip import NamedZipView, namedzip, namedzip_longest
+
+
+@pytest.fixture()
+def pair_tuple():
+    """Test fixture to provide a named tuple class."""
+    return namedtuple("Pair", ["letter", "number"])
+
+
+class TestNamedZipViewUnit:
+    """Collection of tests for `namedzip._view.NamedZipView`."""
+
+    def test_len_follows_shortest_sequence(self, pair_tuple):
+        """Length is that of the shortest sequence without fills."""
+        view = NamedZipView(("abc", [1, 2]), pair_tuple)
+        assert len(view) == 2
+
+    def test_len_follows_longest_sequence_with_fills(self, pair_tuple):
+        """Length is that of the longest sequence with fills."""
+        view = NamedZipView(("abc", [1, 2]), pair_tuple, ("-", 0))
+        assert len(view) == 3
+
+    def test_indexing(self, pair_tuple):
+        """Integer indices, including negative ones, build named tuples."""
+        view = NamedZipView(("abc", [1, 2, 3]), pair_tuple)
+        assert view[0] == pair_tuple("a", 1)
+        assert view[-1] == pair_tuple("c", 3)
+        assert type(view[1]) is pair_tuple
+
+    def test_index_out_of_range(self, pair_tuple):
+        """Indices beyond the length raise IndexError."""
+        view = NamedZipView(("abc", [1, 2]), pair_tuple)
+        with pytest.raises(IndexError):
+            view[2]
+
+    def test_fills_on_access(self, pair_tuple):
+        """Missing values are filled in on indexing and iteration."""
+        view = NamedZipView(("abc", [1]), pair_tuple, ("-", 0))
+        assert view[2] == pair_tuple("c", 0)
+        assert list(view) == [
+            pair_tuple("a", 1),
+            pair_tuple("b", 0),
+            pair_tuple("c", 0),
+        ]
+
+    def test_slices_are_views(self, pair_tuple):
+        """Slices, including nested and reversed ones, are views."""
+        view = NamedZipView(("abcdef", range(6)), pair_tuple)
+        sliced = view[1::2]
+        assert isinstance(sliced, NamedZipView)
+        assert list(sliced) == [
+            pair_tuple("b", 1),
+            pair_tuple("d", 3),
+            pair_tuple("f", 5),
+        ]
+        assert sliced[-1] == pair_tuple("f", 5)
+        assert list(sliced[::-1][:2]) == [pair_tuple("f", 5), pair_tuple("d", 3)]
+
+    def test_reiteration(self, pair_tuple):
+        """Views can be iterated more than once."""
+        view = NamedZipView(("ab", [1, 2]), pair_tuple)
+        assert list(view) == list(view) == [pair_tuple("a", 1), pair_tuple("b", 2)]
+
+    def test_reflects_sequence_changes(self, pair_tuple):
+        """Views read the current state of the sequences."""
+        numbers = [1, 2]
+        view = NamedZipView(("abc", numbers), pair_tuple)
+        numbers.append(3)
+        assert len(view) == 3
+        assert view[2] == pair_tuple("c", 3)
+
+    def test_sequence_methods(self, pair_tuple):
+        """Mixin methods of `collections.abc.Sequence` are supported."""
+        view = NamedZipView(("ab", [1, 2]), pair_tuple)
+        assert pair_tuple("b", 2) in view
+        assert view.index(pair_tuple("b", 2)) == 1
+        assert list(reversed(view)) == [pair_tuple("b", 2), pair_tuple("a", 1)]
+
+    @pytest.mark.parametrize("source", [iter("ab"), {"a": 1, "b": 2}, {1, 2}])
+    def test_requires_sequences(self, pair_tuple, source):
+        """Iterators, mappings and sets are rejected."""
+        with pytest.raises(TypeError):
+            NamedZipView(("ab", source), pair_tuple)
+
+    def test_repr(self, pair_tuple):
+        """The repr shows the length and type name."""
+        view = NamedZipView(("ab", [1, 2]), pair_tuple)
+        assert repr(view) == "<NamedZipView of 2 Pair rows>"
+
+
+class TestAsViewOption:
+    """Collection of tests for the `as_view` option of `namedzip` functions."""
+
+    def test_namedzip(self):
+        """`namedzip` returns a view matching its iterator rows."""
+        view = namedzip(
+            "abc",
+            [1, 2, 3],
+            typename="Pair",
+            field_names=("letter", "number"),
+            as_view=True,
+        )
+        assert isinstance(view, NamedZipView)
+        assert len(view) == 3
+        assert view[1].letter == "b"
+        assert list(view) == list(
+            namedzip(
+                "abc", [1, 2, 3], typename="Pair", field_names=("letter", "number")
+            )
+        )
+
+    def test_namedzip_longest_defaults(self):
+        """`namedzip_longest` returns a view filled with `defaults`."""
+        view = namedzip_longest(
+            "abc",
+            [1],
+            typename="Pair",
+            field_names=("letter", "number"),
+            defaults=("-", 0),
+            as_view=True,
+        )
+        assert len(view) == 3
+        assert view[-1] == ("c", 0)
+
+    def test_factory(self):
+        """Factory functions return views."""
+        factory = namedzip(
+            typename="Pair", field_names=("letter", "number"), as_view=True
+        )
+        assert len(factory("ab", [1, 2])) == 2
+
+    @pytest.mark.parametrize(
+        "option",
+        [
+            {"backend": "numpy"},
+            {"row_type": "slots"},
+            {"reuse": True},
+            {"prefetch": 4},
+        ],
+    )
+    def test_conflicting_options(self, option):
+        """`as_view` can't be combined with other row options."""
+        with pytest.raises(ValueError):
+            namedzip(
+                typename="Pair",
+                field_names=("letter", "number"),
+                as_view=True,
+                **option
+            )
+        with pytest.raises(ValueError):
+            namedzip_longest(
+                typename="Pair",
+                field_names=("letter", "number"),
+                as_view=True,
+                **option
+            )